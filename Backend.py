@@ -0,0 +1,310 @@
+from Matrix import Matrix
+from BitMatrix import BitMatrix, packed_rref
+
+from abc import ABC, abstractmethod
+import json
+import os
+import random
+import time
+
+class GF2Backend(ABC):
+    """
+    Class to represent a backend for the operations over binary matrices (over the F2 field).
+
+    All the backends take and return `BitMatrix` instances, so they can be exchanged
+    without changing the algorithms that use them; each one converts the matrices to its
+    own representation. The operations are:
+        - multiply(A, B): the product A·B modulo 2.
+        - rref(A): the reduced row echelon form of A, and its pivot columns.
+
+    >>> GF2Backend()  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+        ...
+    TypeError: Can't instantiate abstract class GF2Backend
+    """
+    name: str = None
+
+    def available(self) -> bool:
+        """
+        Returns whether the backend can be used (its dependencies are installed).
+        """
+        return True
+
+    @abstractmethod
+    def multiply(self, A: BitMatrix, B: BitMatrix) -> BitMatrix:
+        """
+        Returns the product A·B modulo 2.
+        """
+
+    @abstractmethod
+    def rref(self, A: BitMatrix) -> tuple[BitMatrix, list[int]]:
+        """
+        Returns the reduced row echelon form of A (with the same number of rows) and its pivot columns.
+        """
+
+class PythonBackend(GF2Backend):
+    """
+    Backend with the list arithmetic of `Matrix` (an element per bit).
+
+    >>> A = BitMatrix([[1, 1, 0], [0, 1, 1]])
+    >>> PythonBackend().multiply(A, A.transpose())
+    [[0, 1], [1, 0]]
+    >>> PythonBackend().rref(BitMatrix([[1, 1, 0], [1, 0, 1], [0, 1, 1]]))
+    ([[1, 0, 1], [0, 1, 1], [0, 0, 0]], [0, 1])
+    """
+    name = "python"
+
+    def multiply(self, A: BitMatrix, B: BitMatrix) -> BitMatrix:
+        return BitMatrix.from_matrix(A.to_matrix().mulmod2(B.to_matrix()))
+
+    def rref(self, A: BitMatrix) -> tuple[BitMatrix, list[int]]:
+        matrix = A.to_matrix()
+        rows, columns = matrix.shape
+        pivots = []
+        for col in range(columns):
+            pivot = len(pivots)
+            if pivot == rows:
+                break
+            for row in range(pivot, rows):
+                if matrix[row][col]:
+                    break
+            else:
+                continue
+            matrix.swap_rows(pivot, row)
+            for row in range(rows):
+                if row != pivot and matrix[row][col]:
+                    matrix[row] ^= matrix[pivot]
+            pivots.append(col)
+        return BitMatrix.from_matrix(matrix), pivots
+
+class BitmaskBackend(GF2Backend):
+    """
+    Backend with the rows packed as Python integers (`BitMatrix`): adding two rows is a single XOR.
+
+    >>> A = BitMatrix([[1, 1, 0], [0, 1, 1]])
+    >>> BitmaskBackend().multiply(A, A.transpose())
+    [[0, 1], [1, 0]]
+    >>> BitmaskBackend().rref(BitMatrix([[1, 1, 0], [1, 0, 1], [0, 1, 1]]))
+    ([[1, 0, 1], [0, 1, 1], [0, 0, 0]], [0, 1])
+    """
+    name = "bitmask"
+
+    def multiply(self, A: BitMatrix, B: BitMatrix) -> BitMatrix:
+        return BitMatrix.from_matrix(A) * B
+
+    def rref(self, A: BitMatrix) -> tuple[BitMatrix, list[int]]:
+        rows, pivots = packed_rref(A.pack_rows(), A.shape[1])
+        return BitMatrix(rows, A.shape[1]), pivots
+
+class NumpyBackend(GF2Backend):
+    """
+    Backend with NumPy arrays of packed rows (64 columns per uint64 word), where the
+    XORs of rows are done for many rows at a time. NumPy is only imported when used.
+    """
+    name = "numpy"
+
+    def available(self) -> bool:
+        try:
+            import numpy
+        except ImportError:
+            return False
+        return True
+
+    @staticmethod
+    def _pack(A: BitMatrix):
+        """
+        Converts the matrix into an array of shape (rows, words) of uint64, the first column
+        being the most significant bit of the first word of each row.
+        """
+        import numpy
+        rows, columns = A.shape
+        words = max(1, (columns + 63) // 64)
+        packed = numpy.zeros((rows, words * 8), dtype=numpy.uint8)
+        width = (columns + 7) // 8
+        if rows and width:
+            packed[:, :width] = numpy.frombuffer(A.to_bytes(), dtype=numpy.uint8).reshape(rows, width)
+        return packed.view(">u8").astype(numpy.uint64)
+
+    @staticmethod
+    def _unpack(packed, columns: int) -> BitMatrix:
+        """
+        Converts an array from `_pack()` back into a `BitMatrix`.
+        """
+        import numpy
+        data = packed.astype(">u8").view(numpy.uint8)[:, :(columns + 7) // 8]
+        return BitMatrix.from_bytes(numpy.ascontiguousarray(data), columns)
+
+    def multiply(self, A: BitMatrix, B: BitMatrix) -> BitMatrix:
+        import numpy
+        bits = numpy.asarray(BitMatrix.from_matrix(A)).astype(bool)
+        packed = self._pack(BitMatrix.from_matrix(B))
+        result = numpy.zeros((A.shape[0], packed.shape[1]), dtype=numpy.uint64)
+        # La fila j de B s'afegeix a totes les files de A amb un 1 a la columna j
+        for j in range(A.shape[1]):
+            result[bits[:, j]] ^= packed[j]
+        return self._unpack(result, B.shape[1])
+
+    def rref(self, A: BitMatrix) -> tuple[BitMatrix, list[int]]:
+        import numpy
+        packed = self._pack(A)
+        rows, columns = A.shape
+        pivots = []
+        for col in range(columns):
+            pivot = len(pivots)
+            if pivot == rows:
+                break
+            word, bit = col // 64, numpy.uint64(1 << (63 - col % 64))
+            candidates = numpy.flatnonzero(packed[pivot:, word] & bit)
+            if not candidates.size:
+                continue
+            row = pivot + candidates[0]
+            packed[[pivot, row]] = packed[[row, pivot]]
+            others = (packed[:, word] & bit) != 0
+            others[pivot] = False
+            packed[others] ^= packed[pivot]
+            pivots.append(col)
+        return self._unpack(packed, columns), pivots
+
+# Backends disponibles, per nom
+BACKENDS = {backend.name: backend for backend in (PythonBackend(), BitmaskBackend(), NumpyBackend())}
+
+# Mides de les matrius quadrades de la calibració
+CALIBRATION_SIZES = (8, 64, 256)
+# La calibració de l'aritmètica de llistes es limita a matrius petites (és massa lenta)
+PYTHON_MAX_SIZE = 64
+
+# Calibració en ús: None si encara no s'ha llegit, {} si no n'hi ha cap
+_calibration = None
+
+def calibration_path() -> str:
+    """
+    Returns the file where the calibration is stored: the GF2_CALIBRATION environment
+    variable, or ~/.cache/linear_codes/gf2_calibration.json.
+    """
+    default = os.path.join(os.path.expanduser("~"), ".cache", "linear_codes", "gf2_calibration.json")
+    return os.environ.get("GF2_CALIBRATION", default)
+
+def calibrate(sizes: tuple[int, ...] = CALIBRATION_SIZES, path: str = None, save: bool = True) -> dict:
+    """
+    Measures the time of each operation with each available backend, for random square
+    matrices of the given sizes (the best of 3 repetitions), and stores the results on disk.
+    From then on, `select()` uses these results in this process.
+
+    :param sizes: Sizes of the square matrices.
+    :param path: File where the results are stored (by default, `calibration_path()`).
+    :param save: If False, the results are not stored.
+    :return: A dictionary {operation: {backend: {size: seconds}}}.
+
+    >>> times = calibrate(sizes=(4, 8), save=False)
+    >>> sorted(times), sorted(times["multiply"]["bitmask"])
+    (['multiply', 'rref'], ['4', '8'])
+    """
+    global _calibration
+    rng = random.Random(0)
+    times = {"multiply": {}, "rref": {}}
+    for name, backend in BACKENDS.items():
+        if not backend.available():
+            continue
+        for operation in times:
+            times[operation][name] = {}
+        for size in sizes:
+            if name == PythonBackend.name and size > PYTHON_MAX_SIZE:
+                continue
+            A = BitMatrix([rng.getrandbits(size) for _ in range(size)], size)
+            B = BitMatrix([rng.getrandbits(size) for _ in range(size)], size)
+            for operation, run in (("multiply", lambda: backend.multiply(A, B)), ("rref", lambda: backend.rref(A))):
+                best = float("inf")
+                for _ in range(3):
+                    start = time.perf_counter()
+                    run()
+                    best = min(best, time.perf_counter() - start)
+                # Claus de text: el resultat es desa en JSON
+                times[operation][name][str(size)] = best
+
+    if save:
+        path = path or calibration_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as file:
+                json.dump(times, file)
+        except OSError:
+            # Sense disc on escriure: la calibració només es manté en memòria
+            pass
+    _calibration = times
+    return times
+
+def load_calibration(path: str = None) -> dict:
+    """
+    Returns the calibration: the one of `calibrate()` if it has been run in this process, or
+    the one stored on disk if it covers the available backends. It is read only once per process.
+
+    No calibration is run implicitly (without one, `select()` uses the bitmask backend),
+    unless the GF2_CALIBRATE environment variable is set to 1: then, if none is stored,
+    `calibrate()` is run and its results are stored on disk.
+
+    :param path: File where the calibration is stored (by default, `calibration_path()`).
+    :return: A dictionary {operation: {backend: {size: seconds}}}, empty if there is no calibration.
+    """
+    global _calibration
+    if _calibration is None:
+        path = path or calibration_path()
+        available = {name for name, backend in BACKENDS.items() if backend.available()}
+        try:
+            with open(path) as file:
+                stored = json.load(file)
+            if all(set(stored.get(operation, {})) == available for operation in ("multiply", "rref")):
+                _calibration = stored
+        except (OSError, ValueError):
+            pass
+        if _calibration is None:
+            if os.environ.get("GF2_CALIBRATE") == "1":
+                calibrate(path=path)
+            else:
+                _calibration = {}
+    return _calibration
+
+def select(operation: str, size: int) -> GF2Backend:
+    """
+    Selects the backend for an operation over matrices of the given size (the largest
+    dimension): the fastest one in the calibration at the nearest calibrated size (on a
+    logarithmic scale), or the bitmask backend if there is no calibration (see
+    `load_calibration()`). Backends not calibrated at that size are not considered.
+
+    >>> select("multiply", 256).name in BACKENDS
+    True
+    """
+    calibration = load_calibration().get(operation, {})
+    sizes = {int(calibrated) for times in calibration.values() for calibrated in times}
+    if not sizes:
+        return BACKENDS[BitmaskBackend.name]
+    nearest = str(min(sizes, key=lambda calibrated: abs(calibrated.bit_length() - size.bit_length())))
+    # Només es comparen els backends calibrats a aquesta mida
+    timed = {name: times[nearest] for name, times in calibration.items() if nearest in times}
+    return BACKENDS[min(timed, key=timed.get)]
+
+def multiply(A: BitMatrix | Matrix, B: BitMatrix | Matrix, backend: str = None) -> BitMatrix:
+    """
+    Multiplies two binary matrices modulo 2 with the given backend, or with the one
+    selected for their size (see `select()`).
+
+    >>> multiply(Matrix([[1, 1, 0], [0, 1, 1]]), Matrix([[1, 0], [1, 1], [0, 1]]), backend="python")
+    [[0, 1], [1, 0]]
+    """
+    A, B = BitMatrix.from_matrix(A), BitMatrix.from_matrix(B)
+    if backend is None:
+        chosen = select("multiply", max(A.shape[0], A.shape[1], B.shape[1]))
+    else:
+        chosen = BACKENDS[backend]
+    return chosen.multiply(A, B)
+
+def rref(A: BitMatrix | Matrix, backend: str = None) -> tuple[BitMatrix, list[int]]:
+    """
+    Reduces a binary matrix to its reduced row echelon form with the given backend, or with
+    the one selected for its size (see `select()`).
+
+    >>> rref(Matrix([[0, 1, 1], [1, 1, 0]]), backend="bitmask")
+    ([[1, 0, 1], [0, 1, 1]], [0, 1])
+    """
+    A = BitMatrix.from_matrix(A)
+    chosen = select("rref", max(A.shape)) if backend is None else BACKENDS[backend]
+    return chosen.rref(A)
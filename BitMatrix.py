@@ -0,0 +1,548 @@
+from Row import Row
+from Matrix import Matrix
+
+from time import perf_counter
+
+class BitMatrix:
+    """
+    Class to represent a binary matrix (over the F2 field), where each row
+    is packed as an integer (the first column being the most significant bit).
+
+    It implements the same interface as `Matrix` for the operations used by
+    linear codes (multiplication, transposition, getting rows/columns, etc.),
+    but all the arithmetic is done modulo 2 with XORs of whole rows.
+    """
+    __slots__ = ("rows", "shape")
+
+    def __init__(self, rows, columns: int = None):
+        """
+        Create an instance of a binary matrix representation
+
+        :param rows: List of packed rows (integers), or of rows of bits (lists or `Row`).
+        :param columns: Number of columns. Required if the rows are packed.
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).shape
+        (2, 3)
+        >>> BitMatrix([5, 3], 3)
+        [[1, 0, 1], [0, 1, 1]]
+        >>> import numpy  # doctest: +SKIP
+        >>> BitMatrix(numpy.array([[1, 0, 1], [0, 1, 1]]))  # doctest: +SKIP
+        [[1, 0, 1], [0, 1, 1]]
+        """
+        if columns is None and hasattr(rows, "ndim"):
+            # Array de NumPy: s'empaqueta amb numpy.packbits, sense convertir cada element
+            import numpy
+            columns = rows.shape[1]
+            rows = BitMatrix.from_bytes(numpy.packbits(numpy.asarray(rows, dtype=numpy.uint8), axis=1), columns).rows
+        rows = list(rows)
+        if columns is None:
+            columns = len(rows[0]) if rows else 0
+            rows = [row.pack() if isinstance(row, Row) else Row(list(row)).pack() for row in rows]
+        # Files empaquetades
+        self.rows: list[int] = rows
+        # Dimensions de la matriu, sent [0] nombre de files, i [1] nombre de columnes
+        self.shape: tuple[int, int] = (len(rows), columns)
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> 'BitMatrix':
+        """
+        Packs a binary `Matrix`.
+
+        >>> BitMatrix.from_matrix(Matrix([[1, 1, 0], [0, 0, 1]])).pack_rows()
+        [6, 1]
+        """
+        if isinstance(matrix, BitMatrix):
+            return matrix
+        return cls(matrix.pack_rows(), matrix.shape[1])
+
+    @classmethod
+    def from_bytes(cls, data, columns: int) -> 'BitMatrix':
+        """
+        Creates a matrix from its packed rows in `bytes` (or any object with the buffer protocol,
+        such as the result of `numpy.packbits(array, axis=1)`): each row takes ceil(columns / 8)
+        bytes, the first column being the most significant bit of its first byte.
+
+        Each row is read with a single `int.from_bytes()`, without converting the bits one by one.
+
+        :param data: The packed rows.
+        :param columns: Number of columns.
+        :return: The matrix.
+
+        >>> BitMatrix.from_bytes(b"\\xa0\\x60", 3)
+        [[1, 0, 1], [0, 1, 1]]
+        """
+        data = memoryview(data).cast("B")
+        width = (columns + 7) // 8
+        padding = 8 * width - columns
+        return cls([int.from_bytes(data[start:start + width], "big") >> padding
+                    for start in range(0, len(data), width)], columns)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the packed rows as `bytes`, with the layout of `from_bytes()` (the same as
+        `numpy.packbits(array, axis=1)`). The rows are kept as integers, so the bytes are a new
+        copy on every call: changing the matrix does not change them, nor the other way round.
+
+        >>> m = BitMatrix([[1, 0, 1], [0, 1, 1]])
+        >>> m.to_bytes()
+        b'\\xa0`'
+        >>> BitMatrix.from_bytes(m.to_bytes(), 3) == m
+        True
+        """
+        columns = self.shape[1]
+        width = (columns + 7) // 8
+        padding = 8 * width - columns
+        return b"".join((row << padding).to_bytes(width, "big") for row in self.pack_rows())
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Converts the matrix into a 2-D NumPy array of bits, unpacking the rows with
+        `numpy.unpackbits` (NumPy is only imported when needed).
+
+        >>> import numpy  # doctest: +SKIP
+        >>> numpy.asarray(BitMatrix([[1, 0, 1], [0, 1, 1]]))  # doctest: +SKIP
+        array([[1, 0, 1],
+               [0, 1, 1]], dtype=uint8)
+
+        The elements are always copied into a new array, so `copy=False` is not supported.
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).__array__(copy=False)
+        Traceback (most recent call last):
+            ...
+        ValueError: A BitMatrix cannot be converted into a NumPy array without copying it
+        """
+        if copy is False:
+            raise ValueError("A BitMatrix cannot be converted into a NumPy array without copying it")
+        import numpy
+        rows, columns = self.shape
+        packed = numpy.frombuffer(self.to_bytes(), dtype=numpy.uint8).reshape(rows, (columns + 7) // 8)
+        bits = numpy.unpackbits(packed, axis=1, count=columns)
+        return bits if dtype is None else bits.astype(dtype)
+
+    def to_matrix(self) -> Matrix:
+        """
+        Unpacks the matrix into a `Matrix` instance.
+
+        >>> m = BitMatrix([6, 1], 3).to_matrix()
+        >>> type(m).__name__, m
+        ('Matrix', [[1, 1, 0], [0, 0, 1]])
+        """
+        return Matrix([Row.unpack(row, self.shape[1]) for row in self.pack_rows()])
+
+    def pack_rows(self) -> list[int]:
+        """
+        Returns the packed rows of the matrix.
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).pack_rows()
+        [5, 3]
+        """
+        return self.rows
+
+    def pack_columns(self) -> list[int]:
+        """
+        Returns the columns of the matrix packed as integers (the first row being the most significant bit).
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).pack_columns()
+        [2, 1, 3]
+        """
+        rows, columns = self.shape
+        # Cada fila com a cadena de bits: la columna j són els caràcters j, j+n, j+2n...
+        bits = "".join(format(row, f"0{columns}b") for row in self.pack_rows())
+        return [int(bits[col::columns], 2) if rows else 0 for col in range(columns)]
+
+    def __repr__(self):
+        """
+        Representation of a matrix in list form (same as `Matrix`)
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]])
+        [[1, 0, 1], [0, 1, 1]]
+        """
+        return str([row.elements for row in self])
+
+    def __str__(self):
+        """
+        Return a string representation of the matrix where each row is on a new line.
+
+        >>> print(BitMatrix([[1, 0, 1], [0, 1, 1]]))
+        [1 0 1]
+        [0 1 1]
+        """
+        return "\n".join(str(row) for row in self)
+
+    def __len__(self):
+        """
+        Return the number of rows in the matrix
+
+        >>> len(BitMatrix([[1, 0, 1], [0, 1, 1]]))
+        2
+        """
+        return self.shape[0]
+
+    def __iter__(self):
+        """
+        Iterate over the (unpacked) rows of the matrix.
+
+        >>> list(BitMatrix([[1, 0, 1], [0, 1, 1]]))
+        [[1 0 1], [0 1 1]]
+        """
+        for row in self.pack_rows():
+            yield Row.unpack(row, self.shape[1])
+
+    def __getitem__(self, index: int) -> Row:
+        """
+        Access a row of the matrix by its index, unpacked as a `Row`.
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]])[1]
+        [0 1 1]
+        """
+        return Row.unpack(self.pack_rows()[index], self.shape[1])
+
+    def __eq__(self, other) -> bool:
+        """
+        Defines the equality relation between two binary matrices (packed or not)
+
+        >>> BitMatrix([[1, 0], [0, 1]]) == Matrix.eye(2)
+        True
+        >>> Matrix.eye(2) == BitMatrix([[1, 0], [0, 1]])
+        True
+        >>> BitMatrix([[1, 0], [0, 1]]) == BitMatrix([[1, 0], [1, 1]])
+        False
+        """
+        if isinstance(other, Matrix):
+            other = BitMatrix.from_matrix(other)
+        if not isinstance(other, BitMatrix):
+            return NotImplemented
+        return self.shape == other.shape and self.pack_rows() == other.pack_rows()
+
+    def __bool__(self) -> bool:
+        """
+        Return False if all elements in the matrix are 0, True otherwise.
+
+        >>> bool(BitMatrix([0, 0], 3)), bool(BitMatrix([0, 2], 3))
+        (False, True)
+        """
+        return any(self.pack_rows())
+
+    def __add__(self, other) -> 'BitMatrix':
+        """
+        Addition of two binary matrices (modulo 2, that is, XOR)
+
+        >>> BitMatrix([[1, 0, 1]]) + BitMatrix([[1, 1, 0]])
+        [[0, 1, 1]]
+        """
+        other = BitMatrix.from_matrix(other)
+        if self.shape != other.shape:
+            raise ValueError("Les matrius han de tenir la mateixa mida per sumar-les")
+        return BitMatrix([a ^ b for a, b in zip(self.pack_rows(), other.pack_rows())], self.shape[1])
+
+    # En F2 restar és el mateix que sumar
+    __sub__ = __xor__ = __add__
+
+    def __iadd__(self, other) -> 'BitMatrix':
+        """
+        Addition of another binary matrix (XOR), in place
+
+        >>> m = BitMatrix([[1, 0, 1]])
+        >>> m += BitMatrix([[1, 1, 0]])
+        >>> m
+        [[0, 1, 1]]
+        """
+        other = BitMatrix.from_matrix(other)
+        if self.shape != other.shape:
+            raise ValueError("Les matrius han de tenir la mateixa mida per sumar-les")
+        rows = self.pack_rows()
+        for index, row in enumerate(other.pack_rows()):
+            rows[index] ^= row
+        return self
+
+    __isub__ = __ixor__ = __iadd__
+
+    def __mul__(self, other) -> 'BitMatrix':
+        """
+        Multiplication of two binary matrices, modulo 2
+
+        Each row of the result is the XOR of the rows of `other` selected by the bits of the row of `self`.
+
+        >>> BitMatrix([[1, 1, 0], [0, 1, 1]]) * Matrix([[1, 0], [1, 1], [0, 1]])
+        [[0, 1], [1, 0]]
+        """
+        if isinstance(other, int):
+            return self if other % 2 else BitMatrix([0] * self.shape[0], self.shape[1])
+        if not isinstance(other, (Matrix, BitMatrix)):
+            return NotImplemented
+        other = BitMatrix.from_matrix(other)
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Mides de matrius incompatibles per multiplicació: {self.shape} i {other.shape}")
+
+        other_rows = other.pack_rows()
+        last = self.shape[1] - 1
+        result = []
+        for row in self.pack_rows():
+            acc = 0
+            while row:
+                lowest = row & -row
+                acc ^= other_rows[last - (lowest.bit_length() - 1)]
+                row ^= lowest
+            result.append(acc)
+        return BitMatrix(result, other.shape[1])
+
+    def __rmul__(self, other) -> 'BitMatrix':
+        """
+        Allows left side multiplication by a `Matrix` (<Matrix> * BitMatrix)
+
+        >>> Matrix([[1, 1]]) * BitMatrix([[1, 0, 1], [0, 1, 1]])
+        [[1, 1, 0]]
+        """
+        if isinstance(other, Matrix):
+            return BitMatrix.from_matrix(other) * self
+        return NotImplemented
+
+    def __mod__(self, mod: int) -> 'BitMatrix':
+        """
+        The elements of a binary matrix are already reduced modulo 2.
+
+        >>> BitMatrix([[1, 0, 1]]) % 2
+        [[1, 0, 1]]
+        """
+        if mod != 2:
+            raise ValueError("BitMatrix only represents matrices modulo 2")
+        return self
+
+    # Ja està reduïda: la versió "in place" és la mateixa
+    imod = __mod__
+
+    def mulmod2(self, other) -> 'BitMatrix':
+        """
+        Multiplication modulo 2, as `Matrix.mulmod2()` (the product of a `BitMatrix` is already reduced).
+
+        >>> BitMatrix([[1, 1, 0], [0, 1, 1]]).mulmod2(Matrix([[1, 0], [1, 1], [0, 1]]))
+        [[0, 1], [1, 0]]
+        """
+        return self * other
+
+    def addmod2(self, other) -> 'BitMatrix':
+        """
+        Addition modulo 2, as `Matrix.addmod2()` (the sum of a `BitMatrix` is already reduced).
+
+        >>> BitMatrix([[1, 0, 1]]).addmod2(BitMatrix([[1, 1, 0]]))
+        [[0, 1, 1]]
+        """
+        return self + other
+
+    def matvec_mod2(self, vector) -> Row:
+        """
+        Multiplication by a column vector modulo 2, as `Matrix.matvec_mod2()`.
+
+        >>> BitMatrix([[1, 1, 1, 0], [1, 0, 0, 1]]).matvec_mod2([0, 1, 0, 1])
+        [1 1]
+        """
+        vector = vector if isinstance(vector, Row) else Row(list(vector))
+        if len(vector) != self.shape[1]:
+            raise ValueError(f"Mides incompatibles per multiplicació: {self.shape} i {len(vector)}")
+        word = vector.pack()
+        return Row([(row & word).bit_count() & 1 for row in self.pack_rows()])
+
+    def transpose(self) -> 'BitMatrix':
+        """
+        Return the transpose of the matrix.
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).transpose()
+        [[1, 0], [0, 1], [1, 1]]
+        """
+        return BitMatrix(self.pack_columns(), self.shape[0])
+
+    def get_row(self, row: int) -> Row:
+        """
+        Returns a row from the matrix as a `Row` object.
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).get_row(0)
+        [1 0 1]
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).get_row(2)
+        Traceback (most recent call last):
+            ...
+        IndexError: Index de fila fora de límits
+        """
+        if not (0 <= row < self.shape[0]):
+            raise IndexError("Index de fila fora de límits")
+        return self[row]
+
+    def get_rows(self, rows: list[int] | tuple[int]) -> list[Row]:
+        """
+        Returns multiple rows from the matrix as a list of `Row` objects.
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).get_rows([1, 0])
+        [[0 1 1], [1 0 1]]
+        """
+        return [self.get_row(row) for row in rows]
+
+    def get_column(self, column: int) -> Row:
+        """
+        Returns a column from the matrix as a `Row` object.
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).get_column(2)
+        [1 1]
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).get_column(3)
+        Traceback (most recent call last):
+            ...
+        IndexError: Index de columna fora de límits
+        """
+        if not (0 <= column < self.shape[1]):
+            raise IndexError("Index de columna fora de límits")
+        shift = self.shape[1] - 1 - column
+        return Row([(row >> shift) & 1 for row in self.pack_rows()])
+
+    def get_columns(self, columns: list[int] | tuple[int]) -> list[Row]:
+        """
+        Returns multiple columns from the matrix as a list of `Row` objects.
+
+        >>> BitMatrix([[1, 0, 1], [0, 1, 1]]).get_columns((0, 2))
+        [[1 0], [1 1]]
+        """
+        return [self.get_column(col) for col in columns]
+
+    def split(self, rows: slice, columns: slice) -> 'BitMatrix':
+        """
+        Splits the matrix into a submatrix defined by the given row and column slices (with step 1).
+
+        >>> BitMatrix([[1, 0, 1, 1], [0, 1, 1, 0], [1, 1, 1, 1]]).split(slice(1, 3), slice(1, 3))
+        [[1, 1], [1, 1]]
+        """
+        start, stop, step = columns.indices(self.shape[1])
+        if step != 1:
+            raise ValueError("Only contiguous columns can be split from a BitMatrix")
+        width = max(stop - start, 0)
+        shift = self.shape[1] - max(stop, start)
+        mask = (1 << width) - 1
+        return BitMatrix([(row >> shift) & mask for row in self.pack_rows()[rows]], width)
+
+    @classmethod
+    def eye(cls, N: int) -> 'BitMatrix':
+        """
+        Creates an identity matrix of size N x N.
+
+        >>> BitMatrix.eye(3)
+        [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        """
+        return cls([1 << (N - 1 - i) for i in range(N)], N)
+
+
+class SystematicBitMatrix(BitMatrix):
+    """
+    Binary matrix in systematic form `(I | P)`, where only the rows of `P` are stored.
+
+    The rows of the identity part are never built unless they are requested, so
+    generator matrices of long codes (e.g. Hamming codes with n = 65535) can be
+    represented with k small integers instead of k·n bits.
+
+    >>> G = SystematicBitMatrix([0b11, 0b10], 4)
+    >>> G
+    [[1, 0, 1, 1], [0, 1, 1, 0]]
+    >>> G.parity
+    [3, 2]
+    """
+    __slots__ = ("parity",)
+
+    def __iadd__(self, other):
+        """
+        The sum is not in systematic form: it falls back to `+`, which returns a new `BitMatrix`.
+
+        >>> G = SystematicBitMatrix([0b11, 0b10], 4)
+        >>> G += BitMatrix.eye(4).split(slice(0, 2), slice(0, 4))
+        >>> type(G).__name__, G
+        ('BitMatrix', [[0, 0, 1, 1], [0, 0, 1, 0]])
+        """
+        return NotImplemented
+
+    __isub__ = __ixor__ = __iadd__
+
+    def __init__(self, parity: list[int], columns: int):
+        """
+        :param parity: Packed rows of the parity part `P`.
+        :param columns: Number of columns of the whole matrix `(I | P)`.
+        """
+        # Part de paritat P, de mida k x (n-k)
+        self.parity: list[int] = parity
+        self.shape: tuple[int, int] = (len(parity), columns)
+
+    @property
+    def rows(self) -> list[int]:
+        """
+        Packed rows of the whole matrix (built on demand).
+        """
+        k, n = self.shape
+        return [(1 << (n - 1 - i)) | p for i, p in enumerate(self.parity)]
+
+    def pack_rows(self) -> list[int]:
+        """
+        Returns the packed rows of the matrix, building the identity part.
+
+        >>> SystematicBitMatrix([0b11, 0b10], 4).pack_rows()
+        [11, 6]
+        """
+        return self.rows
+
+    def __getitem__(self, index: int) -> Row:
+        """
+        Access a row of the matrix by its index, without building the other rows.
+
+        >>> SystematicBitMatrix([0b11, 0b10], 4)[1]
+        [0 1 1 0]
+        """
+        k, n = self.shape
+        index = range(k)[index]
+        return Row.unpack((1 << (n - 1 - index)) | self.parity[index], n)
+
+    def pack_columns(self) -> list[int]:
+        """
+        Returns the packed columns: unit vectors for the identity part, and the columns of `P`.
+
+        >>> SystematicBitMatrix([0b11, 0b10], 4).pack_columns()
+        [2, 1, 3, 2]
+        """
+        k, n = self.shape
+        return [1 << (k - 1 - i) for i in range(k)] + BitMatrix(self.parity, n - k).pack_columns()
+
+def packed_rref(rows: list[int], width: int, order: list[int] = None,
+                deadline: float = None) -> tuple[list[int], list[int]]:
+    """
+    Reduces packed rows (the first column being the most significant bit of `width` bits)
+    with Gauss-Jordan elimination over F2, choosing the pivot columns following `order`.
+
+    Each row is an integer, so adding a row to another one is a single XOR.
+
+    :param rows: The rows of the matrix, packed as integers.
+    :param width: Number of columns of the matrix.
+    :param order: Order in which the columns are tried as pivots (by default, from left to right).
+    :param deadline: If given (a `time.perf_counter()` value), the reduction stops when it is reached,
+                     returning the pivots found so far (the rows are still combinations of the given ones).
+    :return: The reduced rows (the first ones having the pivots) and the pivot columns.
+
+    >>> rows, pivots = packed_rref([0b110, 0b101, 0b011], 3)
+    >>> [bin(row) for row in rows], pivots
+    (['0b101', '0b11', '0b0'], [0, 1])
+    >>> rows, pivots = packed_rref([0b110, 0b101], 3, order=[2, 1, 0])
+    >>> [bin(row) for row in rows], pivots
+    (['0b101', '0b110'], [2, 1])
+    """
+    rows = list(rows)
+    pivots = []
+    order = range(width) if order is None else order
+    for col in order:
+        if len(pivots) == len(rows):
+            break
+        if deadline is not None and perf_counter() >= deadline:
+            break
+        bit = 1 << (width - 1 - col)
+        # Fila (no usada com a pivot) amb un 1 a la columna
+        for r in range(len(pivots), len(rows)):
+            if rows[r] & bit:
+                break
+        else:
+            continue
+        pivot = len(pivots)
+        rows[pivot], rows[r] = rows[r], rows[pivot]
+        for r in range(len(rows)):
+            if r != pivot and rows[r] & bit:
+                rows[r] ^= rows[pivot]
+        pivots.append(col)
+    return rows, pivots
@@ -0,0 +1,293 @@
+from Row import Row
+from BitMatrix import BitMatrix
+from LinearCode import LinearCode
+
+import hashlib
+import mmap
+import struct
+import zlib
+
+# Capçalera: identificador, versió, opcions, n, k, n-k, d (0 si no es coneix), blocs per pàgina,
+# longitud del missatge (bits), pàgines, posició de les pàgines, posició de l'índex (0 si no n'hi ha) i hash de G
+_HEADER = struct.Struct("<4sHHIIIII4xQQQQ32s")
+_MAGIC = b"LCC\x00"
+_VERSION = 1
+# Entrada de l'índex: posició i CRC-32 de cada pàgina
+_INDEX_ENTRY = struct.Struct("<QI4x")
+
+def generator_hash(G) -> bytes:
+    """
+    Returns the SHA-256 hash of a generator matrix (of its shape and its packed rows), which
+    identifies the code used to write a container.
+
+    >>> from Matrix import Matrix
+    >>> generator_hash(Matrix([[1, 1, 0]])) == generator_hash(BitMatrix([6], 3))
+    True
+    """
+    G = BitMatrix.from_matrix(G)
+    return hashlib.sha256(struct.pack("<II", *G.shape) + G.to_bytes()).digest()
+
+class ContainerWriter:
+    """
+    Class to write an encoded message in a seekable binary container.
+
+    The container has a header with the parameters of the code (n, k, n-k and d), the SHA-256
+    hash of G and the length of the original message in bits, followed by G and H (so the
+    receiver does not need them out of band). Then come the codewords, each one packed in
+    ceil(n/8) bytes, in pages of a fixed number of blocks (the last one padded with null
+    codewords), so the position of any block is known without reading the previous ones.
+    Optionally, a page index with the position and the CRC-32 of each page is added at the end.
+
+    It can be used as a context manager, which closes the container on exit.
+    """
+
+    def __init__(self, path: str, code: LinearCode, page_blocks: int = 1024, index: bool = True):
+        """
+        Create a container and write its header.
+
+        :param path: Path of the container file.
+        :param code: The linear code used to encode the message.
+        :param page_blocks: Number of codewords of each page.
+        :param index: If True, the page index is written.
+        """
+        if page_blocks < 1:
+            raise ValueError(f"A page needs at least one block (page_blocks = {page_blocks})")
+        self.code = code
+        self.page_blocks = page_blocks
+        self.index = index
+        self.length = 0
+        self.word_size = (code.n + 7) // 8
+        self._file = open(path, "wb")
+        self._pending = ""
+        self._page = bytearray()
+        self._pages = []
+
+        G, H = BitMatrix.from_matrix(code.G), BitMatrix.from_matrix(code.H)
+        self._file.write(bytes(_HEADER.size))
+        self._file.write(G.to_bytes())
+        self._file.write(H.to_bytes())
+        self.data_offset = self._file.tell()
+
+    def __enter__(self) -> 'ContainerWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, bits: list[int] | str | bytes):
+        """
+        Encodes and appends a part of the message.
+
+        :param bits: A list of bits or a string of bits, or `bytes` (8 bits each, the most significant first).
+        """
+        if isinstance(bits, (bytes, bytearray, memoryview)):
+            bits = "".join(format(byte, "08b") for byte in bytes(bits))
+        elif not isinstance(bits, str):
+            bits = "".join(map(str, bits))
+        self.length += len(bits)
+
+        # Els bits que no omplen un bloc esperen a la següent escriptura
+        bits = self._pending + bits
+        full = len(bits) - len(bits) % self.code.k
+        self._pending = bits[full:]
+        self._write_blocks(bits[:full])
+
+    def _write_blocks(self, bits: str):
+        """
+        Encodes whole blocks of k bits and appends their codewords to the pages.
+        """
+        n = self.code.n
+        coded = self.code.codify(bits)
+        for start in range(0, len(coded), n):
+            self._page += int(coded[start:start + n], 2).to_bytes(self.word_size, "big")
+            if len(self._page) == self.page_blocks * self.word_size:
+                self._flush_page()
+
+    def _flush_page(self):
+        """
+        Writes the current page (padded with null codewords) and records it in the index.
+        """
+        self._page += bytes(self.page_blocks * self.word_size - len(self._page))
+        self._pages.append((self._file.tell(), zlib.crc32(self._page)))
+        self._file.write(self._page)
+        self._page = bytearray()
+
+    def close(self):
+        """
+        Encodes the last block (padded with zeros), writes the last page and the index,
+        and completes the header.
+        """
+        if self._file.closed:
+            return
+        if self._pending:
+            self._write_blocks(self._pending.ljust(self.code.k, "0"))
+            self._pending = ""
+        if self._page:
+            self._flush_page()
+
+        index_offset = 0
+        if self.index:
+            index_offset = self._file.tell()
+            for offset, crc in self._pages:
+                self._file.write(_INDEX_ENTRY.pack(offset, crc))
+
+        code = self.code
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, int(self.index), code.n, code.k, code.H.shape[0],
+                                      code._d or 0, self.page_blocks, self.length, len(self._pages),
+                                      self.data_offset, index_offset, generator_hash(code.G)))
+        self._file.close()
+
+class ContainerReader:
+    """
+    Class to read a container written by `ContainerWriter`, with random access: the file is
+    mapped in memory (mmap), and only the blocks which hold the requested bits are decoded.
+
+    It can be used as a context manager, which closes the container on exit.
+    """
+
+    def __init__(self, path: str, code: LinearCode = None, complete: bool = False):
+        """
+        Open a container.
+
+        :param path: Path of the container file.
+        :param code: The linear code used to write it. By default, a `LinearCode` is built from
+                     the G and H stored in the container; if given, its G must match the hash.
+        :param complete: If True, the blocks are corrected with the complete syndrome table.
+        """
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, flags, n, k, r, d, self.page_blocks, self.length, self.pages,
+         self.data_offset, index_offset, digest) = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a linear code container (version {_VERSION})")
+        self.n, self.k = n, k
+        self.complete = complete
+        self.word_size = (n + 7) // 8
+
+        if code is None:
+            offset = _HEADER.size
+            G = BitMatrix.from_bytes(self._map[offset:offset + k * self.word_size], n)
+            offset += k * self.word_size
+            H = BitMatrix.from_bytes(self._map[offset:offset + r * self.word_size], n)
+            code = LinearCode(G=G, H=H, n=n, k=k, M=2**k, d=d or None)
+        elif generator_hash(code.G) != digest:
+            self.close()
+            raise ValueError(f"The generator matrix of the code does not match the one of {path}")
+        self.code = code
+
+        # CRC-32 de cada pàgina, si el contenidor té índex
+        self._crcs = None
+        if flags & 1:
+            self._crcs = [crc for _, crc in _INDEX_ENTRY.iter_unpack(
+                self._map[index_offset:index_offset + self.pages * _INDEX_ENTRY.size])]
+
+    def __enter__(self) -> 'ContainerReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Length of the original message, in bits.
+        """
+        return self.length
+
+    def _page_is_clean(self, page: int) -> bool:
+        """
+        Returns whether a page matches the CRC-32 of the index (so it has no errors to correct).
+        """
+        if self._crcs is None:
+            return False
+        size = self.page_blocks * self.word_size
+        start = self.data_offset + page * size
+        return zlib.crc32(self._map[start:start + size]) == self._crcs[page]
+
+    def read_bits(self, start: int = 0, stop: int = None) -> str:
+        """
+        Decodes the bits [start, stop) of the original message, correcting errors within the
+        capacity of the code. Only the blocks which hold them are read and decoded, and those
+        in pages which match their CRC-32 in the index are not corrected. The bits of the
+        uncorrectable blocks are returned as '?'.
+
+        :param start: Position of the first bit.
+        :param stop: Position after the last bit (by default, the end of the message).
+        :raises ValueError: If `start` is negative.
+        :return: A string with the decoded bits.
+
+        >>> import os, tempfile
+        >>> from LinearCode import HammingCode
+        >>> path = os.path.join(tempfile.mkdtemp(), "message.lcc")
+        >>> with ContainerWriter(path, HammingCode(t=3), page_blocks=2) as writer:
+        ...     writer.write("10110011101")
+        >>> with ContainerReader(path) as reader:
+        ...     len(reader), reader.pages, reader.read_bits(), reader.read_bits(5, 9)
+        (11, 2, '10110011101', '0111')
+        >>> with ContainerReader(path) as reader:
+        ...     reader.read_bits(-3)
+        Traceback (most recent call last):
+            ...
+        ValueError: The start position (-3) cannot be negative
+        """
+        if start < 0:
+            # Un bloc negatiu llegiria la capçalera com si fos una paraula del codi
+            raise ValueError(f"The start position ({start}) cannot be negative")
+        stop = self.length if stop is None else min(stop, self.length)
+        if start >= stop:
+            return ""
+        n, k = self.n, self.k
+        first, last = start // k, (stop - 1) // k
+        # Pàgines ja comprovades amb l'índex
+        clean = {}
+
+        bits = []
+        for block in range(first, last + 1):
+            page, position = divmod(block, self.page_blocks)
+            if page not in clean:
+                clean[page] = self._page_is_clean(page)
+            offset = self.data_offset + block * self.word_size
+            received = int.from_bytes(self._map[offset:offset + self.word_size], "big")
+            word = received if clean[page] else self.code._correct_word(received, self.complete)
+            if word is None:
+                print(f"Warning! Block {[Row.unpack(received, n).elements]} has more errors than the linear code's correct capabilites")
+                bits.append("?"*k)
+            else:
+                bits.append(format(self.code._decode_word(word), f"0{k}b"))
+
+        bits = "".join(bits)
+        return bits[start - first * k:stop - first * k]
+
+    def read_bytes(self, start: int = 0, stop: int = None) -> bytes:
+        """
+        Decodes the bytes [start, stop) of the original message (see `read_bits()`). The message
+        is read in bytes of 8 bits, the first one being the most significant bit.
+
+        :param start: Position of the first byte.
+        :param stop: Position after the last byte (by default, the end of the message).
+        :raises ValueError: If `start` is negative, or the bytes have uncorrectable errors.
+        :return: The decoded bytes.
+
+        >>> import os, tempfile
+        >>> from LinearCode import HammingCode
+        >>> path = os.path.join(tempfile.mkdtemp(), "message.lcc")
+        >>> with ContainerWriter(path, HammingCode(t=4)) as writer:
+        ...     writer.write(b"linear codes")
+        >>> with ContainerReader(path, HammingCode(t=4)) as reader:
+        ...     reader.read_bytes(7, 12)
+        b'codes'
+        """
+        if start < 0:
+            raise ValueError(f"The start position ({start}) cannot be negative")
+        bits = self.read_bits(8 * start, None if stop is None else 8 * stop)
+        if "?" in bits:
+            raise ValueError(f"The bytes [{start}, {stop}) have more errors than the linear code's correct capabilites")
+        return bytes(int(bits[byte:byte + 8], 2) for byte in range(0, len(bits) - len(bits) % 8, 8))
+
+    def close(self):
+        """
+        Closes the container.
+        """
+        self._map.close()
+        self._file.close()
@@ -1,11 +1,104 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from typing import Generator
 from itertools import combinations
+from operator import itemgetter
+from math import comb
+from bisect import bisect_left
+from multiprocessing import Event, Pool
+from time import perf_counter
 
 from Row import Row
 from Matrix import Matrix
+from BitMatrix import BitMatrix, SystematicBitMatrix, packed_rref
+from SparseMatrix import SparseMatrix
 
+import Backend
 import itertools
+import random
+
+@dataclass(frozen=True)
+class CodeParameters:
+    """
+    Record with the parameters of a linear code: length n, dimension k, size M, minimum
+    Hamming distance d, rate k/n, and error detection and correction capabilities.
+
+    If d is only known to be between two bounds (see `LinearCode.distance_bounds()`), `d` is None
+    and the capabilities are those guaranteed by the lower bound. The weight distribution (the
+    number of codewords of each weight) is only available for codes with few codewords.
+
+    Its string form is the text printed by `LinearCode.parameters()`.
+    """
+    n: int
+    k: int
+    M: int
+    d: int | None
+    d_bounds: tuple[int, int]
+    rate: float
+    detection: int
+    correction: int
+    weight_distribution: tuple[int, ...] = None
+
+    @classmethod
+    def from_bounds(cls, n: int, k: int, lower: int, upper: int,
+                    weight_distribution: tuple[int, ...] = None) -> 'CodeParameters':
+        """
+        Builds the record from n, k and the bounds of d.
+
+        >>> CodeParameters.from_bounds(7, 4, 3, 3)
+        CodeParameters(n=7, k=4, M=16, d=3, d_bounds=(3, 3), rate=0.5714285714285714, detection=2, correction=1, weight_distribution=None)
+        """
+        return cls(n=n, k=k, M=2**k, d=lower if lower == upper else None, d_bounds=(lower, upper),
+                   rate=k / n if n else 0.0, detection=lower - 1, correction=int((lower - 1) / 2),
+                   weight_distribution=weight_distribution)
+
+    def __str__(self):
+        """
+        Formats the parameters as a text.
+
+        >>> print(CodeParameters.from_bounds(4095, 4083, 2, 3))
+        Linear Code Parameters:
+        - Code Length (n): 4095
+        - Code Dimension (k): 4083
+        - Code Size (M): 2^4083
+        - Delta (d): 2..3
+        - Error Detection: 1
+        - Error Correction: 0
+        """
+        lower, upper = self.d_bounds
+        return ("Linear Code Parameters:\n"
+                f"- Code Length (n): {self.n}\n"
+                f"- Code Dimension (k): {self.k}\n"
+                f"- Code Size (M): {self.M if self.k <= 64 else f'2^{self.k}'}\n"
+                f"- Delta (d): {lower if lower == upper else f'{lower}..{upper}'}\n"
+                f"- Error Detection: {self.detection}\n"
+                f"- Error Correction: {self.correction}")
+
+class _Distance:
+    """
+    Descriptor of `LinearCode.d`, used as the default of the dataclass field `d` (a
+    descriptor-typed field): `d` is still a parameter of the constructor, in its repr and in
+    its comparisons, but its value is kept in `_d` and computed only when it is needed.
+
+    - Reading `code.d`: if d is unknown, it is computed from H (exactly) the first time, and stored.
+    - Assigning `code.d`: everything that depends on d (the bounds, the parameters and the
+      decoding tables, see `LinearCode._CACHES`) is discarded.
+    - Reading `LinearCode.d` (on the class): None, the default value of the field.
+
+    >>> lc = LinearCode(H=Matrix([[1, 0, 1, 1], [0, 1, 1, 0]]))
+    >>> lc._d is None, lc.d, lc._d
+    (True, 2, 2)
+    """
+
+    def __get__(self, code: 'LinearCode', owner: type = None) -> int:
+        if code is None:
+            return None
+        if code._d is None and code.H is not None:
+            code._d = LC_Solver._min_hamming_distance(code.H, code._distance_processes)
+        return code._d
+
+    def __set__(self, code: 'LinearCode', d: int):
+        code._discard_caches()
+        code._d = d
 
 @dataclass
 class LinearCode:
@@ -22,11 +115,86 @@ class LinearCode:
     n: int = None
     k: int = None
     M: int = None
-    d: int = None
+    # La distància mínima es calcula només quan es necessita i es desa a `_d` (vegeu `_Distance`)
+    _d: int = field(default=None, init=False, repr=False, compare=False)
+    d: int = _Distance()
+    # Cotes conegudes de la distància, si no se sap exactament (vegeu `distance_bounds()`)
+    _d_bounds: tuple[int, int] = field(default=None, init=False, repr=False, compare=False)
+    _distance_processes: int = field(default=1, init=False, repr=False, compare=False)
 
     # Només es generaran si són necessaris (decodificar)
     code_elements: dict[str:str] = None
 
+    # Taules precalculades (a partir de H i dels elements del codi) per decodificar
+    _syndrome_tables: list[list[int]] = field(default=None, init=False, repr=False, compare=False)
+    _packed_elements: dict[int, tuple] = field(default=None, init=False, repr=False, compare=False)
+    _leaders: dict[bool, dict[int, int]] = field(default=None, init=False, repr=False, compare=False)
+    _info_positions: list[int] = field(default=None, init=False, repr=False, compare=False)
+    _message_rows: tuple[list[int], list[int]] = field(default=None, init=False, repr=False, compare=False)
+    _sparse_h: SparseMatrix = field(default=None, init=False, repr=False, compare=False)
+    _code_parameters: CodeParameters = field(default=None, init=False, repr=False, compare=False)
+
+    # Atributs calculats a partir de G, H i d, que es descarten si es reassignen (vegeu `__setattr__`)
+    _CACHES = ("_d", "_d_bounds", "_code_parameters", "code_elements", "_syndrome_tables", "_packed_elements",
+               "_leaders", "_info_positions", "_message_rows", "_sparse_h")
+
+    def __setattr__(self, name, value):
+        """
+        Assigns an attribute. If G or H are reassigned, everything computed from them
+        (d, the parameters, the code elements and the decoding tables, see `_CACHES`) is discarded.
+        The same happens when d is reassigned (see `_Distance`).
+
+        >>> lincode = LinearCode(G=Matrix([[1, 1, 1]]), H=Matrix([[1, 1, 0], [1, 0, 1]]), n=3, k=1)
+        >>> lincode.code_parameters.d, lincode.decodify_detect("111")
+        (3, '1')
+        >>> lincode.G, lincode.H = Matrix([[1, 1, 0]]), Matrix([[1, 1, 0], [0, 0, 1]])
+        >>> lincode._d is None, lincode.code_parameters.d, lincode.decodify_detect("110")
+        (True, 2, '1')
+        >>> lincode = LC_Solver.solve(Matrix([[1, 1, 1, 1, 1]]), verbose=False)
+        >>> len(lincode.syndrome_table())
+        15
+        >>> lincode.d = 1
+        >>> len(lincode.syndrome_table()), lincode.distance_bounds()
+        (0, (1, 1))
+        """
+        object.__setattr__(self, name, value)
+        if name in ("G", "H"):
+            self._discard_caches()
+
+    def _discard_caches(self):
+        """
+        Discards everything computed from G, H and d (see `_CACHES`).
+        """
+        for cache in self._CACHES:
+            object.__setattr__(self, cache, None)
+
+    def _field_value(self, name: str):
+        """
+        Returns the value of a field, with `_d` as the value of d (so it is not computed).
+        """
+        return self._d if name == "d" else getattr(self, name)
+
+    def __repr__(self) -> str:
+        """
+        Representation of the code, as the one of the dataclass, but without computing d.
+
+        >>> LinearCode(n=3, k=1)
+        LinearCode(G=None, H=None, n=3, k=1, M=None, d=None, code_elements=None)
+        """
+        values = ", ".join(f"{f.name}={self._field_value(f.name)!r}" for f in fields(self) if f.repr)
+        return f"{type(self).__qualname__}({values})"
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares two codes field by field, as the dataclass does, but without computing d.
+
+        >>> LinearCode(n=3, d=2) == LinearCode(n=3, d=2), LinearCode(n=3, d=2) == LinearCode(n=3)
+        (True, False)
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(self._field_value(f.name) == other._field_value(f.name) for f in fields(self) if f.compare)
+
     def get_code_elements(self) -> dict[str,str]:
         """
         Generates and returns a dictionary corresponding to the code elements (codewords) of the linear code.
@@ -60,17 +228,171 @@ class LinearCode:
             return self.code_elements
 
         blocs = list(itertools.product([0, 1], repeat = self.k))
-        elements = {}
+        # Tots els missatges es codifiquen amb un sol producte (vegeu `Backend.multiply()`)
+        codes = Backend.multiply(BitMatrix(blocs), self.G)
 
-        for bloc in blocs:
-            bloc_matrix = Matrix([list(bloc)])
-            code_element = bloc_matrix * self.G % 2
-            elements[str(code_element)] = bloc
+        elements = {}
+        for bloc, code_element in zip(blocs, codes.pack_rows()):
+            elements[str(Matrix([Row.unpack(code_element, codes.shape[1])]))] = bloc
 
         self.code_elements = elements
 
         return elements
 
+    @staticmethod
+    def _xor_tables(vectors: list[int]) -> list[list[int]]:
+        """
+        Precomputes, for each byte of a packed word, a 256-entry table with the XOR
+        of the vectors selected by the bits of that byte.
+
+        `vectors[j]` is the vector selected by the j-th bit of the word (the first bit
+        being the most significant one). Therefore, the XOR of the vectors selected by
+        a word is obtained with one lookup per byte.
+
+        :param vectors: Packed vectors, one per bit of the word.
+        :return: A list with one table per byte, the least significant byte first.
+
+        >>> tables = LinearCode._xor_tables([4, 2, 1])
+        >>> len(tables), tables[0][0b101], tables[0][0b111]
+        (1, 5, 7)
+        >>> tables = LinearCode._xor_tables(list(range(1, 11)))
+        >>> len(tables), tables[1][0b11]
+        (2, 3)
+        """
+        n = len(vectors)
+        tables = []
+        for byte in range(0, n, 8):
+            # Vectors seleccionats per cada bit del byte (el bit 0 del word és l'últim vector)
+            selected = [vectors[n-1-bit] if bit < n else 0 for bit in range(byte, byte+8)]
+            table = [0] * 256
+            for value in range(1, 256):
+                lowest = value & -value
+                table[value] = table[value ^ lowest] ^ selected[lowest.bit_length()-1]
+            tables.append(table)
+        return tables
+
+    def syndrome(self, word: int) -> int:
+        """
+        Computes the syndrome H·y^t of a packed received block y (see `Row.pack()`).
+
+        The syndrome is the XOR of the columns of H at the positions of the bits set in y.
+        These XORs are precomputed the first time for each byte of the block, so each
+        syndrome costs n/8 table lookups. If H is a `SparseMatrix`, the syndrome is computed
+        from its ones instead (see `SparseMatrix.syndrome()`).
+
+        :param word: Received block packed as an integer.
+        :return: The syndrome packed as an integer, the first row of H being the most significant bit.
+
+        >>> lincode = LinearCode(H=Matrix([[0,1,0,1,1,0], [1,0,0,0,1,1], [0,1,1,0,1,1], [0,0,0,0,1,1]]))
+        >>> lincode.syndrome(0b011100)
+        0
+        >>> bin(lincode.syndrome(0b011110))
+        '0b1111'
+        """
+        if isinstance(self.H, SparseMatrix):
+            return self.H.syndrome(word)
+        if self._syndrome_tables is None:
+            self._syndrome_tables = self._xor_tables(self.H.pack_columns())
+
+        syndrome = 0
+        for table in self._syndrome_tables:
+            syndrome ^= table[word & 0xFF]
+            word >>= 8
+        return syndrome
+
+    def _packed_code_elements(self) -> dict[int, tuple]:
+        """
+        Same as `get_code_elements()`, but the codewords (keys) are packed as integers.
+
+        >>> lincode = LinearCode(G=Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]]), k=2)
+        >>> lincode._packed_code_elements()[0b011011]
+        (0, 1)
+        """
+        if self._packed_elements is None:
+            self._packed_elements = {int(key[1:-1].replace(" ", ""), 2): bloc
+                                     for key, bloc in self.get_code_elements().items()}
+        return self._packed_elements
+
+    @staticmethod
+    def _interleave_groups(blocks: int, depth: int) -> list[int]:
+        """
+        Returns the number of blocks of each group of the block interleaver (see `_interleave()`):
+        `depth` blocks, except the last group, which also takes the remaining blocks so it is not
+        shorter than the others. Only with fewer than `depth` blocks in all, there is a shorter group.
+
+        >>> LinearCode._interleave_groups(7, 3), LinearCode._interleave_groups(6, 3), LinearCode._interleave_groups(2, 3)
+        ([3, 4], [3, 3], [2])
+        """
+        if blocks <= depth:
+            return [blocks] if blocks else []
+        groups = [depth] * (blocks // depth)
+        groups[-1] += blocks % depth
+        return groups
+
+    @staticmethod
+    def _interleave(bits: list[int] | str, size: int, depth: int, inverse: bool = False) -> str:
+        """
+        Block interleaver: the blocks of `size` bits are grouped `depth` at a time, and each
+        group is sent by columns (the first bit of every block, then the second one...), so a
+        burst of up to `depth` errors hits each block at most once. The remaining blocks join
+        the last group (see `_interleave_groups()`), so the burst protection holds up to the
+        last block, unless there are fewer than `depth` blocks in all.
+
+        Each group is transposed with slices with a step of the bit string, without splitting
+        it into blocks.
+
+        :param bits: List of bits or string of bits, of a length multiple of `size`.
+        :param size: The size of each block.
+        :param depth: Number of interleaved blocks.
+        :param inverse: If True, the bits are deinterleaved.
+        :return: The string of interleaved (or deinterleaved) bits.
+
+        >>> LinearCode._interleave("111000101", 3, 2)
+        '101100101'
+        >>> LinearCode._interleave("101100101", 3, 2, inverse=True)
+        '111000101'
+        """
+        if not isinstance(bits, str):
+            bits = "".join(map(str, bits))
+        columns = []
+        start = 0
+        for blocks in LinearCode._interleave_groups(len(bits) // size, depth):
+            chunk = bits[start:start + blocks * size]
+            start += blocks * size
+            # Transposició del grup: la columna j és la subcadena amb salt igual al nombre de columnes
+            step = blocks if inverse else size
+            columns.extend(chunk[j::step] for j in range(step))
+        return "".join(columns)
+
+    def _split_bits_in_words(self, bits: list[int] | str, size: int, depth: int = 1) -> Generator[int, None, None]:
+        """
+        Splits a list (or string) of bits into blocks of a specified size, packed as integers.
+
+        :param bits: List of bits or string of bits to be split into blocks.
+        :param size: The size of each block.
+        :param depth: If greater than 1, the bits are deinterleaved first (see `_interleave()`).
+        :return: A generator that yields each block packed as an integer.
+
+        >>> code = LinearCode(n=3)
+        >>> list(code._split_bits_in_words("101100", 3))
+        [5, 4]
+        >>> list(code._split_bits_in_words("110010", 3, depth=2))
+        [5, 4]
+        >>> list(code._split_bits_in_words([1, 0, 1], 2))
+        Traceback (most recent call last):
+            ...
+        ValueError: Length of bits (3) and block size (2) do not match
+        """
+        if not isinstance(bits, str):
+            bits = "".join(map(str, bits))
+        if len(bits) % size != 0:
+            raise ValueError(f"Length of bits ({len(bits)}) and block size ({size}) do not match")
+        if depth > 1:
+            bits = self._interleave(bits, size, depth, inverse=True)
+
+        for block in range(0, len(bits), size):
+            yield int(bits[block:block+size], 2)
+
     def _split_bits_in_blocks(self, bits: list[int], size: int) -> Generator[Matrix, None, None]:
         """
         Splits a list of bits into blocks of a specified size.
@@ -95,10 +417,63 @@ class LinearCode:
         for block in range(0, len(bits), size):
             yield Matrix([bits[block:block+size]])
 
-    def parameters(self):
+    @property
+    def code_parameters(self) -> CodeParameters:
+        """
+        Parameters of the Linear Code, computed from G and H (and d) the first time, without
+        printing nor modifying the attributes of the code. The record is discarded if G or H
+        are reassigned.
+
+        For codes with k <= 16, the weight distribution is computed too (enumerating the
+        codewords in Gray code order, with one XOR each), and d is taken from it.
+
+        >>> code = LinearCode(G=Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]]),
+        ...                   H=Matrix([[0,1,0,1,1,0], [1,0,0,0,1,1], [0,1,1,0,1,1], [0,0,0,0,1,1]]))
+        >>> params = code.code_parameters
+        >>> params.n, params.k, params.M, params.d, params.correction, params.weight_distribution
+        (6, 2, 4, 3, 1, (1, 0, 0, 2, 1, 0, 0))
+        >>> code.code_parameters is params, code.n
+        (True, None)
+        """
+        if self._code_parameters is None:
+            if self.G is None or self.H is None:
+                raise ValueError("Either G or H matrix have not been defined")
+
+            k, n = self.G.shape
+            distribution = self._weight_distribution() if k <= 16 else None
+            if self._d is None and distribution is not None:
+                # La distància és el pes mínim de les paraules no nul·les
+                self._d = next((w for w in range(1, n + 1) if distribution[w]), n + 1)
+            self._code_parameters = CodeParameters.from_bounds(n, k, self.d, self.d, distribution)
+        return self._code_parameters
+
+    def _weight_distribution(self) -> tuple[int, ...]:
+        """
+        Returns the number of codewords of each weight (from 0 to n).
+
+        >>> HammingCode(t=3)._weight_distribution()
+        (1, 0, 0, 7, 7, 0, 0, 1)
+        """
+        k, n = self.G.shape
+        rows = self.G.pack_rows()
+        distribution = [0] * (n + 1)
+        distribution[0] = 1
+        word = 0
+        # Codi Gray: cada paraula difereix de l'anterior en una fila de G
+        for i in range(1, 2**k):
+            word ^= rows[(i & -i).bit_length() - 1]
+            distribution[word.bit_count()] += 1
+        return tuple(distribution)
+
+    def parameters(self, budget: float = None):
         """
         Prints the parameters of the Linear Code based on the generator matrix G,
-        the control matrix H, and other parameters.
+        the control matrix H, and other parameters (see `code_parameters` and `CodeParameters`),
+        and assigns n, k and M to the attributes of the code.
+
+        If a time `budget` (in seconds) is given and d is unknown, the bounds of d found within it are
+        printed instead (see `distance_bounds()`), and the detection and correction capabilities are
+        those guaranteed by the lower bound.
 
         >>> code = LinearCode(G=Matrix.eye(3), H=Matrix.eye(3), n=3, k=2, M=5, d=3)
         >>> code.parameters()
@@ -109,38 +484,46 @@ class LinearCode:
         - Delta (d): 3
         - Error Detection: 2
         - Error Correction: 1
+        >>> ham = LC_Solver.Hamming(12)
+        >>> ham.d = None
+        >>> ham.parameters(budget=0)
+        Linear Code Parameters:
+        - Code Length (n): 4095
+        - Code Dimension (k): 4083
+        - Code Size (M): 2^4083
+        - Delta (d): 1..3
+        - Error Detection: 0
+        - Error Correction: 0
         """
         if self.G is None or self.H is None:
             raise ValueError("Either G or H matrix have not been defined")
 
         # Maybe the LinearCode was not obtained through LC_Solver,
         # but instead created with lc = LinearCode(), lc.G = ... lc.H = ...
-        if self.d is None:
-            self.d = LC_Solver._min_hamming_distance(self.H)
+        if budget is not None and self._d is None and self._code_parameters is None:
+            lower, upper = self.distance_bounds(budget)
+            params = CodeParameters.from_bounds(self.G.shape[1], self.G.shape[0], lower, upper)
+        else:
+            params = self.code_parameters
 
-        self.k, self.n = self.G.shape
-        self.M = 2**self.k
-
-        e_detection = self.d - 1
-        e_correction = int((self.d - 1)/2)
+        self.k, self.n, self.M = params.k, params.n, params.M
+        print(params)
 
-        print("Linear Code Parameters:\n"
-            f"- Code Length (n): {self.n}\n"
-            f"- Code Dimension (k): {self.k}\n"
-            f"- Code Size (M): {self.M}\n"
-            f"- Delta (d): {self.d}\n"
-            f"- Error Detection: {e_detection}\n"
-            f"- Error Correction: {e_correction}")
 
-
-    def codify(self, bits: list[int] | str):
+    def codify(self, bits: list[int] | str, depth: int = 1):
         """
         Encodes a list of bits (or a bit string) into a linear code using the generator matrix G.
 
         The bits are split into blocks of size k, then each block is multiplied by the generator matrix
         G modulo 2, and the resulting encoded blocks are concatenated into the final encoded string.
+        With `depth` > 1, the encoded blocks are interleaved `depth` at a time (see `_interleave()`),
+        so bursts of up to `depth` errors are spread over different blocks; they must be decoded
+        with the same depth. The blocks left over join the last group, so the whole message is
+        protected, except when it has fewer than `depth` blocks: then bursts are only spread over
+        as many blocks as it has.
 
         :param bits: A list of bits or a string of bits to encode.
+        :param depth: Depth of the block interleaver (1 for no interleaving).
         :return: A string representing the encoded bits.
 
         >>> m1 = Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]])
@@ -154,17 +537,16 @@ class LinearCode:
         >>> lincode.d = 3
         >>> print(lincode.codify("10100111101001"))
         011100011100011011000111011100011100011011
+        >>> print(lincode.codify("10100111101001", depth=3))
+        000111111110001001000001110111111010011001
         """
-        if isinstance(bits, str):
-            bits = list(map(int, bits))
-        codes = []
-        for block in self._split_bits_in_blocks(bits, self.k):
-            code = block*self.G % 2
-            codes.append("".join(map(str, code[0].elements)))
-
-        return "".join(codes)
+        # Tots els blocs es codifiquen amb un sol producte, amb el backend triat per la mida
+        messages = BitMatrix(list(self._split_bits_in_words(bits, self.k)), self.k)
+        codes = Backend.multiply(messages, self.G)
+        coded = "".join(format(code, f"0{codes.shape[1]}b") for code in codes.pack_rows())
+        return self._interleave(coded, codes.shape[1], depth) if depth > 1 else coded
 
-    def decodify_detect(self, bits: list[int] | str):
+    def decodify_detect(self, bits: list[int] | str, depth: int = 1):
         """
         Decodes a list of bits (or a bit string) into the original message while detecting errors.
 
@@ -173,6 +555,7 @@ class LinearCode:
         with '?' symbols. Otherwise, the corresponding original message is retrieved.
 
         :param bits: A list of bits or a string of bits to decode.
+        :param depth: Depth of the block interleaver used to encode them (see `codify()`).
         :return: A string representing the decoded message, with '?' for erroneous blocks.
 
         >>> m1 = Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]])
@@ -188,19 +571,16 @@ class LinearCode:
         01000110100000
         """
 
-        if isinstance(bits, str):
-            bits = list(map(int, bits))
         msgs = []
-        for block in self._split_bits_in_blocks(bits, self.n):
-            sindrom = self.H*block.transpose() % 2
-            if sindrom:
+        for word in self._split_bits_in_words(bits, self.n, depth):
+            if self.syndrome(word):
                 msgs.append("?"*self.k)
             else:
-                msgs.append("".join(map(str, self.get_code_elements()[str(block)])))
+                msgs.append("".join(map(str, self._packed_code_elements()[word])))
 
         return "".join(msgs)
 
-    def decodify_correct(self, bits: list[int] | str):
+    def decodify_correct(self, bits: list[int] | str, complete: bool = False, depth: int = 1):
         """
         Decodes a list of bits (or a bit string) into the original message, correcting errors within the code's capacity.
 
@@ -208,7 +588,12 @@ class LinearCode:
         matrix H. If the syndrome indicates an error, it uses a precomputed syndrome table to correct it. Blocks with
         errors exceeding the code's capacity are marked with '?'.
 
+        With `complete=True`, the table contains a leader for every syndrome (see `syndrome_table()`),
+        so every block is corrected to its nearest codeword (maximum likelihood decoding).
+
         :param bits: A list of bits or a string of bits to decode.
+        :param complete: If True, the complete syndrome table is used.
+        :param depth: Depth of the block interleaver used to encode them (see `codify()`).
         :return: A string representing the decoded message, with '?' for uncorrectable blocks.
 
         >>> m1 = Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]])
@@ -222,34 +607,1288 @@ class LinearCode:
         >>> lincode.d = 3
         >>> print(lincode.decodify_correct("011011000010010011011110111100000000010000"))
         01000110100000
+        >>> print(lincode.decodify_correct("111111", complete=True))
+        01
+
+        An error burst of 3 bits, corrected thanks to the interleaving of depth 3:
+
+        >>> print(lincode.decodify_correct("000111000110001001000001110111111010011001", depth=3))
+        10100111101001
+        """
+        msgs = []
+        elements = self._packed_code_elements()
+        for word in self._split_bits_in_words(bits, self.n, depth):
+            correct = self._correct_word(word, complete)
+            if correct is None:
+                print(f"Warning! Block {[Row.unpack(word, self.n).elements]} has more errors than the linear code's correct capabilites")
+                msgs.append("?"*self.k)
+            else:
+                msgs.append("".join(map(str, elements[correct])))
+
+        return "".join(msgs)
+
+    def syndrome_table(self, complete: bool = False) -> dict[int, int]:
+        """
+        Computes the syndrome table: the leader (error of least weight) of each syndrome, for
+        the errors with a weight less than or equal to the correction capacity of the code or,
+        if `complete` is True, for every syndrome (complete standard array).
+
+        The leaders are found with a breadth-first search over the syndromes: starting from
+        the null syndrome, each leader of weight w is extended with one more error bit (adding
+        a column of H to its syndrome), and the syndromes not seen yet get a leader of weight
+        w + 1. This costs O(2^(n-k)·n) for the complete table, instead of enumerating all
+        the 2^n vectors.
+
+        The table is computed the first time, and stored for later use.
+
+        :param complete: If True, the leaders of all the syndromes are computed (maximum likelihood decoding).
+        :return: A dictionary where the keys are the syndromes and the values the leaders, both packed as integers.
+
+        >>> lincode = LinearCode(H=Matrix([[0,1,0,1,1,0], [1,0,0,0,1,1], [0,1,1,0,1,1], [0,0,0,0,1,1]]), n=6, d=3)
+        >>> table = lincode.syndrome_table()
+        >>> len(table), bin(table[0b0100])
+        (6, '0b100000')
+        >>> table = lincode.syndrome_table(complete=True)
+        >>> len(table), bin(table[0b1111])
+        (15, '0b10')
+        """
+        if self._leaders is None:
+            self._leaders = {}
+        if complete in self._leaders:
+            return self._leaders[complete]
+
+        # Amb la taula completa no hi ha límit de pes
+        max_weight = self.n if complete else int((self.d - 1) / 2)
+        columns = self.H.pack_columns()
+
+        # calcul de la taula de sindromes per corregir, per pesos creixents
+        taula_sindromes = {0: 0}
+        frontier = [(0, 0)]
+        for weight in range(max_weight):
+            next_frontier = []
+            for sindr, lider_e in frontier:
+                for pos, column in enumerate(columns):
+                    bit = 1 << (self.n - 1 - pos)
+                    if lider_e & bit:
+                        continue
+                    new_sindr = sindr ^ column
+                    if new_sindr not in taula_sindromes:
+                        taula_sindromes[new_sindr] = lider_e | bit
+                        next_frontier.append((new_sindr, lider_e | bit))
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        del taula_sindromes[0]
+        self._leaders[complete] = taula_sindromes
+        return taula_sindromes
+
+    def _correct_word(self, word: int, complete: bool = False) -> int | None:
+        """
+        Corrects a packed block with the syndrome table.
+
+        :param word: Received block packed as an integer.
+        :param complete: If True, the complete syndrome table is used (see `syndrome_table()`).
+        :return: The corrected block, or None if it has more errors than the correction capacity.
+
+        >>> lincode = LinearCode(H=Matrix([[0,1,0,1,1,0], [1,0,0,0,1,1], [0,1,1,0,1,1], [0,0,0,0,1,1]]), n=6, d=3)
+        >>> bin(lincode._correct_word(0b011110))
+        '0b11100'
+        >>> lincode._correct_word(0b111111) is None
+        True
+        >>> bin(lincode._correct_word(0b111111, complete=True))
+        '0b11011'
+        """
+        sindrom = self.syndrome(word)
+        if not sindrom:
+            return word
+        error = self.syndrome_table(complete).get(sindrom)
+        if error is None:
+            return None
+        # En F2, restar el líder és fer XOR
+        return word ^ error
+
+    def _decode_word(self, word: int) -> int:
+        """
+        Returns the packed message of a packed codeword.
+
+        The rows of G, augmented with the identity (see `_isd_rows()`), are reduced once with
+        `LC_Solver._packed_rref()`: the codeword is the combination of the reduced rows selected
+        by its bits at the pivot columns, and the augmented part of this combination is its
+        message. So the elements of the code are not needed.
+
+        >>> lincode = LinearCode(G=Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]]), n=6, k=2)
+        >>> bin(lincode._decode_word(0b011100))
+        '0b10'
+        >>> bin(lincode._decode_word(0b000111))
+        '0b11'
         """
-        if isinstance(bits, str):
-            bits = list(map(int, bits))
+        if self._message_rows is None:
+            self._message_rows = LC_Solver._packed_rref(self._isd_rows(), self.n + self.k)
 
+        rows, pivots = self._message_rows
+        message = 0
+        for row, pivot in zip(rows, pivots):
+            if (word >> (self.n - 1 - pivot)) & 1:
+                message ^= row
+        return message & ((1 << self.k) - 1)
+
+    def _information_positions(self) -> list[int]:
+        """
+        Returns, for each message bit, a position of the codewords which holds it unchanged
+        (that is, a column of G which is a unit vector), or an empty list if G has none.
+
+        >>> lincode = LinearCode(G=Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]]), k=2)
+        >>> lincode._information_positions()
+        [3, 4]
+        """
+        if self._info_positions is None:
+            columns = self.G.pack_columns()
+            positions = []
+            for bit in range(self.k):
+                unit = 1 << (self.k - 1 - bit)
+                if unit not in columns:
+                    positions = []
+                    break
+                positions.append(columns.index(unit))
+            self._info_positions = positions
+        return self._info_positions
+
+    def decodify_sliced(self, bits: list[int] | str, correct: bool = True, width: int = 256, complete: bool = False,
+                        depth: int = 1) -> str:
+        """
+        Decodes a list of bits (or a bit string) processing `width` blocks at a time, bit-sliced.
+
+        The blocks are transposed into n bit-planes (the plane j holds the j-th bit of every
+        block, packed as an integer), so each syndrome bit of all the blocks is the XOR of the
+        planes selected by a row of H. A block has an error if any of its syndrome bits is 1.
+        If the code corrects at least one error, the single errors are corrected with word-wide
+        logic: the error is at the position j of the blocks whose syndrome equals the column j
+        of H. The remaining erroneous blocks (if any) are corrected one by one with
+        `_correct_word()`. Finally, the message is read from the planes of the information
+        positions (see `_information_positions()`), or from the code elements otherwise.
+
+        As the planes are Python integers, `width` is not limited to the size of a machine word.
+
+        A group of interleaved blocks (see `_interleave()`) is already sent by bit-planes, so with
+        `depth` > 1 the blocks are processed a group at a time, and each plane is read directly
+        from a slice of the bits, without transposing them.
+
+        :param bits: A list of bits or a string of bits to decode.
+        :param correct: If False, errors are only detected (as in `decodify_detect()`).
+        :param width: Number of blocks processed at a time (the width of the bit-planes).
+        :param complete: If True, the remaining blocks are corrected with the complete syndrome table.
+        :param depth: Depth of the block interleaver used to encode them (see `codify()`). If greater than 1, it replaces `width`.
+        :return: A string representing the decoded message, with '?' for erroneous (or uncorrectable) blocks.
+
+        >>> m1 = Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]])
+        >>> m2 = Matrix([[0,1,0,1,1,0], [1,0,0,0,1,1], [0,1,1,0,1,1], [0,0,0,0,1,1]])
+        >>> lincode = LinearCode(G=m1, H=m2, n=6, k=2, M=4, d=3)
+        >>> print(lincode.decodify_sliced("011011000010010011011110111100000000010000"))
+        01000110100000
+        >>> print(lincode.decodify_sliced("011011000000011011011100011100000000000000", correct=False))
+        01000110100000
+        >>> print(lincode.decodify_sliced("011011000010010011011110111100000000010000", correct=False, width=3))
+        01????????00??
+        >>> print(lincode.decodify_sliced("000111000110001001000001110111111010011001", depth=3))
+        10100111101001
+        """
+        if not isinstance(bits, str):
+            bits = "".join(map(str, bits))
+        if len(bits) % self.n != 0:
+            raise ValueError(f"Length of bits ({len(bits)}) and block size ({self.n}) do not match")
+
+        n = self.n
+        total = len(bits) // n
+        if depth > 1:
+            groups = self._interleave_groups(total, depth)
+        else:
+            groups = [min(width, total - first) for first in range(0, total, width)]
         msgs = []
-        correct_capacity = int((self.d - 1) / 2)
-
-        # calcul de la taula de sindromes per corregir
-        liders_e = (list(error) for error in itertools.product([0, 1], repeat=self.n) if 0 < sum(error) <= correct_capacity) # erros menors que cap. corr
-        taula_sindromes = {}
-        for lider_e in liders_e: # calcula taula de síndromes
-            lider_e_matrix = Matrix([list(lider_e)])
-            sindr = self.H * lider_e_matrix.transpose() % 2
-            taula_sindromes[str(sindr)] = lider_e_matrix
-
-        for block in self._split_bits_in_blocks(bits, self.n):
-            sindrom = self.H*block.transpose() % 2
-            if sindrom:
-                error = taula_sindromes.get(str(sindrom))
-                if error is None:
-                    print(f"Warning! Block {block} has more errors than the linear code's correct capabilites")
-                    msgs.append("?"*self.k)
-                else:
-                    correct = (block - error) % 2
-                    msgs.append("".join(map(str, self.get_code_elements()[str(correct)])))
+        start = 0
+        for blocks in groups:
+            chunk = bits[start:start + blocks * n]
+            start += blocks * n
+            if depth > 1:
+                # Blocs entrellaçats: el pla j són els bits j*blocs..(j+1)*blocs
+                planes = [int(chunk[j * blocks:(j + 1) * blocks], 2) for j in range(n)]
+            else:
+                # Plans de bits: el pla j té el bit j de cada bloc (el primer bloc és el bit més significatiu)
+                planes = [int(chunk[j::n], 2) for j in range(n)]
+
+            failed = self._correct_planes(planes, blocks, correct, complete)
+            rows = [format(plane, f"0{blocks}b") for plane in self._message_planes(planes, blocks)]
+            decoded = list(map("".join, zip(*rows))) if rows else [""] * blocks
+            while failed:
+                lowest = failed & -failed
+                failed ^= lowest
+                decoded[blocks - lowest.bit_length()] = "?"*self.k
+            msgs.extend(decoded)
+
+        return "".join(msgs)
+
+    def _correct_planes(self, planes: list[int], blocks: int, correct: bool = True, complete: bool = False,
+                        verbose: bool = True) -> int:
+        """
+        Corrects in place the bit-planes of `blocks` blocks (see `decodify_sliced()`).
+
+        The syndrome bits of all the blocks are XORs of planes, the single errors are corrected
+        with word-wide logic, and the remaining erroneous blocks one by one with `_correct_word()`.
+
+        :param planes: The n bit-planes (the first block being the most significant bit). They are modified.
+        :param blocks: Number of blocks in the planes.
+        :param correct: If False, errors are only detected.
+        :param complete: If True, the remaining blocks are corrected with the complete syndrome table.
+        :param verbose: If True, a warning is printed for each block that could not be corrected.
+        :return: The mask of the blocks (with the same layout as the planes) that could not be corrected.
+
+        >>> lincode = LinearCode(G=Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]]),
+        ...                      H=Matrix([[0,1,0,1,1,0], [1,0,0,0,1,1], [0,1,1,0,1,1], [0,0,0,0,1,1]]), n=6, k=2, d=3)
+        >>> planes = [0b00, 0b11, 0b11, 0b10, 0b00, 0b00]
+        >>> bin(lincode._correct_planes(planes, 2)), planes
+        ('0b0', [0, 3, 3, 3, 0, 0])
+        """
+        n = self.n
+        h_rows = self.H.pack_rows()
+        h_columns = self.H.pack_columns()
+        # Una columna de H per fila: bit més significatiu = primera fila
+        m = len(h_rows)
+        single_errors = correct and int((self.d - 1) / 2) >= 1
+        ones = (1 << blocks) - 1
+
+        # Síndromes: el bit i de tots els blocs és la XOR dels plans seleccionats per la fila i de H
+        syndromes = []
+        for row in h_rows:
+            acc = 0
+            while row:
+                lowest = row & -row
+                acc ^= planes[n - lowest.bit_length()]
+                row ^= lowest
+            syndromes.append(acc)
+
+        errors = 0
+        for syndrome in syndromes:
+            errors |= syndrome
+
+        unresolved = errors
+        if single_errors and errors:
+            complements = [syndrome ^ ones for syndrome in syndromes]
+            for pos, column in enumerate(h_columns):
+                # Blocs el síndrome dels quals és igual a la columna `pos`
+                flip = errors
+                for i in range(m):
+                    flip &= syndromes[i] if (column >> (m - 1 - i)) & 1 else complements[i]
+                    if not flip:
+                        break
+                if flip:
+                    planes[pos] ^= flip
+                    unresolved &= ~flip
+
+        # Blocs que no s'han pogut corregir amb els plans: un a un
+        failed = 0
+        while unresolved:
+            lowest = unresolved & -unresolved
+            unresolved ^= lowest
+            shift = lowest.bit_length() - 1
+            word = 0
+            for plane in planes:
+                word = (word << 1) | ((plane >> shift) & 1)
+            corrected = self._correct_word(word, complete) if correct else None
+            if corrected is None:
+                if correct and verbose:
+                    print(f"Warning! Block {[Row.unpack(word, n).elements]} has more errors than the linear code's correct capabilites")
+                failed |= lowest
+            else:
+                error = word ^ corrected
+                while error:
+                    bit = error & -error
+                    error ^= bit
+                    planes[n - bit.bit_length()] ^= lowest
+        return failed
+
+    def _message_planes(self, planes: list[int], blocks: int) -> list[int]:
+        """
+        Returns the k bit-planes of the messages of the codewords held in the n bit-planes.
+
+        The messages are read from the planes of the information positions (see
+        `_information_positions()`), or decoded one by one otherwise.
+
+        >>> lincode = LinearCode(G=Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]]), n=6, k=2)
+        >>> lincode._message_planes([0, 3, 3, 3, 0, 0], 2)
+        [3, 0]
+        """
+        positions = self._information_positions()
+        if positions:
+            # El missatge de tots els blocs és als plans de les posicions d'informació
+            return [planes[pos] for pos in positions]
+        words = BitMatrix(planes, blocks).pack_columns()
+        return BitMatrix([self._decode_word(word) for word in words], self.k).pack_columns()
+
+    def _isd_rows(self) -> list[int]:
+        """
+        Returns the rows of G packed and augmented with the identity: the row i is
+        (G[i]|e_i), so that the eliminations keep track of the message of each row.
+
+        >>> lincode = LinearCode(G=Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]]), n=6, k=2)
+        >>> [bin(row) for row in lincode._isd_rows()]
+        ['0b1110010', '0b1101101']
+        """
+        return [(row << self.k) | (1 << (self.k - 1 - i)) for i, row in enumerate(self.G.pack_rows())]
+
+    def _isd_word(self, word: int, rows: list[int], iterations: int, p: int, weight: int, rng: random.Random) -> int | None:
+        """
+        Information-set decoding of a packed block (Prange, or Lee-Brickell if p > 0).
+
+        In each iteration a random information set is chosen: the augmented rows of G
+        (see `_isd_rows()`) are reduced with `LC_Solver._packed_rref()` following a random
+        order of the columns, so that the k pivot columns form an identity. If the block has
+        no errors in those positions, the combination of the rows selected by its bits there
+        is the nearest codeword, and the augmented part is its message. With Lee-Brickell,
+        up to p of those bits are also flipped.
+
+        :param word: Received block packed as an integer.
+        :param rows: Augmented rows of G, from `_isd_rows()`.
+        :param iterations: Maximum number of information sets tried.
+        :param p: Maximum number of errors allowed in the information set.
+        :param weight: Maximum weight of the error to accept a codeword.
+        :param rng: Random generator used to choose the information sets.
+        :return: The packed message, or None if no codeword has been found within the budget.
+
+        >>> ham = HammingCode(t=3)
+        >>> rows = ham._isd_rows()
+        >>> bin(ham._isd_word(0b1010101 ^ 0b100, rows, 100, 0, 1, random.Random(0)))
+        '0b1011'
+        >>> ham._isd_word(0b1010101 ^ 0b11, rows, 100, 0, 0, random.Random(0)) is None
+        True
+        """
+        n, k = self.n, self.k
+        width = n + k
+        positions = list(range(n))
+        for _ in range(iterations):
+            rng.shuffle(positions)
+            reduced, pivots = LC_Solver._packed_rref(rows, width, positions)
+
+            # Paraula del codi que coincideix amb el bloc a les posicions d'informació
+            base = 0
+            for row, pivot in zip(reduced, pivots):
+                if (word >> (n - 1 - pivot)) & 1:
+                    base ^= row
+
+            for size in range(min(p, len(pivots)) + 1):
+                for flips in combinations(reduced[:len(pivots)], size):
+                    candidate = base
+                    for row in flips:
+                        candidate ^= row
+                    if (word ^ (candidate >> k)).bit_count() <= weight:
+                        return candidate & ((1 << k) - 1)
+        return None
+
+    def decodify_isd(self, bits: list[int] | str, iterations: int = 1000, p: int = 0, weight: int = None,
+                     processes: int = 1, seed: int = None) -> str:
+        """
+        Decodes a list of bits (or a bit string) with information-set decoding (see `_isd_word()`).
+
+        Unlike `decodify_correct()`, no syndrome table (nor code elements) is needed, so it can
+        decode codes with a large n - k. Each block is corrected to a codeword at distance at
+        most `weight`, if one is found within `iterations` information sets; otherwise it is
+        marked with '?'.
+
+        :param bits: A list of bits or a string of bits to decode.
+        :param iterations: Maximum number of information sets tried for each block.
+        :param p: Number of errors allowed in the information set (0 for Prange, 1 or 2 for Lee-Brickell).
+        :param weight: Maximum weight of the errors to correct (by default, the correction capacity of the code).
+        :param processes: Number of processes used to decode the blocks in parallel.
+        :param seed: Seed of the random information sets, to get reproducible results.
+        :return: A string representing the decoded message, with '?' for undecoded blocks.
+
+        >>> ham = HammingCode(t=4)
+        >>> bits = ham.codify("10110011100" * 3)
+        >>> noisy = bits[:5] + str(1 - int(bits[5])) + bits[6:20] + str(1 - int(bits[20])) + bits[21:]
+        >>> ham.decodify_isd(noisy, seed=1) == "10110011100" * 3
+        True
+        >>> ham.decodify_isd(noisy, seed=1, processes=2) == "10110011100" * 3
+        True
+        >>> LinearCode.decodify_isd(ham, bits[:15], weight=0, seed=1)
+        '10110011100'
+        """
+        if weight is None:
+            if self._d is None:
+                raise ValueError("The weight of the errors must be given if the distance of the code is unknown")
+            weight = int((self.d - 1) / 2)
+
+        rows = self._isd_rows()
+        words = list(self._split_bits_in_words(bits, self.n))
+        tasks = [(word, index) for index, word in enumerate(words)]
+
+        state = (self, rows, iterations, p, weight, seed)
+        if processes > 1 and len(words) > 1:
+            with Pool(processes, initializer=_isd_init, initargs=(state,)) as pool:
+                messages = pool.map(_isd_worker, tasks, chunksize=max(1, len(tasks) // (4 * processes)))
+        else:
+            _isd_init(state)
+            messages = list(map(_isd_worker, tasks))
+
+        msgs = []
+        for word, message in zip(words, messages):
+            if message is None:
+                print(f"Warning! Block {[Row.unpack(word, self.n).elements]} has more errors than the linear code's correct capabilites")
+                msgs.append("?"*self.k)
+            else:
+                msgs.append(format(message, f"0{self.k}b"))
+        return "".join(msgs)
+
+    def _sparse_H(self) -> SparseMatrix:
+        """
+        Returns H as a `SparseMatrix` (converted the first time, if it is dense).
+
+        >>> LinearCode(H=Matrix([[1, 0, 1], [0, 1, 1]]))._sparse_H().row_indices
+        [[0, 2], [1, 2]]
+        """
+        if self._sparse_h is None:
+            self._sparse_h = SparseMatrix.from_matrix(self.H)
+        return self._sparse_h
+
+    def _bitflip_word(self, word: int, iterations: int) -> int | None:
+        """
+        Corrects a packed block with Gallager's bit-flipping algorithm.
+
+        In each iteration, the bits involved in the largest number of unsatisfied checks
+        (rows of H whose parity is 1) are flipped, until all the checks are satisfied.
+        The checks of each bit are found with the column adjacency of the sparse H, so each
+        iteration costs a time proportional to the number of ones of H.
+
+        :param word: Received block packed as an integer.
+        :param iterations: Maximum number of iterations.
+        :return: The corrected block, or None if it has not converged to a codeword.
+
+        >>> ham = HammingCode(t=3)
+        >>> bin(ham._bitflip_word(0b1010101 ^ 0b100, 10))
+        '0b1010101'
+        """
+        H = self._sparse_H()
+        bits = [bit == "1" for bit in format(word, f"0{self.n}b")]
+        checks = [sum(bits[c] for c in row) & 1 for row in H.row_indices]
+
+        for _ in range(iterations):
+            if not any(checks):
+                break
+            unsatisfied = [sum(checks[r] for r in column) for column in H.column_indices]
+            worst = max(unsatisfied)
+            for v, count in enumerate(unsatisfied):
+                if count == worst:
+                    bits[v] ^= True
+                    for r in H.column_indices[v]:
+                        checks[r] ^= 1
+
+        if any(checks):
+            return None
+        return int("".join("1" if bit else "0" for bit in bits), 2)
+
+    def _minsum_word(self, llrs: list[float], iterations: int) -> int | None:
+        """
+        Corrects a block with the min-sum (belief propagation) algorithm.
+
+        Each bit starts with its log-likelihood ratio (positive if it is more likely a 0).
+        In each iteration, each check (row of H) sends to each of its bits the product of
+        the signs and the minimum of the magnitudes of the messages of its other bits, and
+        each bit sends back its total (its own ratio plus the messages of its checks) minus
+        the message received from that check. The hard decision of the totals is taken
+        as soon as it satisfies all the checks.
+
+        :param llrs: Log-likelihood ratio of each bit of the block.
+        :param iterations: Maximum number of iterations.
+        :return: The corrected block, or None if it has not converged to a codeword.
+
+        >>> ham = HammingCode(t=3)
+        >>> bin(ham._minsum_word([-1.0, 1.0, -1.0, 1.0, -1.0, 1.0, 0.2], 10))
+        '0b1010101'
+        """
+        rows = self._sparse_H().row_indices
+        # Missatges dels bits cap a cada check, i dels checks cap a cada bit
+        to_checks = [[llrs[v] for v in row] for row in rows]
+        to_bits = [[0.0] * len(row) for row in rows]
+
+        totals = list(llrs)
+        for iteration in range(iterations + 1):
+            hard = [total < 0 for total in totals]
+            if not any(sum(hard[v] for v in row) & 1 for row in rows):
+                return int("".join("1" if bit else "0" for bit in hard), 2)
+            if iteration == iterations:
+                break
+
+            for messages, answers in zip(to_checks, to_bits):
+                sign, min1, min2, argmin = 1, float("inf"), float("inf"), -1
+                for i, message in enumerate(messages):
+                    if message < 0:
+                        sign = -sign
+                    magnitude = abs(message)
+                    if magnitude < min1:
+                        min1, min2, argmin = magnitude, min1, i
+                    elif magnitude < min2:
+                        min2 = magnitude
+                for i, message in enumerate(messages):
+                    magnitude = min2 if i == argmin else min1
+                    answers[i] = magnitude * (sign if message >= 0 else -sign)
+
+            totals = list(llrs)
+            for row, answers in zip(rows, to_bits):
+                for v, answer in zip(row, answers):
+                    totals[v] += answer
+            for row, messages, answers in zip(rows, to_checks, to_bits):
+                for i, v in enumerate(row):
+                    messages[i] = totals[v] - answers[i]
+        return None
+
+    def _join_messages(self, words: list[int], corrected: list[int | None]) -> str:
+        """
+        Joins the messages of the corrected blocks, with '?' (and a warning) for the
+        blocks that could not be corrected.
+
+        >>> lincode = LinearCode(G=Matrix([[0,1,1,1,0,0],[0,1,1,0,1,1]]), n=6, k=2)
+        >>> lincode._join_messages([0b011100, 0b111111], [0b011100, None])
+        Warning! Block [[1, 1, 1, 1, 1, 1]] has more errors than the linear code's correct capabilites
+        '10??'
+        """
+        msgs = []
+        for word, correct in zip(words, corrected):
+            if correct is None:
+                print(f"Warning! Block {[Row.unpack(word, self.n).elements]} has more errors than the linear code's correct capabilites")
+                msgs.append("?"*self.k)
             else:
-                msgs.append("".join(map(str, self.get_code_elements()[str(block)])))
+                msgs.append(format(self._decode_word(correct), f"0{self.k}b"))
+        return "".join(msgs)
 
+    def decodify_bitflip(self, bits: list[int] | str, iterations: int = 50) -> str:
+        """
+        Decodes a list of bits (or a bit string) correcting each block with bit-flipping
+        (see `_bitflip_word()`), for codes with a sparse H (LDPC codes).
+
+        Neither the syndrome table nor the code elements are needed. H can be a
+        `SparseMatrix` (or it is converted once).
+
+        :param bits: A list of bits or a string of bits to decode.
+        :param iterations: Maximum number of iterations for each block.
+        :return: A string representing the decoded message, with '?' for the blocks that have not converged.
+
+        >>> H = SparseMatrix([[0, 1, 2, 3], [2, 3, 4, 5], [4, 5, 6, 7], [6, 7, 0, 1], [0, 2, 4, 6]], 8)
+        >>> G = LC_Solver.calculate_H(H.to_matrix(), verbose=False)
+        >>> ldpc = LinearCode(G=G, H=H, n=8, k=G.shape[0])
+        >>> ldpc.codify("0010")
+        '10101010'
+        >>> ldpc.decodify_bitflip("10111010")
+        '0010'
+        """
+        words = list(self._split_bits_in_words(bits, self.n))
+        return self._join_messages(words, [self._bitflip_word(word, iterations) for word in words])
+
+    def decodify_minsum(self, bits: list[int] | list[float] | str, iterations: int = 50) -> str:
+        """
+        Decodes a list of bits (or a bit string) correcting each block with min-sum belief
+        propagation (see `_minsum_word()`), for codes with a sparse H (LDPC codes).
+
+        The input can also be soft: a list of floats with the log-likelihood ratio of each
+        bit (positive if it is more likely a 0), as given by the channel. The bits are
+        taken as ratios of +1 (for 0) and -1 (for 1).
+
+        :param bits: A list of bits, a string of bits, or a list of log-likelihood ratios.
+        :param iterations: Maximum number of iterations for each block.
+        :return: A string representing the decoded message, with '?' for the blocks that have not converged.
+
+        >>> H = SparseMatrix([[0, 1, 2, 3], [2, 3, 4, 5], [4, 5, 6, 7], [6, 7, 0, 1], [0, 2, 4, 6]], 8)
+        >>> G = LC_Solver.calculate_H(H.to_matrix(), verbose=False)
+        >>> ldpc = LinearCode(G=G, H=H, n=8, k=G.shape[0])
+        >>> ldpc.decodify_minsum([-0.9, -0.3, -1.1, 0.8, -1.2, 1.0, -0.7, 0.9])
+        '0010'
+        """
+        if isinstance(bits, str) or not any(isinstance(bit, float) for bit in bits):
+            llrs = [1.0 if int(bit) == 0 else -1.0 for bit in bits]
+        else:
+            llrs = list(bits)
+        if len(llrs) % self.n != 0:
+            raise ValueError(f"Length of bits ({len(llrs)}) and block size ({self.n}) do not match")
+
+        blocks = [llrs[i:i + self.n] for i in range(0, len(llrs), self.n)]
+        words = [int("".join("1" if llr < 0 else "0" for llr in block), 2) for block in blocks]
+        return self._join_messages(words, [self._minsum_word(block, iterations) for block in blocks])
+
+    def _erasure_solver(self, erased: tuple[int]) -> tuple[list[int], int] | None:
+        """
+        Reduces the columns of H at the erased positions, augmented with the identity, so
+        that the erased bits of any block are obtained from its syndrome.
+
+        Each row of the result is (H_E row | T row): the first rows have a pivot at an erased
+        position, whose bit is the parity of T row & syndrome; the remaining rows must have
+        a null parity with the syndrome for the system to be consistent.
+
+        :param erased: The erased positions of the blocks.
+        :return: The reduced rows and the number of pivots, or None if the erased columns of H are not independent.
+
+        >>> ham = HammingCode(t=3)
+        >>> rows, pivots = ham._erasure_solver((0, 1))
+        >>> [bin(row) for row in rows], pivots
+        (['0b10001', '0b1101', '0b110'], 2)
+        >>> ham._erasure_solver((0, 1, 2, 3)) is None
+        True
+        """
+        columns = self.H.pack_columns()
+        m = self.H.shape[0]
+        width = len(erased)
+        rows = []
+        for r in range(m):
+            row = 0
+            for pos in erased:
+                row = (row << 1) | ((columns[pos] >> (m - 1 - r)) & 1)
+            rows.append((row << m) | (1 << (m - 1 - r)))
+
+        reduced, pivots = LC_Solver._packed_rref(rows, width + m, range(width))
+        if len(pivots) < width:
+            return None
+        return reduced, len(pivots)
+
+    def decode_erasures(self, received: list[int] | str, erased_positions: list[int] | list[list[int]] = None) -> str:
+        """
+        Decodes a list of bits (or a bit string) where the positions of the missing bits
+        (erasures) are known, recovering up to d - 1 erasures per block (or more, if the
+        columns of H at the erased positions are independent).
+
+        The erased bits e of a block y satisfy H_E·e^t = H·y0^t, where H_E are the columns of H
+        at the erased positions and y0 is the block with the erased bits set to 0. This system
+        is solved with packed elimination (see `_erasure_solver()`), which is done once for each
+        different erasure pattern and reused for all the blocks that share it.
+
+        :param received: A list of bits or a string of bits to decode. The erased bits can have any value,
+                         or be given as '?' (or None in a list), in which case `erased_positions` is not needed.
+        :param erased_positions: The erased positions (from 0 to n-1) of every block, or a list with the erased positions of each block.
+        :raises ValueError: If an erased position is out of range(n), or there is not a list of positions for each block.
+        :return: A string representing the decoded message, with '?' for the blocks that cannot be recovered.
+
+        >>> ham = HammingCode(t=3)
+        >>> ham.codify("1011")
+        '1010101'
+        >>> ham.decode_erasures("0000101", [0, 2])
+        '1011'
+        >>> ham.decode_erasures("1??0101" "1?1?101", [[1, 2], [1, 3]])
+        '10111011'
+        >>> ham.decode_erasures("??1?101")
+        '1011'
+        >>> ham.decode_erasures("1010101", [])
+        '1011'
+        >>> ham.decode_erasures("1??0101" "1?1?101", [[1, 2]])
+        Traceback (most recent call last):
+            ...
+        ValueError: Number of erasure patterns (1) and blocks (2) do not match
+        >>> ham.decode_erasures("1??0101", [-1, 2])
+        Traceback (most recent call last):
+            ...
+        ValueError: Positions [-1] are out of range(7)
+        >>> ham.decode_erasures("1??0101" "1?1?101", [[1, 2], [3, 7]])
+        Traceback (most recent call last):
+            ...
+        ValueError: Positions [7] are out of range(7)
+        >>> ham.decode_erasures("????101")
+        Warning! Block [[0, 0, 0, 0, 1, 0, 1]] has more erasures than the linear code's recovery capabilites
+        '????'
+        """
+        if not isinstance(received, str):
+            received = "".join("?" if bit is None else str(bit) for bit in received)
+        if len(received) % self.n != 0:
+            raise ValueError(f"Length of bits ({len(received)}) and block size ({self.n}) do not match")
+
+        blocks = [received[i:i + self.n] for i in range(0, len(received), self.n)]
+        if erased_positions is None:
+            patterns = [tuple(pos for pos, bit in enumerate(block) if bit == "?") for block in blocks]
+        elif not erased_positions or isinstance(erased_positions[0], int):
+            # Les mateixes posicions a tots els blocs (cap esborrat, si la llista és buida)
+            patterns = [tuple(sorted(self._positions(erased_positions, self.n)))] * len(blocks)
+        else:
+            if len(erased_positions) != len(blocks):
+                raise ValueError(f"Number of erasure patterns ({len(erased_positions)}) and blocks ({len(blocks)}) do not match")
+            patterns = [tuple(sorted(self._positions(positions, self.n))) for positions in erased_positions]
+
+        # Una eliminació per patró d'esborrats, reutilitzada per tots els blocs que el comparteixen
+        solvers = {}
+        mask = (1 << self.H.shape[0]) - 1
+        words, corrected = [], []
+        for block, erased in zip(blocks, patterns):
+            word = int(block.replace("?", "0"), 2)
+            for pos in erased:
+                word &= ~(1 << (self.n - 1 - pos))
+            words.append(word)
+
+            if erased not in solvers:
+                solvers[erased] = self._erasure_solver(erased)
+            solver = solvers[erased]
+            if solver is None:
+                corrected.append(None)
+                continue
+
+            rows, pivots = solver
+            syndrome = self.syndrome(word)
+            if any((row & mask & syndrome).bit_count() & 1 for row in rows[pivots:]):
+                # Sistema incompatible: hi ha errors a més dels esborrats
+                corrected.append(None)
+                continue
+            for row, pos in zip(rows, erased):
+                if (row & mask & syndrome).bit_count() & 1:
+                    word |= 1 << (self.n - 1 - pos)
+            corrected.append(word)
+
+        msgs = []
+        for word, correct in zip(words, corrected):
+            if correct is None:
+                print(f"Warning! Block {[Row.unpack(word, self.n).elements]} has more erasures than the linear code's recovery capabilites")
+                msgs.append("?"*self.k)
+            else:
+                msgs.append(format(self._decode_word(correct), f"0{self.k}b"))
+        return "".join(msgs)
+
+    def distance_bounds(self, budget: float = 0.1, operations: int = None, seed: int = None) -> tuple[int, int]:
+        """
+        Returns a lower and an upper bound of the minimum Hamming distance, computed within a
+        time (or operations) budget (see `LC_Solver._distance_bounds()`).
+
+        The bounds are combined with those already known (for instance, those of a code derived
+        with `shorten()`, `puncture()`, `extend()` or `dual()`), and stored. If both bounds are
+        equal, the distance is exact and it is stored in `d`.
+
+        :param budget: Maximum time, in seconds.
+        :param operations: Maximum number of operations (combinations of columns and sampled codewords).
+        :param seed: Seed of the sampled codewords, to get reproducible results.
+        :return: The lower and the upper bounds of d.
+
+        >>> ham = HammingCode(t=4, extended=True)
+        >>> ham.d = None
+        >>> ham.distance_bounds(operations=10, seed=0)
+        (2, 4)
+        >>> ham.distance_bounds(), ham._d
+        ((4, 4), 4)
+        """
+        if self._d is not None:
+            return self._d, self._d
+
+        lower, upper = LC_Solver._distance_bounds(self.G, self.H, budget, operations, seed)
+        if self._d_bounds is not None:
+            lower, upper = max(lower, self._d_bounds[0]), min(upper, self._d_bounds[1])
+        self._d_bounds = (lower, upper)
+        if lower == upper:
+            self._d = lower
+        return lower, upper
+
+    def _known_bounds(self) -> tuple[int, int]:
+        """
+        Returns the bounds of d known without computing anything: d itself if it is known,
+        the stored bounds, or 1 and the Singleton bound n - k + 1 otherwise.
+
+        >>> HammingCode(t=3)._known_bounds(), LinearCode(G=Matrix([[1, 1, 0]]), n=3, k=1)._known_bounds()
+        ((3, 3), (1, 3))
+        """
+        if self._d is not None:
+            return self._d, self._d
+        if self._d_bounds is not None:
+            return self._d_bounds
+        k, n = self.G.shape
+        return 1, n - k + 1
+
+    @staticmethod
+    def _delete_columns(rows: list[int], n: int, positions: set[int]) -> list[int]:
+        """
+        Removes the given columns from packed rows of n bits.
+
+        >>> [bin(row) for row in LinearCode._delete_columns([0b1011, 0b0110], 4, {0, 2})]
+        ['0b1', '0b10']
+        """
+        keep = [c for c in range(n) if c not in positions]
+        return [int("".join(bits[c] for c in keep) or "0", 2) for bits in (format(row, f"0{n}b") for row in rows)]
+
+    @staticmethod
+    def _zero_subcode(rows: list[int], n: int, positions: set[int]) -> list[int]:
+        """
+        Returns a basis (packed) of the combinations of the rows which are 0 at the given positions.
+
+        The rows are reduced taking the given positions first as pivots: the reduced rows with
+        the remaining pivots are 0 at all those positions, and they are a basis of the subcode.
+
+        >>> [bin(row) for row in LinearCode._zero_subcode([0b110, 0b011], 3, {0})]
+        ['0b11']
+        """
+        order = sorted(positions) + [c for c in range(n) if c not in positions]
+        reduced, pivots = LC_Solver._packed_rref(rows, n, order)
+        fixed = sum(1 for pivot in pivots if pivot in positions)
+        return reduced[fixed:len(pivots)]
+
+    @staticmethod
+    def _positions(positions: list[int], n: int) -> set[int]:
+        """
+        Returns the given positions as a set, checking that they are positions of a word of n bits.
+
+        >>> sorted(LinearCode._positions([2, 0, 2], 3))
+        [0, 2]
+        >>> LinearCode._positions([-1, 3], 3)
+        Traceback (most recent call last):
+            ...
+        ValueError: Positions [-1, 3] are out of range(3)
+        """
+        positions = set(positions)
+        outside = positions.difference(range(n))
+        if outside:
+            raise ValueError(f"Positions {sorted(outside)} are out of range({n})")
+        return positions
+
+    def _derived(self, g_rows: list[int], h_rows: list[int], n: int, bounds: tuple[int, int],
+                 distribution: tuple[int, ...] = None) -> 'LinearCode':
+        """
+        Builds a code derived from this one, from its packed G and H and the bounds of its distance.
+
+        A code of dimension 0 has no nonzero codeword: its distance is taken as n + 1, the
+        Singleton bound (as in `code_parameters`, from its weight distribution).
+
+        >>> HammingCode(t=3).shorten([0, 1, 2, 4])._d_bounds
+        (4, 4)
+        """
+        k = len(g_rows)
+        code = LinearCode(G=BitMatrix(g_rows, n), H=BitMatrix(h_rows, n), n=n, k=k, M=2**k)
+        lower, upper = bounds
+        upper = min(upper, n - k + 1)
+        if not k:
+            lower = upper = n + 1
+        elif distribution is not None:
+            # Distribució de pesos coneguda: la distància és exacta
+            lower = upper = next((w for w in range(1, n + 1) if distribution[w]), n + 1)
+            code._code_parameters = CodeParameters.from_bounds(n, k, lower, upper, distribution)
+        code._d_bounds = (lower, upper)
+        if lower == upper:
+            code._d = lower
+        return code
+
+    def shorten(self, positions: list[int]) -> 'LinearCode':
+        """
+        Returns the code shortened at the given positions: the codewords which are 0 at those
+        positions, without them. Its H is H without those columns (keeping its independent rows),
+        and its G a basis of the subcode which is 0 there (see `_zero_subcode()`), so no code is
+        solved again. Its distance is at least d.
+
+        :param positions: The positions to remove.
+        :return: The shortened code, with n - len(positions) bits.
+
+        >>> short = HammingCode(t=3).shorten([2])
+        >>> short.n, short.k, short._d_bounds
+        (6, 3, (3, 4))
+        >>> short.d
+        3
+        >>> HammingCode(t=3).shorten([7])
+        Traceback (most recent call last):
+            ...
+        ValueError: Positions [7] are out of range(7)
+        """
+        n = self.G.shape[1]
+        positions = self._positions(positions, n)
+        g_rows = self._delete_columns(self._zero_subcode(self.G.pack_rows(), n, positions), n, positions)
+        h_rows, pivots = LC_Solver._packed_rref(self._delete_columns(self.H.pack_rows(), n, positions), n - len(positions))
+        lower, upper = self._known_bounds()
+        return self._derived(g_rows, h_rows[:len(pivots)], n - len(positions), (lower, n))
+
+    def puncture(self, positions: list[int]) -> 'LinearCode':
+        """
+        Returns the code punctured at the given positions: all the codewords, without those
+        positions. Its G is G without those columns (keeping its independent rows), and its H a
+        basis of the checks which are 0 there (see `_zero_subcode()`). Its distance is at least
+        d - len(positions), and at most d if fewer positions than d are removed.
+
+        :param positions: The positions to remove.
+        :return: The punctured code, with n - len(positions) bits.
+
+        >>> punct = HammingCode(t=3, extended=True).puncture([7])
+        >>> punct.n, punct.k, punct._d_bounds
+        (7, 4, (3, 4))
+        >>> punct.d
+        3
+        >>> HammingCode(t=3).puncture([-1])
+        Traceback (most recent call last):
+            ...
+        ValueError: Positions [-1] are out of range(7)
+        """
+        n = self.G.shape[1]
+        positions = self._positions(positions, n)
+        g_rows, pivots = LC_Solver._packed_rref(self._delete_columns(self.G.pack_rows(), n, positions), n - len(positions))
+        h_rows = self._delete_columns(self._zero_subcode(self.H.pack_rows(), n, positions), n, positions)
+        lower, upper = self._known_bounds()
+        # Si s'eliminen menys posicions que d, les paraules de pes mínim no s'anul·len
+        upper = upper if len(positions) < lower else n
+        return self._derived(g_rows[:len(pivots)], h_rows, n - len(positions), (max(1, lower - len(positions)), upper))
+
+    def extend(self) -> 'LinearCode':
+        """
+        Returns the code extended with an overall parity bit at the end: every codeword gets an
+        even weight, so an odd distance grows by one. H gets a zero column and a row of ones.
+        If the weight distribution is known, the one of the extended code is derived from it.
+
+        :return: The extended code, with n + 1 bits.
+
+        >>> ext = HammingCode(t=3).extend()
+        >>> ext.n, ext.k, ext._d
+        (8, 4, 4)
+        >>> ext.G * ext.H.transpose() == BitMatrix([0] * 4, 4)
+        True
+        """
+        n = self.G.shape[1]
+        g_rows = [(row << 1) | (row.bit_count() & 1) for row in self.G.pack_rows()]
+        h_rows = [row << 1 for row in self.H.pack_rows()] + [2**(n + 1) - 1]
+        lower, upper = self._known_bounds()
+
+        distribution = None
+        if self._code_parameters is not None and self._code_parameters.weight_distribution is not None:
+            extended = [0] * (n + 2)
+            for weight, count in enumerate(self._code_parameters.weight_distribution):
+                extended[weight + (weight & 1)] += count
+            distribution = tuple(extended)
+        return self._derived(g_rows, h_rows, n + 1, (lower + (lower & 1), upper + (upper & 1)), distribution)
+
+    @staticmethod
+    def _macwilliams(distribution: tuple[int, ...], k: int) -> tuple[int, ...]:
+        """
+        Returns the weight distribution of the dual code, from the one of a code of dimension k
+        (MacWilliams identity, with the Krawtchouk polynomials).
+
+        >>> LinearCode._macwilliams((1, 0, 0, 7, 7, 0, 0, 1), 4)
+        (1, 0, 0, 0, 7, 0, 0, 0)
+        """
+        n = len(distribution) - 1
+        dual = []
+        for j in range(n + 1):
+            total = sum(count * sum((-1)**s * comb(i, s) * comb(n - i, j - s) for s in range(j + 1))
+                        for i, count in enumerate(distribution) if count)
+            dual.append(total >> k)
+        return tuple(dual)
+
+    def dual(self) -> 'LinearCode':
+        """
+        Returns the dual code: G and H are swapped. If the weight distribution of the code is
+        known, the one of the dual code (and so its distance) is obtained with the MacWilliams identity.
+
+        :return: The dual code, of dimension n - k.
+
+        >>> simplex = HammingCode(t=3).dual()
+        >>> simplex.n, simplex.k, simplex.d
+        (7, 3, 4)
+        >>> ham = HammingCode(t=3)
+        >>> ham.code_parameters.d, ham.dual()._code_parameters.weight_distribution
+        (3, (1, 0, 0, 0, 7, 0, 0, 0))
+        """
+        n = self.G.shape[1]
+        distribution = None
+        if self._code_parameters is not None and self._code_parameters.weight_distribution is not None:
+            distribution = self._macwilliams(self._code_parameters.weight_distribution, self.G.shape[0])
+        return self._derived(self.H.pack_rows(), self.G.pack_rows(), n, (1, n), distribution)
+
+# Estat de cada procés de `decodify_isd` (el codi i els paràmetres es passen un sol cop)
+_isd_state = None
+
+def _isd_init(state: tuple):
+    global _isd_state
+    _isd_state = state
+
+def _isd_worker(task: tuple[int, int]) -> int | None:
+    code, rows, iterations, p, weight, seed = _isd_state
+    word, index = task
+    # Una llavor per bloc: el resultat no depèn del repartiment entre processos
+    rng = random.Random(None if seed is None else f"{seed}:{index}")
+    return code._isd_word(word, rows, iterations, p, weight, rng)
+
+# Estat de cada procés de `_min_hamming_distance` (les columnes i el senyal de sortida)
+_distance_state = None
+
+def _distance_init(state: tuple):
+    global _distance_state
+    _distance_state = state
+
+def _distance_worker(task: tuple[int, int, int]) -> bool:
+    columns, found = _distance_state
+    size, start, count = task
+    return LC_Solver._dependent_combination(columns, size, start, count, found)
+
+# Màxim de files d'un lot de `LC_Solver.solve_many` per calcular-ne la distància (2^files paraules)
+BATCH_DISTANCE_ROWS = 16
+
+def _batch_worker(task: tuple[list[list[int]], int]) -> list[tuple[list[int], list[int], int | None]]:
+    return LC_Solver._solve_batch(*task)
+
+# Es manté el repr i la comparació de `LinearCode`, que no calculen d
+@dataclass(repr=False, eq=False)
+class HammingCode(LinearCode):
+    """
+    Class to represent a Hamming code Ham2(t), optionally extended with an overall parity bit,
+    or shortened by removing message positions.
+
+    The columns of H are all the non-null binary numbers of t bits, so the syndrome of a single
+    error is the binary number of its column. Its position is obtained arithmetically
+    (`n - syndrome`, with the columns n, ..., 1) or from a list indexed by the syndrome,
+    instead of looking it up in a syndrome table. The message bits are placed in the
+    positions whose column is not a power of two, and the parity bits in the others, so G
+    and H are built in closed form (packed, see `BitMatrix`) without calling `LC_Solver.calculate_H`.
+
+    With `systematic=True` the columns are ordered so that `H = (A | I)` and `G = (I | A^t)`.
+    Only `A` is stored, so building long codes costs O(n·t) word operations.
+
+    The extended code (SECDED) appends an overall parity bit and a row of ones to H:
+    it corrects all single errors and detects all double errors.
+
+    >>> ham = HammingCode(t=3)
+    >>> ham.n, ham.k, ham.d
+    (7, 4, 3)
+    >>> print(ham.H)
+    [1 1 1 1 0 0 0]
+    [1 1 0 0 1 1 0]
+    [1 0 1 0 1 0 1]
+    >>> print(ham.G)
+    [1 0 0 1 0 1 1]
+    [0 1 0 1 0 1 0]
+    [0 0 1 1 0 0 1]
+    [0 0 0 0 1 1 1]
+    >>> G, H = ham.G, ham.H
+    >>> bool(G.mulmod2(H.transpose()))
+    False
+    >>> ext = HammingCode(t=3, extended=True)
+    >>> ext.n, ext.k, ext.d
+    (8, 4, 4)
+    >>> syst = HammingCode(t=3, systematic=True)
+    >>> print(syst.H)
+    [1 1 1 0 1 0 0]
+    [1 1 0 1 0 1 0]
+    [1 0 1 1 0 0 1]
+    >>> print(syst.G)
+    [1 0 0 0 1 1 1]
+    [0 1 0 0 1 1 0]
+    [0 0 1 0 1 0 1]
+    [0 0 0 1 0 1 1]
+    >>> short = HammingCode(t=3, systematic=True, shortened=2)
+    >>> short.n, short.k, short.G
+    (5, 2, [[1, 0, 1, 0, 1], [0, 1, 0, 1, 1]])
+    """
+    t: int = None
+    extended: bool = False
+    systematic: bool = False
+    shortened: int = 0
+
+    # Posició (bit de la paraula) de la columna de H amb cada valor, i -1 si no hi és
+    _error_index: list[int] = field(default=None, init=False, repr=False, compare=False)
+    # Taules per dispersar el missatge a les posicions de dades, i per recollir-lo
+    _encode_tables: list[list[int]] = field(default=None, init=False, repr=False, compare=False)
+    _decode_tables: list[list[int]] = field(default=None, init=False, repr=False, compare=False)
+
+    # Sense `_error_index`, G i H ja no són les del codi de Hamming i es descodifica com un `LinearCode`
+    _CACHES = LinearCode._CACHES + ("_error_index", "_encode_tables", "_decode_tables")
+
+    def __post_init__(self):
+        """
+        Builds the matrices and the parameters of the code from `t`.
+        """
+        if self.t is None:
+            return
+        if self.t < 2:
+            raise ValueError(f"Hamming codes need at least 2 parity bits (t = {self.t})")
+        if not 0 <= self.shortened < 2**self.t - 1 - self.t:
+            raise ValueError(f"Cannot shorten Ham2({self.t}) by {self.shortened} positions")
+
+        # Valor de la columna de H a cada posició: n, ..., 1
+        values = range(2**self.t - 1, 0, -1)
+        data_values = [value for value in values if value & (value - 1)]
+        parity_values = [value for value in values if not value & (value - 1)]
+        if self.systematic:
+            values = data_values + parity_values
+        if self.shortened:
+            dropped = set(data_values[:self.shortened])
+            data_values = data_values[self.shortened:]
+            values = [value for value in values if value not in dropped]
+
+        n = len(values)
+        self.n = n + 1 if self.extended else n
+        self.k = len(data_values)
+        self.M = 2**self.k
+
+        error_index = [-1] * 2**self.t
+        for pos, value in enumerate(values):
+            error_index[value] = n - 1 - pos
+
+        # La fila r de H són els bits r de tots els valors: es llegeixen de la cadena amb salts de t
+        bits = "".join(format(value, f"0{self.t}b") for value in values)
+        h_rows = [int(bits[row::self.t], 2) for row in range(self.t)]
+
+        if self.systematic:
+            # G = (I | A^t): la paritat de cada fila de dades és el valor de la seva columna
+            parity = data_values
+            if self.extended:
+                parity = [(value << 1) | ((1 + value.bit_count()) & 1) for value in parity]
+            self.G = SystematicBitMatrix(parity, self.n)
+        else:
+            # Bit de dades + bits de paritat de les potències de 2 del seu valor
+            g_rows = [(1 << error_index[value]) |
+                      sum(1 << error_index[power] for power in parity_values if value & power)
+                      for value in data_values]
+            if self.extended:
+                g_rows = [(row << 1) | (row.bit_count() & 1) for row in g_rows]
+            self.G = BitMatrix(g_rows, self.n)
+
+        if self.extended:
+            # Bit de paritat global: s'afegeix al final de cada paraula
+            h_rows = [row << 1 for row in h_rows] + [2**self.n - 1]
+        self.H = BitMatrix(h_rows, self.n)
+        self.d = 4 if self.extended else 3
+        # Després d'assignar G i H, que el descartarien
+        self._error_index = error_index
+
+    def _encode_word(self, message: int) -> int:
+        """
+        Encodes a packed message of k bits into a packed codeword of n bits.
+
+        >>> bin(HammingCode(t=3)._encode_word(0b1011))
+        '0b1010101'
+        >>> bin(HammingCode(t=3, systematic=True)._encode_word(0b1011))
+        '0b1011001'
+        """
+        if self._encode_tables is None:
+            self._encode_tables = self._xor_tables(self.G.parity if self.systematic else self.G.pack_rows())
+
+        word, rest = 0, message
+        for table in self._encode_tables:
+            word ^= table[rest & 0xFF]
+            rest >>= 8
+        if self.systematic:
+            # G = (I | P): el missatge seguit de la seva paritat
+            return (message << (self.n - self.k)) | word
+        return word
+
+    def _decode_word(self, word: int) -> int:
+        """
+        Extracts the packed message of k bits from a packed codeword, reading its data positions.
+
+        >>> bin(HammingCode(t=3)._decode_word(0b1010101))
+        '0b1011'
+        >>> bin(HammingCode(t=3, systematic=True)._decode_word(0b1011001))
+        '0b1011'
+        """
+        if self._error_index is None:
+            return LinearCode._decode_word(self, word)
+        if self.systematic:
+            return word >> (self.n - self.k)
+
+        if self._decode_tables is None:
+            data_bits = [0] * self.n
+            rows = self.G.pack_rows()
+            for index, row in enumerate(rows):
+                # Posició del bit de dades de la fila (el més significatiu)
+                data_bits[self.n - row.bit_length()] = 1 << (self.k - 1 - index)
+            self._decode_tables = self._xor_tables(data_bits)
+
+        message = 0
+        for table in self._decode_tables:
+            message ^= table[word & 0xFF]
+            word >>= 8
+        return message
+
+    def _correct_word(self, word: int, complete: bool = False) -> int | None:
+        """
+        Corrects a single error of a packed block using its syndrome as the error position.
+
+        :param word: Received block packed as an integer.
+        :param complete: If True, the errors that are not single errors are corrected with
+                         the complete syndrome table (see `LinearCode.syndrome_table()`).
+        :return: The corrected block, or None if an uncorrectable error is detected.
+
+        >>> bin(HammingCode(t=3)._correct_word(0b1011101))
+        '0b1010101'
+        >>> ext = HammingCode(t=3, extended=True)
+        >>> bin(ext._correct_word(0b10101010 ^ 0b1))
+        '0b10101010'
+        >>> ext._correct_word(0b10101010 ^ 0b11) is None
+        True
+        >>> HammingCode(t=3, shortened=1)._correct_word(0b001100) is None
+        True
+        >>> bin(ext._correct_word(0b10101010 ^ 0b11, complete=True))
+        '0b1101001'
+        """
+        if self._error_index is None:
+            return LinearCode._correct_word(self, word, complete)
+        if complete:
+            corrected = self._correct_word(word)
+            return LinearCode._correct_word(self, word, True) if corrected is None else corrected
+
+        syndrome = self.syndrome(word)
+        shift = 0
+        if self.extended:
+            syndrome, parity = syndrome >> 1, syndrome & 1
+            if not parity:
+                # Sense error, o error doble (no es pot corregir)
+                return None if syndrome else word
+            if not syndrome:
+                # L'error és al bit de paritat global
+                return word ^ 1
+            shift = 1
+        elif not syndrome:
+            return word
+
+        index = self._error_index[syndrome]
+        if index < 0:
+            # Columna eliminada en escurçar el codi: hi ha més d'un error
+            return None
+        return word ^ (1 << (index + shift))
+
+    def codify(self, bits: list[int] | str, depth: int = 1):
+        """
+        Encodes a list of bits (or a bit string), placing each block of k bits at the data positions
+        (and interleaving the blocks `depth` at a time, see `LinearCode.codify()`).
+
+        >>> HammingCode(t=3).codify("10110000")
+        '10101010000000'
+        >>> HammingCode(t=3).codify("10110000", depth=2)
+        '10001000100010'
+
+        If G or H are reassigned, the code is encoded and decoded as a `LinearCode`:
+
+        >>> ham = HammingCode(t=3)
+        >>> ham.G, ham.H = Matrix([[1, 1, 1]]), Matrix([[1, 1, 0], [1, 0, 1]])
+        >>> ham.n, ham.k = 3, 1
+        >>> ham.codify("10"), ham.decodify_detect("111010"), ham.decodify_correct("110")
+        ('111000', '1?', '1')
+        """
+        if self._error_index is None:
+            return LinearCode.codify(self, bits, depth)
+        coded = "".join(format(self._encode_word(message), f"0{self.n}b")
+                        for message in self._split_bits_in_words(bits, self.k))
+        return self._interleave(coded, self.n, depth) if depth > 1 else coded
+
+    def decodify_detect(self, bits: list[int] | str, depth: int = 1):
+        """
+        Decodes a list of bits (or a bit string) while detecting errors.
+
+        >>> HammingCode(t=3).decodify_detect("10101010000001")
+        '1011????'
+        """
+        return "".join(("?"*self.k) if self.syndrome(word) else format(self._decode_word(word), f"0{self.k}b")
+                       for word in self._split_bits_in_words(bits, self.n, depth))
+
+    def decodify_correct(self, bits: list[int] | str, complete: bool = False, depth: int = 1):
+        """
+        Decodes a list of bits (or a bit string), correcting single errors
+        (and detecting double errors in the extended code).
+
+        With `complete=True`, the detected errors are also corrected to a nearest codeword.
+
+        >>> HammingCode(t=3).decodify_correct("10111010001000")
+        '10110000'
+        >>> HammingCode(t=3, extended=True).decodify_correct("1010101001100000")
+        Warning! Block [[0, 1, 1, 0, 0, 0, 0, 0]] has more errors than the linear code's correct capabilites
+        '1011????'
+        >>> HammingCode(t=3).decodify_correct("10000100100010", depth=2)
+        '10110000'
+        """
+        msgs = []
+        for word in self._split_bits_in_words(bits, self.n, depth):
+            correct = self._correct_word(word, complete)
+            if correct is None:
+                print(f"Warning! Block {[Row.unpack(word, self.n).elements]} has more errors than the linear code's correct capabilites")
+                msgs.append("?"*self.k)
+            else:
+                msgs.append(format(self._decode_word(correct), f"0{self.k}b"))
         return "".join(msgs)
 
 class LC_Solver():
@@ -294,6 +1933,10 @@ class LC_Solver():
         :param verbose: If True, prints the steps during the calculation.
         :return: The reduced base matrix.
         """
+        # Les matrius empaquetades es redueixen com a `Matrix`
+        if isinstance(base, BitMatrix):
+            base = base.to_matrix()
+
         # Primer apliquem reducció. Fa que les files que quedin puguin ser
         # únicament iguals o zero.
         base = self._rrefReduction(base, verbose)
@@ -326,6 +1969,41 @@ class LC_Solver():
         # self.base = self._rrefReduction(base)
         return self._rrefReduction(base, verbose)
 
+    @staticmethod
+    def _packed_base(rows: list[int], n: int) -> list[int]:
+        """
+        Same as `calculate_base()` (without printing), with the rows packed as integers: the
+        reduction of `_rrefReduction()`, which takes the pivot of row i at column i, then the
+        zero and repeated rows are removed, and the rows are reduced again. So the basis is the
+        same one `solve()` gives.
+
+        >>> matrix = Matrix([[0, 1, 1, 0], [1, 1, 0, 1], [1, 0, 1, 1], [0, 0, 1, 1]])
+        >>> LC_Solver.calculate_base(matrix, verbose=False).pack_rows()
+        [8, 5, 3]
+        >>> LC_Solver._packed_base([0b0110, 0b1101, 0b1011, 0b0011], 4)
+        [8, 5, 3]
+        """
+        def reduce(rows: list[int]) -> list[int]:
+            rows = list(rows)
+            for pivot in range(min(len(rows), n)):
+                bit = 1 << (n - 1 - pivot)
+                if not rows[pivot] & bit:
+                    # Intercanvi amb la primera fila següent amb un 1 a la columna
+                    for row in range(pivot + 1, len(rows)):
+                        if rows[row] & bit:
+                            rows[pivot], rows[row] = rows[row], rows[pivot]
+                            break
+                    else:
+                        continue
+                for row in range(len(rows)):
+                    if row != pivot and rows[row] & bit:
+                        rows[row] ^= rows[pivot]
+            return rows
+
+        # Sense files nul·les ni repetides (es manté la primera de les iguals)
+        unique = list(dict.fromkeys(row for row in reduce(rows) if row))
+        return reduce(unique)
+
     @classmethod
     def _rrefReduction(self, matrix: Matrix, verbose = True):
         """
@@ -340,6 +2018,9 @@ class LC_Solver():
             if it is not, look for whether any row has a 1 at position 'n', and swap them;
             if it is, the rest of the rows are made to have a 0 in this position.
 
+        The reduction is done in place: the rows of the given matrix are modified
+        (no new rows are allocated), and the same matrix is returned.
+
         :param matrix: The matrix to be reduced.
         :param verbose: If True, prints the steps during the reduction.
         :return: The reduced matrix.
@@ -348,6 +2029,8 @@ class LC_Solver():
         >>> result = LC_Solver._rrefReduction(matrix, verbose=False)
         >>> result.matrix
         [[1 0 1], [0 1 1], [0 0 0]]
+        >>> result is matrix
+        True
         """
         for pivot in range(matrix.shape[0]):
             if pivot >= matrix.shape[1]:
@@ -372,10 +2055,14 @@ class LC_Solver():
             for row in range(matrix.shape[0]):
                 if row != pivot and matrix[row][pivot] != 0:
                     if verbose: print(f"\tmatrix[{row}] = matrix[{pivot}] + matrix[{row}]")
-                    # Sumem la fila pivot a la fila on volem eliminar l'element de la columna
-                    matrix[row] = matrix[row] + matrix[pivot]
+                    # Sumem (mòdul 2) la fila pivot a la fila on volem eliminar l'element de la columna
+                    # (in place: no es crea cap fila nova, i no cal reduir-la després)
+                    matrix[row] ^= matrix[pivot]
 
-        return matrix % 2
+        return matrix
+
+    # Eliminació amb files empaquetades (vegeu `BitMatrix.packed_rref()`)
+    _packed_rref = staticmethod(packed_rref)
 
     @classmethod
     def _calculate_H_not_systematic(self, G: Matrix, verbose: bool = True) -> Matrix:
@@ -394,11 +2081,11 @@ class LC_Solver():
 
         >>> G = Matrix([[1, 0, 1, 1], [0, 1, 1, 0]])
         >>> H = LC_Solver._calculate_H_not_systematic(G, verbose=False)
-        >>> print(G*H.transpose() % 2 == Matrix.zeros(2)) # Fem test comprovant si G*H^t == 0
+        >>> print(G.mulmod2(H.transpose()) == Matrix.zeros(2)) # Fem test comprovant si G*H^t == 0
         True
         >>> G = Matrix([[1, 0, 1, 1, 1, 0], [0, 1, 1, 0, 0, 1], [0, 0, 1, 0, 0, 1]])
         >>> H = LC_Solver._calculate_H_not_systematic(G, verbose=False)
-        >>> print(G*H.transpose() % 2 == Matrix.zeros(3, 3)) # Matrix 6x3 · 3x6 == 3x3
+        >>> print(G.mulmod2(H.transpose()) == Matrix.zeros(3, 3)) # Matrix 6x3 · 3x6 == 3x3
         True
         """
         k, n = G.shape
@@ -422,19 +2109,74 @@ class LC_Solver():
             for row in range(Gt_i.shape[0]):
                 if row != pivot and Gt_i[row][pivot] != 0:
                     if verbose: print(f"matrix[{row}] = matrix[{pivot}] + matrix[{row}]")
-                    # Sumem la fila pivot a la fila on volem eliminar l'element de la columna
-                    Gt_i[row] = Gt_i[row] + Gt_i[pivot]
+                    # Sumem (mòdul 2) la fila pivot a la fila on volem eliminar l'element de la columna
+                    Gt_i[row] ^= Gt_i[pivot]
 
-        H = Gt_i.split(slice(k, n, 1), slice(k, n+k, 1)) % 2
+        H = Gt_i.split(slice(k, n, 1), slice(k, n+k, 1))
         # H = Gt_i.split(slice(n-k, n, 1), slice(k, n+k, 1)) % 2
         # H = Gt_i.split(slice(n-k-1, n, 1), slice(k, n+k, 1)) % 2
         return self.calculate_base(H, verbose)
 
+    @classmethod
+    def _kernel_rows(self, basis: list[int], pivots: list[int], n: int) -> list[int]:
+        """
+        Returns the packed rows of a control matrix H of the code spanned by packed rows in
+        reduced row echelon form: the row of each non-pivot column f (in increasing order) is
+        the unit vector of f plus the pivots of the rows with a 1 at f.
+
+        :param basis: The packed rows, in reduced row echelon form (without null rows).
+        :param pivots: The pivot column of each row.
+        :param n: Number of columns.
+        :return: The packed rows of H.
+
+        >>> [bin(row) for row in LC_Solver._kernel_rows([0b1100, 0b0011], [0, 2], 4)]
+        ['0b1100', '0b11']
+        """
+        free = sorted(set(range(n)) - set(pivots))
+        if not free:
+            return []
+        k = len(basis)
+        # Columnes de H: a cada pivot, la seva fila de G a les columnes no pivot; a cada columna no pivot, un vector unitari
+        pick = itemgetter(*free)
+        columns = [0] * n
+        for row, pivot in zip(basis, pivots):
+            columns[pivot] = int("".join(pick(format(row, f"0{n}b"))), 2)
+        for index, f in enumerate(free):
+            columns[f] = 1 << (n - k - 1 - index)
+        return BitMatrix(columns, n - k).pack_columns()
+
+    @classmethod
+    def kernel(self, G: Matrix) -> tuple[Matrix, list[int]]:
+        """
+        Computes a control matrix H (a basis of the kernel of G) from a single reduction of G,
+        with the backend selected for its size, whether G is in systematic form or not
+        (see `Backend.rref()` and `_kernel_rows()`).
+
+        The column permutation puts the pivot columns first and then the non-pivot ones: with
+        the columns in that order, the reduced G is `(I | A)` and H is `(A^t | I)`.
+
+        :param G: The generator matrix (any matrix: its rows need not be independent).
+        :return: H and the column permutation.
+
+        >>> H, permutation = LC_Solver.kernel(Matrix([[1, 1, 0, 0], [0, 0, 1, 1]]))
+        >>> H, permutation
+        ([[1, 1, 0, 0], [0, 0, 1, 1]], [0, 2, 1, 3])
+        >>> LC_Solver.kernel(Matrix([[1, 0, 1, 1], [0, 1, 1, 0], [1, 1, 0, 1]]))
+        ([[1, 1, 1, 0], [1, 0, 0, 1]], [0, 1, 2, 3])
+        """
+        n = G.shape[1]
+        reduced, pivots = Backend.rref(G)
+        rows = reduced.pack_rows()
+        free = sorted(set(range(n)) - set(pivots))
+        H = BitMatrix(self._kernel_rows(rows[:len(pivots)], pivots, n), n).to_matrix()
+        return H, pivots + free
+
     @classmethod
     def calculate_H(self, G: Matrix, verbose: bool = True) -> Matrix:
         """
         Computes control matrix H, regardless of whether the
-        generator matrix G is in systematic form.
+        generator matrix G is in systematic form, with a single
+        reduction of G (see `kernel()`).
 
         :param G: The generator matrix.
         :param verbose: If True, prints the intermediate steps.
@@ -444,20 +2186,16 @@ class LC_Solver():
         >>> H = LC_Solver.calculate_H(G, verbose=False)
         >>> H.matrix
         [[1 1 1 0], [1 0 0 1]]
+        >>> G = Matrix([[1, 0, 1, 1, 1, 0], [0, 1, 1, 0, 0, 1], [0, 0, 1, 0, 0, 1]])
+        >>> bool(G.mulmod2(LC_Solver.calculate_H(G, verbose=False).transpose()))
+        False
         """
-        G = self.calculate_base(Matrix(G), verbose)
-        k, n = G.shape
-        # G = (I|A)?
-        G_i = G.split(slice(k), slice(k))
-        G_a = G.split(slice(k), slice(k, n, 1))
-        if G_i != Matrix.eye(k):
-            return self._calculate_H_not_systematic(G, verbose)
-        H = G_a.transpose().hstack(Matrix.eye((n-k)))
-
+        H, permutation = self.kernel(G)
+        if verbose: print(f"Permutació de columnes (pivots i columnes lliures): {permutation}")
         return H
 
     @classmethod
-    def _min_hamming_distance(self, M: Matrix) -> int:
+    def _min_hamming_distance(self, M: Matrix, processes: int = 1) -> int:
         """
         Computes the minimum Hamming distance of a given matrix M.
 
@@ -466,7 +2204,12 @@ class LC_Solver():
 
         It is usually used to compute the distance parameter, d, of a linear code given the H matrix
 
+        With `processes > 1`, the combinations of each size are split in ranges of ranks (see
+        `_unrank_combination()`) which are searched in parallel; as soon as a process finds
+        a dependent set of columns, the others stop.
+
         :param M: Matrix to compute the hamming distance.
+        :param processes: Number of processes used to search the combinations.
         :return: Minimum Hamming distance.
 
         >>> G = Matrix([[1, 0, 1, 1], [0, 1, 1, 0]])
@@ -475,17 +2218,26 @@ class LC_Solver():
         >>> G = Matrix([[1, 0, 0, 1], [0, 1, 0, 1], [0, 0, 1, 1]])
         >>> LC_Solver._min_hamming_distance(G)
         4
+        >>> LC_Solver._min_hamming_distance(LC_Solver.Hamming(5, extended=True).H, processes=2)
+        4
         """
         n_cols = M.shape[1]  # Number of columns in G
+        # Columnes empaquetades un sol cop: sumar-les mòdul 2 és fer-ne la XOR
+        columns = M.pack_columns()
+
+        if processes > 1:
+            return self._parallel_min_hamming_distance(columns, processes)
 
         # Iterate over subset sizes (1 to n_cols)
         for mida_comb in range(1, n_cols + 1):
             # Genera les possibles combinacions amb el nombre de columnes que va augmentant fins a `n`
             # Si tenim 3 columnes i agrupem de 2 en 2: [(0, 1), (0, 2), (1, 2)]
             # Indicaria que s'han de sumar les columnes 0 i 1, 0 i 2, i 1 i 2
-            for cols in combinations(range(n_cols), mida_comb):
+            for cols in combinations(columns, mida_comb):
                 # Suma les columnes de la combinació mòdul 2
-                col_sum = sum(M.get_columns(cols)) % 2
+                col_sum = 0
+                for col in cols:
+                    col_sum ^= col
 
                 # Si la suma és 0, el nombre de columnes és el
                 # nombre d'elements en la combinació
@@ -496,16 +2248,215 @@ class LC_Solver():
         return n_cols + 1
 
     @classmethod
-    def Hamming(self, t: int) -> LinearCode:
+    def _unrank_combination(self, rank: int, n: int, size: int) -> list[int]:
+        """
+        Returns the combination of `size` elements of range(n) with the given rank,
+        in lexicographic order (the same order as `itertools.combinations`).
+
+        >>> LC_Solver._unrank_combination(0, 5, 3), LC_Solver._unrank_combination(4, 5, 3)
+        ([0, 1, 2], [0, 2, 4])
+        >>> [LC_Solver._unrank_combination(r, 4, 2) for r in range(6)] == [list(c) for c in combinations(range(4), 2)]
+        True
+        """
+        combination = []
+        element = 0
+        for i in range(size):
+            # Saltem els blocs de combinacions que comencen per `element`
+            while comb(n - element - 1, size - i - 1) <= rank:
+                rank -= comb(n - element - 1, size - i - 1)
+                element += 1
+            combination.append(element)
+            element += 1
+        return combination
+
+    @classmethod
+    def _dependent_combination(self, columns: list[int], size: int, start: int, count: int, found=None) -> bool:
+        """
+        Checks whether any of the `count` combinations of `size` columns from rank `start`
+        sums (mod 2) to the zero vector.
+
+        The XORs of the prefixes of the combination are kept, so moving to the next combination
+        only recomputes the prefixes from the first changed element. If `found` (an Event) is
+        given, it is set when a dependent set is found, and the search stops if it has been set
+        by another process.
+
+        >>> LC_Solver._dependent_combination([0b01, 0b10, 0b11], 3, 0, 1)
+        True
+        >>> LC_Solver._dependent_combination([0b01, 0b10, 0b11], 2, 0, 3)
+        False
+        """
+        n = len(columns)
+        combination = self._unrank_combination(start, n, size)
+        prefixes = [0] * (size + 1)
+        changed = 0
+        for step in range(count):
+            for i in range(changed, size):
+                prefixes[i + 1] = prefixes[i] ^ columns[combination[i]]
+            if not prefixes[size]:
+                if found is not None:
+                    found.set()
+                return True
+            if found is not None and not step & 0xFFF and found.is_set():
+                return False
+
+            # Següent combinació en ordre lexicogràfic
+            i = size - 1
+            while i >= 0 and combination[i] == n - size + i:
+                i -= 1
+            if i < 0:
+                break
+            combination[i] += 1
+            for j in range(i + 1, size):
+                combination[j] = combination[j - 1] + 1
+            changed = i
+        return False
+
+    @classmethod
+    def _parallel_min_hamming_distance(self, columns: list[int], processes: int) -> int:
+        """
+        Parallel version of `_min_hamming_distance()` over the packed columns.
+
+        The sizes are searched in increasing order. The combinations of each size are split
+        into ranges of ranks, searched by a pool of processes which share an Event to stop
+        as soon as one of them finds a dependent set of columns.
+
+        >>> LC_Solver._parallel_min_hamming_distance([0b01, 0b10, 0b11], 2)
+        3
+        """
+        n_cols = len(columns)
+        found = Event()
+        with Pool(processes, initializer=_distance_init, initargs=((columns, found),)) as pool:
+            for mida_comb in range(1, n_cols + 1):
+                total = comb(n_cols, mida_comb)
+                chunk = max(1, -(-total // (8 * processes)))
+                tasks = [(mida_comb, start, min(chunk, total - start)) for start in range(0, total, chunk)]
+                for dependent in pool.imap_unordered(_distance_worker, tasks):
+                    if dependent:
+                        return mida_comb
+
+        # Per si totes són independents
+        return n_cols + 1
+
+    @classmethod
+    def _distance_bounds(self, G: Matrix, H: Matrix, budget: float = 0.1, operations: int = None,
+                         seed: int = None) -> tuple[int, int]:
         """
-        Generates the Ham(t) linear code.
-        
-        H = (A|I) is generated so that G can be generated later.
-        First the dual is generated, G' = H = (A|I) -> H' = (I|A) = G,
-        and the Hamming code is obtained from it.
+        Computes a lower and an upper bound of the minimum Hamming distance of the code with
+        generator matrix G and control matrix H, until they meet or the budget runs out.
+
+        Two searches are interleaved:
+            - Lower bound: the combinations of columns of H are searched by increasing size,
+              as in `_min_hamming_distance()`. When all the combinations of a size have been
+              searched without finding a null sum, d is greater than this size.
+            - Upper bound: the weight of any codeword is an upper bound. Codewords of low weight
+              are sampled by reducing the rows of G with a random order of the columns (see
+              `_packed_rref()`): each reduced row is a codeword with many zeros at the pivots.
+              The initial upper bound is the Singleton bound, n - k + 1.
+
+        :param G: The generator matrix.
+        :param H: The control matrix.
+        :param budget: Maximum time, in seconds.
+        :param operations: Maximum number of operations (combinations of columns and sampled codewords).
+        :param seed: Seed of the sampled codewords.
+        :return: The lower and the upper bounds of d.
+
+        >>> ham = LC_Solver.Hamming(5)
+        >>> LC_Solver._distance_bounds(ham.G, ham.H, operations=100, seed=0)
+        (3, 3)
+        >>> G = Matrix([[1, 0, 1, 1], [0, 1, 1, 0]])
+        >>> LC_Solver._distance_bounds(G, LC_Solver.calculate_H(G, verbose=False))
+        (2, 2)
+        >>> H = BitMatrix(list(range(1, 50)) + [49], 6).transpose()  # Només les dues últimes columnes són iguals
+        >>> LC_Solver._distance_bounds(LC_Solver.kernel(H)[0], H, budget=None, operations=10**4)
+        (2, 2)
+        """
+        # El rellotge comença abans d'empaquetar G i H (per a codis llargs no és negligible)
+        deadline = perf_counter() + budget if budget is not None else None
+        rng = random.Random(seed)
+
+        k, n = G.shape
+        columns = H.pack_columns()
+        upper = n - k + 1
+        if isinstance(G, SystematicBitMatrix):
+            # El pes de cada fila de (I | P), sense construir la identitat
+            upper = min([upper] + [1 + row.bit_count() for row in G.parity])
+        lower = 1
+        # Les files de G s'empaqueten el primer cop que es busca la cota superior, si queda temps
+        g_rows = None
+
+        size = 1
+        pending = combinations(columns, size) if columns else None
+        done = 0
+        while lower < upper:
+            if operations is not None and done >= operations:
+                break
+            if deadline is not None and perf_counter() >= deadline:
+                break
+
+            # Cota inferior: un tram de combinacions de la mida actual
+            if pending is not None:
+                searched = 0
+                for cols in itertools.islice(pending, 1024):
+                    searched += 1
+                    col_sum = 0
+                    for col in cols:
+                        col_sum ^= col
+                    if not col_sum:
+                        return size, size
+                done += searched
+                if searched < 1024:
+                    # S'han esgotat les combinacions d'aquesta mida
+                    lower = size + 1
+                    size += 1
+                    pending = combinations(columns, size) if size <= len(columns) else None
+
+            # Cota superior: paraules del codi d'una forma esglaonada aleatòria de G
+            if g_rows is None and k:
+                if deadline is not None and perf_counter() >= deadline:
+                    break
+                if isinstance(G, SystematicBitMatrix):
+                    # Les files de (I | P) es construeixen d'una en una, per poder aturar-se a temps
+                    g_rows = []
+                    for index, parity in enumerate(G.parity):
+                        if deadline is not None and not index & 0xFF and perf_counter() >= deadline:
+                            break
+                        g_rows.append((1 << (n - 1 - index)) | parity)
+                    if len(g_rows) < k:
+                        break
+                else:
+                    g_rows = G.pack_rows()
+                for index, row in enumerate(g_rows):
+                    if deadline is not None and not index & 0xFF and perf_counter() >= deadline:
+                        break
+                    if row:
+                        upper = min(upper, row.bit_count())
+            if g_rows:
+                if deadline is not None and perf_counter() >= deadline:
+                    break
+                order = list(range(n))
+                rng.shuffle(order)
+                reduced, pivots = self._packed_rref(g_rows, n, order, deadline)
+                upper = min([upper] + [row.bit_count() for row in reduced[:len(pivots)]])
+                done += k
+            elif pending is None:
+                break
+
+        return lower, max(lower, upper)
+
+    @classmethod
+    def Hamming(self, t: int, shortened: int = 0, extended: bool = False) -> 'HammingCode':
+        """
+        Generates the Ham(t) linear code, directly in systematic form.
+
+        H = (A|I) is built from the binary numbers of t bits (the columns that are not
+        a power of two form A), and G = (I|A^t) follows from it, without applying any
+        reduction. The matrices are packed (see `HammingCode`), so long codes such as
+        Ham(16) (n = 65535) are built with O(n·t) word operations.
 
         :param t: The Hamming parameter (defines the number of parity bits).
-        :return: A LinearCode object representing the Hamming code.
+        :param shortened: Number of message positions removed from the code (optional).
+        :param extended: If True, an overall parity bit is appended (optional).
+        :return: A HammingCode object representing the Hamming code.
 
         >>> lc = LC_Solver.Hamming(2)
         >>> lc.n
@@ -520,37 +2471,30 @@ class LC_Solver():
         [[1, 1, 1]]
         >>> lc.H
         [[1, 1, 0], [1, 0, 1]]
+        >>> lc = LC_Solver.Hamming(4, shortened=3)
+        >>> lc.n, lc.k, bool(lc.G * lc.H.transpose())
+        (12, 8, False)
+        >>> LC_Solver.Hamming(16).G.shape
+        (65519, 65535)
         """
-        lc = LinearCode()
-        lc.n = 2**t-1
+        lc = HammingCode(t=t, extended=extended, systematic=True, shortened=shortened)
         lc.M = 2**lc.n
-        lc.k = lc.n-t
-
-        lc.d = 3 # per definició
-
-        lc.H = Matrix([[] for _ in range(lc.n-lc.k)])
-
-        # Afegim les N columnes amb [1, N] valors binaris a cada col
-        for col in range(lc.n, 0, -1):
-            column = list(map(int, list(bin(col).replace("0b", "").zfill(lc.n-lc.k))))
-            lc.H.add_column(Row(column))
-
-        # Calculem G, considerant que és el dual
-        lc.G = self.calculate_H(lc.H, False)
 
         return lc
 
-
     @classmethod
-    def solve(self, matrix: Matrix, verbose = True) -> LinearCode:
+    def solve(self, matrix: Matrix, verbose = True, processes: int = 1) -> LinearCode:
         """
         Computes the resulting linear code from the `LC_Solver`,
         which contains the elements of a code or a basis of it.
 
-        This method calculates the generator matrix G, the parity-check matrix H, and the minimum Hamming distance of the code.
+        This method calculates the generator matrix G and the parity-check matrix H of the code.
+        The minimum Hamming distance is computed lazily, the first time `d` is used (or bounded
+        within a budget with `LinearCode.distance_bounds()`).
 
         :param matrix: The input matrix used to calculate the code elements or basis.
         :param verbose: If True, prints the process.
+        :param processes: Number of processes used to compute the minimum Hamming distance (when needed).
         :return: A LinearCode object containing the code parameters and matrices.
 
         >>> lc_solver = LC_Solver()
@@ -573,9 +2517,323 @@ class LC_Solver():
         lc.k, lc.n = lc.G.shape
         lc.M = 2**lc.k
         lc.H = self.calculate_H(lc.G, verbose)
-        lc.d = self._min_hamming_distance(lc.H)
+        # La distància es calcula quan es necessiti (vegeu `LinearCode.d`)
+        lc._distance_processes = processes
         return lc
 
+    @staticmethod
+    def _lane_masks(width: int, lanes: int) -> tuple[int, ...]:
+        """
+        Returns the masks used by `_lane_popcount()` for `lanes` lanes of `width` bits: for each
+        field size (1, 2, 4... up to half the lane), the low half of every field of twice that size.
+        """
+        total = lanes * width
+        masks = []
+        chunk = 1
+        while chunk < width:
+            masks.append(int(("0" * chunk + "1" * chunk) * (total // (2 * chunk)), 2))
+            chunk *= 2
+        return tuple(masks)
+
+    @staticmethod
+    def _lane_popcount(x: int, width: int, masks: tuple[int, ...]) -> int:
+        """
+        Counts the ones of each lane of `width` bits (a power of 2, at least 8) of an integer,
+        all at once (SWAR): the result has the count of each lane in it.
+
+        The counts of neighbouring fields are added pairwise, doubling the field size each time
+        until it is the whole lane, so no count overflows into the next field (a field of s >= 2
+        bits holds counts up to 2^s - 1 >= 2s).
+
+        :param x: The integer with the lanes.
+        :param width: Number of bits of each lane.
+        :param masks: The masks of the lanes, from `_lane_masks()`.
+        :return: The integer with the count of each lane.
+
+        >>> bin(LC_Solver._lane_popcount(0b11100000_00000001_11111111, 8, LC_Solver._lane_masks(8, 3)))
+        '0b110000000100001000'
+        >>> word = int(("1" * 300).rjust(512, "0") + ("1" * 100).rjust(512, "0"), 2)
+        >>> [int(lane, 2) for lane in LC_Solver._lanes(LC_Solver._lane_popcount(word, 512, LC_Solver._lane_masks(512, 2)), 512, 2)]
+        [300, 100]
+        """
+        x -= (x >> 1) & masks[0]
+        chunk = 2
+        for mask in masks[1:]:
+            x = (x & mask) + ((x >> chunk) & mask)
+            chunk *= 2
+        return x
+
+    @classmethod
+    def _solve_batch(self, matrices: list[list[int]], n: int) -> list[tuple[list[int], list[int], int | None]]:
+        """
+        Solves a batch of matrices of the same shape at once. Each matrix is reduced with the
+        backend selected for the shape (see `Backend.select()`), and then the row i of every reduced matrix is packed in a lane of
+        `width` bits of a single integer (a 3-D array: row, matrix, column), so each step of
+        the search of the distance is done for all the matrices with a few operations on integers.
+
+        - Distance (if there are at most `BATCH_DISTANCE_ROWS` rows): all the combinations of the
+          reduced rows are enumerated in Gray code order, and the minimum weight of each lane is
+          kept with lane-wise (SWAR) counts and comparisons.
+        - H: it is built for each matrix from its reduced rows: the row of each non-pivot column f
+          is the unit vector of f plus the pivots of the rows with a 1 at f.
+
+        :param matrices: The packed rows of each matrix (all of them with the same number of rows).
+        :param n: Number of columns.
+        :return: For each matrix, the packed rows of G (the same basis as `solve()`), of H, and d
+                 (None if it has not been computed).
+
+        >>> LC_Solver._solve_batch([[0b1101, 0b0110], [0b1100, 0b0110]], 4)
+        [([11, 6], [14, 9], 2), ([10, 6], [14, 1], 2)]
+        """
+        # Eliminació de cada matriu (files empaquetades): les files no nul·les, ordenades per pivot
+        backend = Backend.select("rref", max(len(matrices[0]), n))
+        bases = []
+        for matrix in matrices:
+            reduced, pivots = backend.rref(BitMatrix(matrix, n))
+            bases.append(reduced.pack_rows()[:len(pivots)])
+        rows = max(map(len, bases))
+        count = len(matrices)
+        width = 8
+        while width < n + 2:
+            width *= 2
+        ones = int(("0" * (width - 1) + "1") * count, 2)
+
+        # Fila i de totes les bases: la matriu b és el carril b (el primer és el més significatiu)
+        packed = [int("".join(format(basis[i] if i < len(basis) else 0, f"0{width}b") for basis in bases), 2)
+                  for i in range(rows)]
+
+        distances = [None] * count
+        if rows <= BATCH_DISTANCE_ROWS:
+            guard = ones << (width - 1)
+            infinite = ones * (n + 1)
+            masks = self._lane_masks(width, count)
+            best = infinite
+            word = 0
+            for step in range(1, 2**rows):
+                word ^= packed[(step & -step).bit_length() - 1]
+                weights = self._lane_popcount(word, width, masks)
+                # Les paraules nul·les (files dependents) no compten
+                nonzero = ((((weights | guard) - ones) & guard) >> (width - 1)) * ((1 << width) - 1)
+                weights = (weights & nonzero) | (infinite & ~nonzero)
+                smaller = ((((best | guard) - weights) & guard) >> (width - 1)) * ((1 << width) - 1)
+                best ^= (best ^ weights) & smaller
+            distances = [value if value <= n else None
+                         for value in (int(chunk, 2) for chunk in self._lanes(best, width, count))]
+
+        results = []
+        for matrix, basis, distance in zip(matrices, bases, distances):
+            pivots = [n - row.bit_length() for row in basis]
+            # G és la base de `solve()` (vegeu `_packed_base()`); H només depèn de l'espai de files
+            results.append((self._packed_base(matrix, n), self._kernel_rows(basis, pivots, n), distance))
+        return results
+
+    @staticmethod
+    def _lanes(x: int, width: int, count: int) -> list[str]:
+        """
+        Splits an integer into `count` lanes of `width` bits, as bit strings (the first one being the most significant).
+
+        >>> LC_Solver._lanes(0x0102, 8, 2)
+        ['00000001', '00000010']
+        """
+        bits = format(x, f"0{width * count}b")
+        return [bits[start:start + width] for start in range(0, width * count, width)]
+
+    @classmethod
+    def solve_many(self, matrices: list[Matrix], processes: int = 1, batch: int = 4096) -> list[LinearCode]:
+        """
+        Solves many matrices at once, as `solve()` does for each one (without printing).
+
+        The matrices are grouped by shape into batches of at most `batch` matrices, and each
+        batch is solved at once (see `_solve_batch()`): the elimination, H and (for at most
+        `BATCH_DISTANCE_ROWS` rows) the minimum distance are computed for all its matrices with
+        operations on integers which hold a row of every matrix. The batches can be solved in
+        parallel, in `processes` processes. The distance of the other codes is computed lazily.
+        The codes are the same ones `solve()` returns: G and H are `Matrix` instances, and G is
+        the same basis (see `_packed_base()`).
+
+        :param matrices: The matrices to solve (`Matrix` or `BitMatrix` instances).
+        :param processes: Number of processes used to solve the batches in parallel.
+        :param batch: Maximum number of matrices of each batch.
+        :return: A LinearCode for each matrix, in the same order.
+
+        >>> codes = LC_Solver.solve_many([Matrix([[1, 1, 0, 1], [0, 1, 1, 0]]), Matrix([[1, 1, 1]]),
+        ...                               Matrix([[1, 0, 0], [0, 1, 0], [1, 1, 0]])])
+        >>> [(code.n, code.k, code.d) for code in codes]
+        [(4, 2, 2), (3, 1, 3), (3, 2, 1)]
+        >>> codes[0].G, codes[0].H
+        ([[1, 0, 1, 1], [0, 1, 1, 0]], [[1, 1, 1, 0], [1, 0, 0, 1]])
+        >>> [code.d for code in LC_Solver.solve_many([Matrix([[1] * 300]), Matrix([[1] * 256])])]
+        [300, 256]
+        """
+        # Lots de matrius de la mateixa forma
+        groups = {}
+        for index, matrix in enumerate(matrices):
+            groups.setdefault(matrix.shape, []).append(index)
+        tasks, indices = [], []
+        for (rows, n), group in groups.items():
+            for start in range(0, len(group), batch):
+                chunk = group[start:start + batch]
+                tasks.append(([matrices[index].pack_rows() for index in chunk], n))
+                indices.append(chunk)
+
+        if processes > 1 and len(tasks) > 1:
+            with Pool(processes) as pool:
+                solved = pool.map(_batch_worker, tasks)
+        else:
+            solved = list(map(_batch_worker, tasks))
+
+        codes = [None] * len(matrices)
+        for (_, n), chunk, results in zip(tasks, indices, solved):
+            for index, (g_rows, h_rows, d) in zip(chunk, results):
+                k = len(g_rows)
+                G = BitMatrix(g_rows, n).to_matrix()
+                if not k:
+                    # Com `calculate_base()` quan elimina totes les files
+                    G.shape = (0, n)
+                codes[index] = LinearCode(G=G, H=BitMatrix(h_rows, n).to_matrix(), n=n, k=k, M=2**k, d=d)
+        return codes
+
+class IncrementalBasis:
+    """
+    Class to represent the basis of a linear code which grows one generator row at a time,
+    without solving the code again (see `LC_Solver.solve()`) after each new row.
+
+    It keeps the rows packed and in reduced row echelon form, with their pivot columns, and
+    a row of the control matrix H for each non-pivot column f: the unit vector of f plus the
+    pivots of the rows with a 1 at f. Adding a row costs O(rank) XORs of packed rows to reduce
+    it (and to clear its pivot column from the other rows), and O(n - rank) XORs to update H.
+    """
+
+    def __init__(self, n: int):
+        """
+        Create an empty basis of vectors of length n.
+
+        >>> IncrementalBasis(4).H
+        [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+        """
+        self.n = n
+        # Files reduïdes (empaquetades) i la seva columna pivot, ordenades per pivot
+        self.rows: list[int] = []
+        self.pivots: list[int] = []
+        # Fila de H de cada columna no pivot
+        self._h_rows: dict[int, int] = {f: 1 << (n - 1 - f) for f in range(n)}
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> 'IncrementalBasis':
+        """
+        Builds the basis of the rows of a matrix, adding them one by one.
+
+        >>> IncrementalBasis.from_matrix(Matrix([[1, 1, 0], [0, 1, 1], [1, 0, 1]])).G
+        [[1, 0, 1], [0, 1, 1]]
+        """
+        basis = cls(matrix.shape[1])
+        for row in matrix.pack_rows():
+            basis.add(row)
+        return basis
+
+    def __len__(self) -> int:
+        """
+        Rank of the basis (the dimension k of the code).
+        """
+        return len(self.rows)
+
+    def reduce(self, vector: int) -> int:
+        """
+        Reduces a packed vector with the rows of the basis: the result is 0 if, and only if,
+        the vector is a combination of them (a codeword).
+
+        >>> basis = IncrementalBasis.from_matrix(Matrix([[1, 1, 0]]))
+        >>> basis.reduce(0b110), bin(basis.reduce(0b101))
+        (0, '0b11')
+        """
+        n = self.n
+        for row, pivot in zip(self.rows, self.pivots):
+            if (vector >> (n - 1 - pivot)) & 1:
+                vector ^= row
+        return vector
+
+    def add(self, vector: list[int] | Row | int) -> bool:
+        """
+        Adds a generator row to the basis, if it is linearly independent of the others.
+
+        The row is reduced (see `reduce()`), and its first 1 becomes a new pivot p, which is
+        cleared from the other rows. The row of H of p is removed, and it is added to the rows
+        of H of the non-pivot columns f where the new row has a 1 (those are the only changes,
+        as the rows of the basis with a 1 at p are the ones of the pivots of that row of H).
+
+        :param vector: The new row, as a list of n bits or packed as an integer of at most n bits.
+        :raises ValueError: If the row does not have n bits.
+        :return: True if the row was independent (and the basis has grown), False otherwise.
+
+        >>> basis = IncrementalBasis(4)
+        >>> basis.add([0, 1, 1, 0]), basis.add([1, 1, 0, 1]), basis.add([1, 0, 1, 1])
+        (True, True, False)
+        >>> basis.G, basis.pivots
+        ([[1, 0, 1, 1], [0, 1, 1, 0]], [0, 1])
+        >>> basis.H
+        [[1, 1, 1, 0], [1, 0, 0, 1]]
+        >>> basis.add(0b10110)
+        Traceback (most recent call last):
+            ...
+        ValueError: Vector 0b10110 does not fit in n = 4 bits
+        >>> basis.add([1, 0, 1])
+        Traceback (most recent call last):
+            ...
+        ValueError: Length of the vector (3) and n (4) do not match
+        """
+        n = self.n
+        if not isinstance(vector, int):
+            if len(vector) != n:
+                raise ValueError(f"Length of the vector ({len(vector)}) and n ({n}) do not match")
+            vector = vector.pack() if isinstance(vector, Row) else Row(list(vector)).pack()
+        elif not 0 <= vector < 1 << n:
+            raise ValueError(f"Vector {vector:#b} does not fit in n = {n} bits")
+        vector = self.reduce(vector)
+        if not vector:
+            return False
+
+        pivot = n - vector.bit_length()
+        bit = 1 << (n - 1 - pivot)
+        for index, row in enumerate(self.rows):
+            if row & bit:
+                self.rows[index] = row ^ vector
+
+        h_pivot = self._h_rows.pop(pivot)
+        for f in self._h_rows:
+            if (vector >> (n - 1 - f)) & 1:
+                self._h_rows[f] ^= h_pivot
+
+        index = bisect_left(self.pivots, pivot)
+        self.rows.insert(index, vector)
+        self.pivots.insert(index, pivot)
+        return True
+
+    @property
+    def G(self) -> BitMatrix:
+        """
+        Generator matrix: the rows of the basis, in reduced row echelon form.
+        """
+        return BitMatrix(list(self.rows), self.n)
+
+    @property
+    def H(self) -> BitMatrix:
+        """
+        Control matrix: a row for each non-pivot column, in increasing order.
+        """
+        return BitMatrix([self._h_rows[f] for f in sorted(self._h_rows)], self.n)
+
+    def code(self) -> LinearCode:
+        """
+        Returns the linear code of the basis, as `LC_Solver.solve()` (its distance is computed
+        when needed, and its decoding tables the first time they are used).
+
+        >>> lc = IncrementalBasis.from_matrix(Matrix([[1, 0, 0, 1, 1], [0, 1, 0, 1, 0], [0, 0, 1, 0, 1]])).code()
+        >>> lc.n, lc.k, lc.M, lc.d
+        (5, 3, 8, 2)
+        """
+        k = len(self.rows)
+        return LinearCode(G=self.G, H=self.H, n=self.n, k=k, M=2**k)
+
 if __name__=="__main__":
     lincode = LinearCode()
     lincode.G = Matrix([
@@ -598,7 +2856,7 @@ if __name__=="__main__":
     print()
     print(lincode.G)
     print()
-    #print(lincode.G*lincode.H.transpose() % 2)
+    #print(lincode.G.mulmod2(lincode.H.transpose()))
     #print(LC_Solver._rrefReduction(M))
     lincode.parameters()
     #solver2 = LC_Solver();
@@ -631,4 +2889,4 @@ if __name__=="__main__":
     # print()
     # print(ham3.G)
 
-    # print(ham3.G*(ham3.H.transpose()) % 2)
+    # print(ham3.G.mulmod2(ham3.H.transpose()))
@@ -6,7 +6,16 @@ class Matrix:
 
     It implements the basic operations: addition, subtraction, multiplication,
     and others such as changing rows/columns, transposing, etc.
+
+    The in-place variants (`+=`, `-=`, `^=`, `imod()`) modify the rows of the
+    matrix, keeping the same `Row` instances.
+
+    The operations modulo 2 (`mulmod2()`, `addmod2()`, `matvec_mod2()`) return the
+    reduced result directly, without building the integer-valued matrix first.
     """
+    # Sense __dict__ per instància: només les files i les dimensions
+    __slots__ = ("matrix", "shape")
+
     def __init__(self, rows):
         """
         Create an instance of a matrix representation
@@ -15,7 +24,13 @@ class Matrix:
         (2, 3)
         >>> Matrix([Row([1, 2, 3]), Row([1, 2, 3])]).shape
         (2, 3)
+        >>> import numpy  # doctest: +SKIP
+        >>> Matrix(numpy.eye(2, dtype=int))  # doctest: +SKIP
+        [[1, 0], [0, 1]]
         """
+        if hasattr(rows, "tolist"):
+            # Array de NumPy: la conversió es fa tota de cop
+            rows = rows.tolist()
         # Matrix que representa la instància.
         self.matrix: list[list[int]] = [Row(row) if not isinstance(row, Row) else row for row in rows]
         # Dimensions de la matriu, sent [0] nombre de files, i [1] nombre de columnes
@@ -90,6 +105,8 @@ class Matrix:
 
             return Matrix(result)
 
+        return NotImplemented
+
     def __mod__(self, mod):
         """
         Apply the module operation to each element of the matrix
@@ -106,6 +123,154 @@ class Matrix:
         """
         return Matrix([row % mod for row in self.matrix])
 
+    def __xor__(self, other: 'Matrix'):
+        """
+        Addition of two binary matrices modulo 2 (XOR of each pair of elements)
+
+        :param other: Another matrix.
+        :return: resulting matrix after apply the operation
+        >>> Matrix([[1, 0, 1], [1, 1, 1]]) ^ Matrix([[1, 1, 0], [0, 0, 1]])
+        [[0, 1, 1], [1, 1, 0]]
+        """
+        if self.shape != other.shape:
+            raise ValueError("Les matrius han de tenir la mateixa mida per sumar-les")
+        return Matrix([r1 ^ r2 for r1, r2 in zip(self.matrix, other.matrix)])
+
+    def __iadd__(self, other: 'Matrix'):
+        """
+        Addition of another matrix, in place (the rows of the matrix are modified)
+
+        :param other: Another matrix.
+        :return: The same matrix, modified.
+        >>> m1 = Matrix([[1, 2, 3], [1, 2, 3]])
+        >>> row = m1[0]
+        >>> m1 += Matrix([[1, 2, 3], [1, 2, 3]])
+        >>> m1, row
+        ([[2, 4, 6], [2, 4, 6]], [2 4 6])
+        """
+        if self.shape != other.shape:
+            raise ValueError("Les matrius han de tenir la mateixa mida per sumar-les")
+        for r1, r2 in zip(self.matrix, other.matrix):
+            r1 += r2
+        return self
+
+    def __isub__(self, other: 'Matrix'):
+        """
+        Substraction of another matrix, in place (the rows of the matrix are modified)
+
+        :param other: Another matrix.
+        :return: The same matrix, modified.
+        >>> m1 = Matrix([[1, 2, 3], [1, 2, 3]])
+        >>> m1 -= Matrix([[1, 2, 3], [1, 1, 1]])
+        >>> m1
+        [[0, 0, 0], [0, 1, 2]]
+        """
+        if self.shape != other.shape:
+            raise ValueError("Les matrius han de tenir la mateixa mida per restar-les")
+        for r1, r2 in zip(self.matrix, other.matrix):
+            r1 -= r2
+        return self
+
+    def __ixor__(self, other: 'Matrix'):
+        """
+        Addition of another binary matrix modulo 2 (XOR), in place
+
+        :param other: Another matrix.
+        :return: The same matrix, modified.
+        >>> m1 = Matrix([[1, 0, 1], [1, 1, 1]])
+        >>> m1 ^= Matrix([[1, 1, 0], [0, 0, 1]])
+        >>> m1
+        [[0, 1, 1], [1, 1, 0]]
+        """
+        if self.shape != other.shape:
+            raise ValueError("Les matrius han de tenir la mateixa mida per sumar-les")
+        for r1, r2 in zip(self.matrix, other.matrix):
+            r1 ^= r2
+        return self
+
+    def imod(self, mod):
+        """
+        Apply the module operation to each element of the matrix, in place
+
+        :param mod: The module value to apply.
+        :return: The same matrix, modified.
+
+        >>> m1 = Matrix([[1, 2, 3], [4, 5, 6]])
+        >>> m1.imod(2)
+        [[1, 0, 1], [0, 1, 0]]
+        >>> m1
+        [[1, 0, 1], [0, 1, 0]]
+        """
+        for row in self.matrix:
+            row.imod(mod)
+        return self
+
+    def mulmod2(self, other: 'Matrix') -> 'Matrix':
+        """
+        Multiplication of two matrices modulo 2, in a single pass: each element is the parity
+        of the AND of a packed row of `self` and a packed column of `other`, so the integer
+        products are never built (it is the same as `(self * other) % 2`).
+
+        :param other: Another matrix (`Matrix` or `BitMatrix`).
+        :return: resulting matrix, with its elements reduced modulo 2.
+        >>> Matrix([[1, 1, 0], [0, 1, 1]]).mulmod2(Matrix([[1, 0], [1, 1], [0, 1]]))
+        [[0, 1], [1, 0]]
+        >>> Matrix([[1, 2, 3]]).mulmod2(Matrix([[1], [1], [1]])) == Matrix([[1, 2, 3]]) * Matrix([[1], [1], [1]]) % 2
+        True
+        """
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Mides de matrius incompatibles per multiplicació: {self.shape} i {other.shape}")
+        columns = other.pack_columns()
+        return Matrix([Row([(word & column).bit_count() & 1 for column in columns]) for word in self.pack_rows()])
+
+    def addmod2(self, other: 'Matrix') -> 'Matrix':
+        """
+        Addition (or substraction) of two matrices modulo 2, in a single pass (it is the same
+        as `(self + other) % 2` and `(self - other) % 2`).
+
+        :param other: Another matrix.
+        :return: resulting matrix, with its elements reduced modulo 2.
+        >>> Matrix([[1, 0, 1], [1, 1, 1]]).addmod2(Matrix([[1, 1, 0], [0, 0, 1]]))
+        [[0, 1, 1], [1, 1, 0]]
+        >>> Matrix([[3, 0]]).addmod2(Matrix([[0, 1]])) == (Matrix([[3, 0]]) - Matrix([[0, 1]])) % 2
+        True
+        """
+        if self.shape != other.shape:
+            raise ValueError("Les matrius han de tenir la mateixa mida per sumar-les")
+        return Matrix([Row([(a + b) & 1 for a, b in zip(r1, r2)]) for r1, r2 in zip(self.matrix, other.matrix)])
+
+    def matvec_mod2(self, vector: 'Row | list[int]') -> Row:
+        """
+        Multiplication of the matrix by a column vector modulo 2, in a single pass: each
+        element is the parity of the AND of a packed row and the packed vector (it is the same
+        as the transposed column of `(self * Matrix([vector]).transpose()) % 2`). With H, it
+        returns the syndrome of a word.
+
+        :param vector: The vector, with as many elements as columns has the matrix.
+        :return: A row with an element per row of the matrix, reduced modulo 2.
+        >>> Matrix([[1, 1, 1, 0], [1, 0, 0, 1]]).matvec_mod2([1, 0, 1, 1])
+        [0 0]
+        >>> Matrix([[1, 1, 1, 0], [1, 0, 0, 1]]).matvec_mod2(Row([0, 1, 0, 1]))
+        [1 1]
+        """
+        vector = vector if isinstance(vector, Row) else Row(list(vector))
+        if len(vector) != self.shape[1]:
+            raise ValueError(f"Mides incompatibles per multiplicació: {self.shape} i {len(vector)}")
+        word = vector.pack()
+        return Row([(row & word).bit_count() & 1 for row in self.pack_rows()])
+
+    def copy(self) -> 'Matrix':
+        """
+        Returns a copy of the matrix, with new rows (modifying one does not modify the other)
+
+        >>> m1 = Matrix([[1, 2], [3, 4]])
+        >>> m2 = m1.copy()
+        >>> m2[0] += Row([1, 1])
+        >>> m1, m2
+        ([[1, 2], [3, 4]], [[2, 3], [3, 4]])
+        """
+        return Matrix([Row(list(row.elements)) for row in self.matrix])
+
     def __getitem__(self, index):
         """
         Access a row of the matrix by its index
@@ -167,7 +332,7 @@ class Matrix:
         True
         """
         if not isinstance(other, Matrix):
-            return False
+            return NotImplemented
 
         if self.shape != other.shape:
             return False
@@ -233,10 +398,8 @@ class Matrix:
         >>> m2.transpose()
         [[7, 9, 11], [8, 10, 12]]
         """
-
-        transposed_rows = [[self.matrix[row_idx][col_idx] for row_idx in range(self.shape[0])]
-                           for col_idx in range(self.shape[1])]
-        return Matrix(transposed_rows)
+        # zip(*files) recorre les columnes sense indexar element a element
+        return Matrix([list(column) for column in zip(*self.matrix)])
 
     def swap_rows(self, row1: int, row2: int):
         """
@@ -386,10 +549,7 @@ class Matrix:
         if not (0 <= column < self.shape[1]):
             raise IndexError("Index de columna fora de límits")
 
-        r = Row()
-        for row in self:
-            r.add_element(row[column])
-        return r
+        return Row([row[column] for row in self.matrix])
 
     def get_columns(self, columns: list[int] | tuple[int]) -> list[Row]:
         """
@@ -463,6 +623,76 @@ class Matrix:
             result.append(self.get_row(row))
         return result
 
+    def pack_rows(self) -> list[int]:
+        """
+        Returns the rows of a binary matrix packed as integers (see `Row.pack()`).
+
+        :return: List with one integer per row, the first column being the most significant bit.
+        >>> Matrix([[1, 0, 1], [0, 1, 1]]).pack_rows()
+        [5, 3]
+        """
+        return [row.pack() for row in self.matrix]
+
+    def pack_columns(self) -> list[int]:
+        """
+        Returns the columns of a binary matrix packed as integers (see `Row.pack()`).
+
+        :return: List with one integer per column, the first row being the most significant bit.
+        >>> Matrix([[1, 0, 1], [0, 1, 1]]).pack_columns()
+        [2, 1, 3]
+        """
+        columns = [0] * self.shape[1]
+        for row in self.matrix:
+            for col, element in enumerate(row.elements):
+                columns[col] = (columns[col] << 1) | (element & 1)
+        return columns
+
+    @classmethod
+    def from_bytes(cls, data: bytes, columns: int) -> 'Matrix':
+        """
+        Creates a matrix from `bytes` (or any object with the buffer protocol), with one element
+        per byte and the rows one after the other. Each row is converted in a single call.
+
+        :param data: The elements of the matrix.
+        :param columns: Number of columns.
+        :return: The matrix.
+        >>> Matrix.from_bytes(b"\\x01\\x00\\x01\\x00\\x01\\x01", 3)
+        [[1, 0, 1], [0, 1, 1]]
+        """
+        data = memoryview(data).cast("B")
+        return cls([list(data[start:start + columns]) for start in range(0, len(data), columns)])
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the elements of a binary matrix as `bytes` (one element per byte, row after row),
+        which can be shared with other libraries through the buffer protocol.
+
+        >>> Matrix([[1, 0, 1], [0, 1, 1]]).to_bytes()
+        b'\\x01\\x00\\x01\\x00\\x01\\x01'
+        """
+        return b"".join(bytes(row.elements) for row in self.matrix)
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Converts the matrix into a 2-D NumPy array (NumPy is only imported when needed).
+
+        >>> import numpy  # doctest: +SKIP
+        >>> numpy.asarray(Matrix([[1, 0], [0, 1]]))  # doctest: +SKIP
+        array([[1, 0],
+               [0, 1]])
+
+        The elements are always copied into a new array, so `copy=False` is not supported.
+
+        >>> Matrix([[1, 0], [0, 1]]).__array__(copy=False)
+        Traceback (most recent call last):
+            ...
+        ValueError: A Matrix cannot be converted into a NumPy array without copying it
+        """
+        if copy is False:
+            raise ValueError("A Matrix cannot be converted into a NumPy array without copying it")
+        import numpy
+        return numpy.array([row.elements for row in self.matrix], dtype=dtype)
+
     def hstack(self, other: 'Matrix') -> 'Matrix':
         """
         Horizontally stacks two matrices (i.e., appends columns of the second matrix to the first matrix).
@@ -4,12 +4,20 @@ class Row:
 
     Implements basic row operations: addition/subtraction,
     scalar multiplication, modular and boolean operations, etc.
+
+    The in-place variants (`+=`, `-=`, `*=`, `^=`, `imod()`) modify the
+    elements of the row, instead of allocating a new one.
     """
+    # Sense __dict__ per instància: només la llista d'elements
+    __slots__ = ("elements",)
 
     def __init__(self, elements: list[int | float] = None):
         """
         Initialize a row instance with the given elements. If none are given, the row is empty.
 
+        The elements can also be given as a NumPy array, or as `bytes` (one element per byte),
+        which are converted in a single call instead of element by element.
+
         :param elements: List of integers or floats of a row (opcional).
         >>> r = Row([1, 2, 3])
         >>> r.elements
@@ -17,7 +25,17 @@ class Row:
         >>> r = Row()
         >>> r.elements
         []
+        >>> Row(bytes([1, 0, 1]))
+        [1 0 1]
+        >>> import numpy  # doctest: +SKIP
+        >>> Row(numpy.array([1, 0, 1]))  # doctest: +SKIP
+        [1 0 1]
         """
+        if isinstance(elements, (bytes, bytearray, memoryview)):
+            elements = list(elements)
+        elif hasattr(elements, "tolist"):
+            # Array de NumPy: la conversió es fa tota de cop
+            elements = elements.tolist()
         self.elements = [] if elements is None else elements
 
     def __add__(self, other):
@@ -34,9 +52,9 @@ class Row:
         [3 4 5]
         """
         if isinstance(other, Row):
-            if len(self.elements) != len(other.elements):
+            if len(self.elements) != len(other):
                 raise ValueError("Rows must have the same length")
-            return Row([a + b for a, b in zip(self.elements, other.elements)])
+            return Row([a + b for a, b in zip(self.elements, other)])
         elif isinstance(other, (int, float)):
             return Row([a + other for a in self.elements])
         return NotImplemented
@@ -55,9 +73,9 @@ class Row:
         [-1 0 1]
         """
         if isinstance(other, Row):
-            if len(self.elements) != len(other.elements):
+            if len(self.elements) != len(other):
                 raise ValueError("Rows must have the same length")
-            return Row([a - b for a, b in zip(self.elements, other.elements)])
+            return Row([a - b for a, b in zip(self.elements, other)])
         elif isinstance(other, (int, float)):
             return Row([a - other for a in self.elements])
         return NotImplemented
@@ -102,6 +120,114 @@ class Row:
         """
         return Row([element % mod for element in self.elements])
 
+    def __xor__(self, other: 'Row') -> 'Row':
+        """
+        Add two binary rows modulo 2 (XOR of each pair of elements).
+
+        :param other: Another row.
+        :return: Resulting row after applying the operation.
+        >>> Row([1, 0, 1]) ^ Row([1, 1, 0])
+        [0 1 1]
+        """
+        if not isinstance(other, Row):
+            return NotImplemented
+        if len(self.elements) != len(other):
+            raise ValueError("Rows must have the same length")
+        return Row([a ^ b for a, b in zip(self.elements, other)])
+
+    def __iadd__(self, other):
+        """
+        Add another row, or a number, to the elements of the row in place.
+
+        :param other: Another row or number.
+        :return: The same row, modified.
+        >>> r1 = Row([1, 2, 3])
+        >>> r2 = r1
+        >>> r1 += Row([4, 5, 6])
+        >>> r1 is r2, r2
+        (True, [5 7 9])
+        >>> r1 += 1
+        >>> r1
+        [6 8 10]
+        """
+        if isinstance(other, Row):
+            if len(self.elements) != len(other):
+                raise ValueError("Rows must have the same length")
+            self.elements[:] = [a + b for a, b in zip(self.elements, other)]
+            return self
+        elif isinstance(other, (int, float)):
+            self.elements[:] = [a + other for a in self.elements]
+            return self
+        return NotImplemented
+
+    def __isub__(self, other):
+        """
+        Subtract another row, or a number, to the elements of the row in place.
+
+        :param other: Another row or number.
+        :return: The same row, modified.
+        >>> r = Row([1, 2, 3])
+        >>> r -= Row([1, 1, 1])
+        >>> r
+        [0 1 2]
+        """
+        if isinstance(other, Row):
+            if len(self.elements) != len(other):
+                raise ValueError("Rows must have the same length")
+            self.elements[:] = [a - b for a, b in zip(self.elements, other)]
+            return self
+        elif isinstance(other, (int, float)):
+            self.elements[:] = [a - other for a in self.elements]
+            return self
+        return NotImplemented
+
+    def __ixor__(self, other: 'Row'):
+        """
+        Add another binary row modulo 2 (XOR) in place.
+
+        :param other: Another row.
+        :return: The same row, modified.
+        >>> r = Row([1, 0, 1])
+        >>> r ^= Row([1, 1, 0])
+        >>> r
+        [0 1 1]
+        """
+        if not isinstance(other, Row):
+            return NotImplemented
+        if len(self.elements) != len(other):
+            raise ValueError("Rows must have the same length")
+        self.elements[:] = [a ^ b for a, b in zip(self.elements, other)]
+        return self
+
+    def __imul__(self, scalar: int | float) -> 'Row':
+        """
+        Multiply each element of the row by a number, in place.
+
+        :param scalar: Number to multiply.
+        :return: The same row, modified.
+        >>> r = Row([1, 2, 3])
+        >>> r *= 2
+        >>> r
+        [2 4 6]
+        """
+        self.elements[:] = [scalar * element for element in self.elements]
+        return self
+
+    def imod(self, mod: int) -> 'Row':
+        """
+        Apply the modulus operation to each element of the row, in place.
+
+        :param mod: Modulus value.
+        :return: The same row, modified.
+        >>> r = Row([10, 15, 20])
+        >>> r.imod(6)
+        [4 3 2]
+        >>> r
+        [4 3 2]
+        """
+        self.elements[:] = [element % mod for element in self.elements]
+        return self
+
     def __getitem__(self, index):
         """
         Allows accessing a specified element, or a slice of the row.
@@ -132,6 +258,15 @@ class Row:
         """
         self.elements[index] = value
 
+    def __iter__(self):
+        """
+        Iterate over the elements of the row.
+
+        >>> list(Row([1, 2, 3]))
+        [1, 2, 3]
+        """
+        return iter(self.elements)
+
     def __len__(self) -> int:
         """
         Obtain the length of the Row
@@ -170,7 +305,7 @@ class Row:
         """
         if len(self) != len(other):
             return False
-        return all([a==b for a, b in zip(self.elements, other.elements)])
+        return all([a==b for a, b in zip(self.elements, other)])
 
     def __bool__(self) -> bool:
         """
@@ -186,6 +321,68 @@ class Row:
         """
         return any(e != 0 for e in self.elements)
 
+    def pack(self) -> int:
+        """
+        Pack a binary row into an integer, the first element being the most significant bit.
+
+        :return: Integer whose binary representation are the row's elements.
+        >>> Row([1, 0, 1, 1]).pack()
+        11
+        >>> Row([0, 0, 1]).pack()
+        1
+        >>> Row().pack()
+        0
+        """
+        word = 0
+        for element in self.elements:
+            word = (word << 1) | (element & 1)
+        return word
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Converts the row into a NumPy array (NumPy is only imported when needed).
+
+        >>> import numpy  # doctest: +SKIP
+        >>> numpy.asarray(Row([1, 0, 1]))  # doctest: +SKIP
+        array([1, 0, 1])
+
+        The elements are always copied into a new array, so `copy=False` is not supported.
+
+        >>> Row([1, 0, 1]).__array__(copy=False)
+        Traceback (most recent call last):
+            ...
+        ValueError: A Row cannot be converted into a NumPy array without copying it
+        """
+        if copy is False:
+            raise ValueError("A Row cannot be converted into a NumPy array without copying it")
+        import numpy
+        return numpy.array(self.elements, dtype=dtype)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the elements of a binary row as `bytes` (one element per byte), which
+        can be shared with other libraries through the buffer protocol.
+
+        >>> Row([1, 0, 1]).to_bytes()
+        b'\\x01\\x00\\x01'
+        """
+        return bytes(self.elements)
+
+    @classmethod
+    def unpack(cls, word: int, length: int) -> 'Row':
+        """
+        Create a binary row of the given length from a packed integer (inverse of `Row.pack()`).
+
+        :param word: Packed integer, the most significant bit being the first element.
+        :param length: Number of elements of the row.
+        :return: The unpacked row.
+        >>> Row.unpack(11, 4)
+        [1 0 1 1]
+        >>> Row.unpack(1, 3)
+        [0 0 1]
+        """
+        return cls([(word >> bit) & 1 for bit in range(length - 1, -1, -1)])
+
     def __repr__(self):
         """
         Representation of the row (same as str()).
@@ -0,0 +1,365 @@
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+from Row import Row
+from LinearCode import LinearCode, LC_Solver
+
+import struct
+
+# Capçalera del segment: versió, n, k, n-k, taula completa, i mides (bytes) de síndromes, paraules i missatges
+_HEADER = struct.Struct("<8Q")
+_VERSION = 1
+# Mida màxima de n-k: la taula de síndromes té una entrada per cada síndrome possible
+MAX_SYNDROME_BITS = 24
+# Formats de memoryview per a les entrades d'1, 2, 4 i 8 bytes
+_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+def _entry_size(bits: int) -> int:
+    """
+    Returns the bytes of an entry of `bits` bits: 1, 2, 4 or 8 if it fits in a machine
+    word (so the segment can be read as an array), or the exact number of bytes otherwise.
+
+    >>> _entry_size(7), _entry_size(12), _entry_size(33), _entry_size(100)
+    (1, 2, 8, 13)
+    """
+    size = max(1, (bits + 7) // 8)
+    for fixed in _FORMATS:
+        if size <= fixed:
+            return fixed
+    return size
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+class _WideView:
+    """
+    Array of integers of more than 8 bytes over a buffer (little-endian), with the same
+    indexing as a memoryview of fixed-size integers.
+    """
+    __slots__ = ("buffer", "size")
+
+    def __init__(self, buffer: memoryview, size: int):
+        self.buffer = buffer
+        self.size = size
+
+    def __getitem__(self, index: int) -> int:
+        start = index * self.size
+        return int.from_bytes(self.buffer[start:start + self.size], "little")
+
+    def __setitem__(self, index: int, value: int):
+        start = index * self.size
+        self.buffer[start:start + self.size] = value.to_bytes(self.size, "little")
+
+    def release(self):
+        self.buffer.release()
+
+def _view(buffer: memoryview, offset: int, count: int, size: int):
+    """
+    Returns an indexable array of `count` integers of `size` bytes, at `offset` of the buffer.
+    """
+    region = buffer[offset:offset + count * size]
+    if size in _FORMATS:
+        return region.cast(_FORMATS[size])
+    return _WideView(region, size)
+
+class SharedCode:
+    """
+    Class to represent the decoding artifacts of a linear code in a shared memory segment,
+    so several processes of the same host can decode with a single copy of them.
+
+    The segment holds, in a packed layout:
+        - The syndrome tables: the XOR of the columns of H selected by each byte of a
+          block (see `LinearCode._xor_tables()`), instead of H.
+        - The leader of each syndrome (see `LinearCode.syndrome_table()`), 0 if it has none.
+        - The message tables: the message bits selected by each byte of a codeword (from the
+          reduced rows of `LinearCode._decode_word()`), instead of the code elements.
+
+    The process which builds it (`create()`) owns the segment and must `unlink()` it; the
+    others `attach()` to it by its name and only read it.
+    """
+
+    def __init__(self, memory: SharedMemory, owner: bool = False):
+        """
+        Create an instance over an existing segment (see `create()` and `attach()`).
+        """
+        self.memory = memory
+        self.owner = owner
+        version, self.n, self.k, self.r, complete, syndrome_size, word_size, message_size = \
+            _HEADER.unpack_from(memory.buf)
+        if version != _VERSION:
+            raise ValueError(f"Unsupported shared code version ({version})")
+        self.complete = bool(complete)
+        self.word_size, self.message_size = word_size, message_size
+
+        buffer = memory.buf
+        tables = (self.n + 7) // 8
+        offset = _aligned(_HEADER.size)
+        self._syndrome_tables = []
+        for _ in range(tables):
+            self._syndrome_tables.append(_view(buffer, offset, 256, syndrome_size))
+            offset = _aligned(offset + 256 * syndrome_size)
+        self._leaders = _view(buffer, offset, 1 << self.r, word_size)
+        offset = _aligned(offset + (1 << self.r) * word_size)
+        self._message_tables = []
+        for _ in range(tables):
+            self._message_tables.append(_view(buffer, offset, 256, message_size))
+            offset = _aligned(offset + 256 * message_size)
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the segment, to attach to it from other processes.
+        """
+        return self.memory.name
+
+    @classmethod
+    def create(cls, code: LinearCode, complete: bool = False, name: str = None) -> 'SharedCode':
+        """
+        Builds the decoding artifacts of a code into a new shared memory segment.
+
+        :param code: The linear code (with G, H, n, k and d).
+        :param complete: If True, the complete syndrome table is stored.
+        :param name: Name of the segment (by default, a random one).
+        :return: The shared code, owner of the segment.
+
+        >>> from LinearCode import HammingCode
+        >>> shared = SharedCode.create(HammingCode(t=3))
+        >>> shared.n, shared.k, shared.r
+        (7, 4, 3)
+        >>> shared.close(); shared.unlink()
+        """
+        n, k = code.n, code.k
+        r = code.H.shape[0]
+        if r > MAX_SYNDROME_BITS:
+            raise ValueError(f"The syndrome table of {2**r} entries is too large to share (n - k > {MAX_SYNDROME_BITS})")
+
+        syndrome_size, word_size, message_size = _entry_size(r), _entry_size(n), _entry_size(k)
+        syndrome_tables = LinearCode._xor_tables(code.H.pack_columns())
+
+        # Missatge seleccionat per cada posició: la part augmentada de la fila reduïda amb pivot a la posició
+        rows, pivots = LC_Solver._packed_rref(code._isd_rows(), n + k)
+        selected = [0] * n
+        for row, pivot in zip(rows, pivots):
+            selected[pivot] = row & ((1 << k) - 1)
+        message_tables = LinearCode._xor_tables(selected)
+
+        tables = len(syndrome_tables)
+        size = _aligned(_HEADER.size)
+        size += tables * _aligned(256 * syndrome_size)
+        size = _aligned(size + (1 << r) * word_size)
+        size += tables * _aligned(256 * message_size)
+
+        memory = SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(memory.buf, 0, _VERSION, n, k, r, complete, syndrome_size, word_size, message_size)
+        shared = cls(memory, owner=True)
+        for view, table in zip(shared._syndrome_tables, syndrome_tables):
+            for value, syndrome in enumerate(table):
+                view[value] = syndrome
+        for syndrome, leader in code.syndrome_table(complete).items():
+            shared._leaders[syndrome] = leader
+        for view, table in zip(shared._message_tables, message_tables):
+            for value, message in enumerate(table):
+                view[value] = message
+        return shared
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedCode':
+        """
+        Attaches to the segment of a shared code created by another process.
+
+        >>> from LinearCode import HammingCode
+        >>> shared = SharedCode.create(HammingCode(t=3))
+        >>> other = SharedCode.attach(shared.name)
+        >>> other.decode_word(0b1010101)
+        11
+        >>> other.close(); shared.close(); shared.unlink()
+        """
+        return cls(SharedMemory(name=name))
+
+    def syndrome(self, word: int) -> int:
+        """
+        Computes the syndrome of a packed block (see `LinearCode.syndrome()`).
+        """
+        syndrome = 0
+        for table in self._syndrome_tables:
+            syndrome ^= table[word & 0xFF]
+            word >>= 8
+        return syndrome
+
+    def correct_word(self, word: int) -> int | None:
+        """
+        Corrects a packed block with the shared syndrome table (see `LinearCode._correct_word()`).
+
+        >>> from LinearCode import HammingCode
+        >>> shared = SharedCode.create(HammingCode(t=3))
+        >>> bin(shared.correct_word(0b1010101 ^ 0b100))
+        '0b1010101'
+        >>> shared.close(); shared.unlink()
+        """
+        syndrome = self.syndrome(word)
+        if not syndrome:
+            return word
+        error = self._leaders[syndrome]
+        if not error:
+            return None
+        return word ^ error
+
+    def decode_word(self, word: int) -> int:
+        """
+        Returns the packed message of a packed codeword (see `LinearCode._decode_word()`).
+        """
+        message = 0
+        for table in self._message_tables:
+            message ^= table[word & 0xFF]
+            word >>= 8
+        return message
+
+    def close(self):
+        """
+        Detaches this process from the segment.
+        """
+        for view in (*self._syndrome_tables, self._leaders, *self._message_tables):
+            view.release()
+        self._syndrome_tables, self._leaders, self._message_tables = [], None, []
+        self.memory.close()
+
+    def unlink(self):
+        """
+        Frees the segment (only by its owner, once every process has detached).
+        """
+        if self.owner:
+            self.memory.unlink()
+
+# Estat de cada procés de `SharedDecoderPool`: el codi compartit i els anells d'entrada i sortida
+_shared_state = None
+
+def _shared_init(names: tuple[str, str, str], capacity: int):
+    global _shared_state
+    code = SharedCode.attach(names[0])
+    received, decoded = SharedMemory(name=names[1]), SharedMemory(name=names[2])
+    slots = received.size // (capacity * code.word_size)
+    _shared_state = (code,
+                     [_view(received.buf, slot * capacity * code.word_size, capacity, code.word_size)
+                      for slot in range(slots)],
+                     [_view(decoded.buf, slot * capacity * code.message_size, capacity, code.message_size)
+                      for slot in range(slots)],
+                     (received, decoded))
+
+def _shared_worker(task: tuple[int, int]) -> tuple[int, list[int]]:
+    code, received, decoded, _ = _shared_state
+    slot, count = task
+    words, messages = received[slot], decoded[slot]
+    failed = []
+    for index in range(count):
+        word = code.correct_word(words[index])
+        if word is None:
+            failed.append(index)
+        else:
+            messages[index] = code.decode_word(word)
+    return slot, failed
+
+class SharedDecoderPool:
+    """
+    Class to represent a pool of decoder processes which share the decoding artifacts of a
+    linear code (see `SharedCode`): they are built once by the parent process, and every
+    worker attaches to them instead of holding its own G, H, code elements and syndrome table.
+
+    The received blocks and the decoded messages are not pickled either: they go through two
+    rings of `slots` slots of `capacity` blocks in shared memory. The parent packs the blocks
+    into a free slot and only sends its index to a worker, which writes the messages into the
+    same slot of the output ring and returns the indices of the uncorrectable blocks.
+
+    It can be used as a context manager, which frees the processes and the segments on exit.
+    """
+
+    def __init__(self, code: LinearCode, processes: int = 2, complete: bool = False,
+                 slots: int = None, capacity: int = 4096):
+        """
+        Create a pool of decoder processes for a linear code.
+
+        :param code: The linear code (with G, H, n, k and d).
+        :param processes: Number of decoder processes.
+        :param complete: If True, the blocks are decoded with the complete syndrome table.
+        :param slots: Number of slots of the rings (by default, two per process).
+        :param capacity: Number of blocks of each slot.
+        """
+        self.linear_code = code
+        self.code = SharedCode.create(code, complete)
+        self.slots = slots or 2 * processes
+        self.capacity = capacity
+        self._received = SharedMemory(create=True, size=self.slots * capacity * self.code.word_size)
+        self._decoded = SharedMemory(create=True, size=self.slots * capacity * self.code.message_size)
+        self._pool = Pool(processes, initializer=_shared_init,
+                          initargs=((self.code.name, self._received.name, self._decoded.name), capacity))
+
+    def __enter__(self) -> 'SharedDecoderPool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def decode(self, bits: list[int] | str, depth: int = 1) -> str:
+        """
+        Decodes a list of bits (or a bit string) correcting errors, as `LinearCode.decodify_correct()`.
+
+        :param bits: A list of bits or a string of bits to decode.
+        :param depth: Depth of the block interleaver used to encode them (see `LinearCode.codify()`).
+        :return: A string representing the decoded message, with '?' for uncorrectable blocks.
+
+        >>> from LinearCode import HammingCode
+        >>> ham = HammingCode(t=3)
+        >>> bits = ham.codify("1011" * 10)
+        >>> noisy = bits[:3] + str(1 - int(bits[3])) + bits[4:]
+        >>> with SharedDecoderPool(ham, processes=2, capacity=4) as pool:
+        ...     pool.decode(noisy) == "1011" * 10
+        True
+        """
+        n, k = self.code.n, self.code.k
+        words = list(self.linear_code._split_bits_in_words(bits, n, depth))
+        received = [_view(self._received.buf, slot * self.capacity * self.code.word_size, self.capacity,
+                          self.code.word_size) for slot in range(self.slots)]
+        decoded = [_view(self._decoded.buf, slot * self.capacity * self.code.message_size, self.capacity,
+                         self.code.message_size) for slot in range(self.slots)]
+
+        msgs = []
+        pending = []
+
+        def collect():
+            # El lot més antic de l'anell: els seus missatges s'afegeixen en ordre i el seu slot queda lliure
+            start, count, result = pending.pop(0)
+            slot, failed = result.get()
+            failed = set(failed)
+            for index in range(count):
+                if index in failed:
+                    print(f"Warning! Block {[Row.unpack(words[start + index], n).elements]} has more errors than the linear code's correct capabilites")
+                    msgs.append("?"*k)
+                else:
+                    msgs.append(format(decoded[slot][index], f"0{k}b"))
+            return slot
+
+        try:
+            free = list(range(self.slots))
+            for start in range(0, len(words), self.capacity):
+                slot = free.pop() if free else collect()
+                batch = words[start:start + self.capacity]
+                for index, word in enumerate(batch):
+                    received[slot][index] = word
+                pending.append((start, len(batch), self._pool.apply_async(_shared_worker, ((slot, len(batch)),))))
+            while pending:
+                collect()
+        finally:
+            for view in (*received, *decoded):
+                view.release()
+        return "".join(msgs)
+
+    def close(self):
+        """
+        Stops the processes and frees the shared segments.
+        """
+        self._pool.close()
+        self._pool.join()
+        for memory in (self._received, self._decoded):
+            memory.close()
+            memory.unlink()
+        self.code.close()
+        self.code.unlink()
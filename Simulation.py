@@ -0,0 +1,225 @@
+from dataclasses import dataclass
+from multiprocessing import Pool
+from statistics import NormalDist
+
+from LinearCode import LinearCode
+
+import random
+
+# Bits de precisió de la probabilitat de creuament del canal
+PRECISION = 32
+
+@dataclass
+class SimulationResult:
+    """
+    Class to represent the result of a Monte Carlo simulation of a linear code over
+    a binary symmetric channel with crossover probability p.
+
+    It holds the counts of transmitted and erroneous message bits and blocks, from which
+    the bit error rate (BER), the block error rate (BLER) and their confidence intervals
+    (Wilson score intervals) are computed.
+    """
+    p: float
+    blocks: int
+    bits: int
+    bit_errors: int
+    block_errors: int
+    confidence: float = 0.95
+
+    @property
+    def ber(self) -> float:
+        """
+        Bit error rate: the fraction of message bits decoded wrongly.
+
+        >>> SimulationResult(p=0.1, blocks=10, bits=40, bit_errors=2, block_errors=1).ber
+        0.05
+        """
+        return self.bit_errors / self.bits if self.bits else 0.0
+
+    @property
+    def bler(self) -> float:
+        """
+        Block error rate: the fraction of blocks decoded wrongly (or not decoded).
+
+        >>> SimulationResult(p=0.1, blocks=10, bits=40, bit_errors=2, block_errors=1).bler
+        0.1
+        """
+        return self.block_errors / self.blocks if self.blocks else 0.0
+
+    def ber_interval(self) -> tuple[float, float]:
+        """
+        Confidence interval of the bit error rate.
+
+        >>> low, high = SimulationResult(p=0.1, blocks=10, bits=40, bit_errors=2, block_errors=1).ber_interval()
+        >>> round(low, 4), round(high, 4)
+        (0.0138, 0.165)
+        """
+        return _wilson_interval(self.bit_errors, self.bits, self.confidence)
+
+    def bler_interval(self) -> tuple[float, float]:
+        """
+        Confidence interval of the block error rate.
+
+        >>> low, high = SimulationResult(p=0.1, blocks=10, bits=40, bit_errors=2, block_errors=0).bler_interval()
+        >>> round(low, 4), round(high, 4)
+        (0.0, 0.2775)
+        """
+        return _wilson_interval(self.block_errors, self.blocks, self.confidence)
+
+def _wilson_interval(errors: int, trials: int, confidence: float) -> tuple[float, float]:
+    """
+    Wilson score interval of a proportion of `errors` in `trials`.
+
+    >>> _wilson_interval(0, 0, 0.95)
+    (0.0, 1.0)
+    """
+    if not trials:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rate = errors / trials
+    denominator = 1 + z * z / trials
+    centre = (rate + z * z / (2 * trials)) / denominator
+    margin = z * ((rate * (1 - rate) + z * z / (4 * trials)) / trials) ** 0.5 / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+def _bernoulli_mask(rng: random.Random, width: int, p: float) -> int:
+    """
+    Returns an integer of `width` random bits, each of them set with probability p
+    (rounded to PRECISION bits), using one random word per bit of precision.
+
+    The binary digits of p are consumed from the least significant one: a 1 is an OR with
+    a random word (the probability becomes (q + 1) / 2) and a 0 is an AND (q / 2).
+
+    >>> rng = random.Random(0)
+    >>> _bernoulli_mask(rng, 8, 0.0), _bernoulli_mask(rng, 8, 1.0)
+    (0, 255)
+    >>> ones = sum(_bernoulli_mask(rng, 1000, 0.25).bit_count() for _ in range(100))
+    >>> 24000 < ones < 26000
+    True
+    """
+    scaled = round(p * (1 << PRECISION))
+    if scaled <= 0:
+        return 0
+    if scaled >= 1 << PRECISION:
+        return (1 << width) - 1
+
+    mask = 0
+    # Els zeros menys significatius no canvien una màscara buida
+    trailing = (scaled & -scaled).bit_length() - 1
+    scaled >>= trailing
+    for _ in range(PRECISION - trailing):
+        bits = rng.getrandbits(width)
+        mask = (mask | bits) if scaled & 1 else (mask & bits)
+        scaled >>= 1
+    return mask
+
+def _simulate_batch(code: LinearCode, columns: list[int], p: float, blocks: int, rng: random.Random,
+                    complete: bool = False) -> tuple[int, int]:
+    """
+    Transmits `blocks` random messages over the channel, bit-sliced: the messages, the
+    codewords and the errors of all the blocks are held in bit-planes (see
+    `LinearCode.decodify_sliced()`), and decoded with `LinearCode._correct_planes()`.
+
+    :param code: The linear code.
+    :param columns: The packed columns of G.
+    :param p: Crossover probability of the channel.
+    :param blocks: Number of blocks.
+    :param rng: Random generator of the messages and the errors.
+    :param complete: If True, the complete syndrome table is used.
+    :return: The number of message bits and of blocks decoded wrongly.
+
+    >>> from LinearCode import HammingCode
+    >>> ham = HammingCode(t=3)
+    >>> _simulate_batch(ham, ham.G.pack_columns(), 0.0, 100, random.Random(0))
+    (0, 0)
+    """
+    k = code.k
+    messages = [rng.getrandbits(blocks) for _ in range(k)]
+
+    # Plans de les paraules del codi: el pla j és la XOR dels plans dels bits del missatge amb un 1 a la columna j de G
+    planes = []
+    for column in columns:
+        plane = 0
+        while column:
+            lowest = column & -column
+            plane ^= messages[k - lowest.bit_length()]
+            column ^= lowest
+        planes.append(plane ^ _bernoulli_mask(rng, blocks, p))
+
+    failed = code._correct_planes(planes, blocks, True, complete, verbose=False)
+    wrong = failed
+    bit_errors = 0
+    for decoded, message in zip(code._message_planes(planes, blocks), messages):
+        diff = decoded ^ message
+        bit_errors += diff.bit_count()
+        wrong |= diff
+    return bit_errors, wrong.bit_count()
+
+# Estat de cada procés de `simulate` (el codi es passa un sol cop)
+_simulation_state = None
+
+def _simulation_init(state: tuple):
+    global _simulation_state
+    _simulation_state = state
+
+def _simulation_worker(task: tuple[int, float, int, int]) -> tuple[int, int, int]:
+    code, columns, seed, complete = _simulation_state
+    index, p, batch, blocks = task
+    # Un generador independent per lot: el resultat no depèn del repartiment entre processos
+    rng = random.Random(None if seed is None else f"{seed}:{index}:{batch}")
+    return (index, *_simulate_batch(code, columns, p, blocks, rng, complete))
+
+def simulate(code: LinearCode, probabilities: list[float], blocks: int = 100000, width: int = 4096,
+             processes: int = 1, seed: int = None, confidence: float = 0.95,
+             complete: bool = False) -> list[SimulationResult]:
+    """
+    Simulates the transmission of random messages with a linear code over binary symmetric
+    channels, and returns the bit and block error rates after decoding with error correction.
+
+    The blocks are simulated in batches of `width` blocks, bit-sliced (see `_simulate_batch()`),
+    so no bit strings are built. The batches of all the probabilities can be run in parallel,
+    each one with its own random generator.
+
+    :param code: The linear code (with G, H, n, k and d).
+    :param probabilities: The crossover probabilities of the channels to simulate.
+    :param blocks: Number of blocks simulated for each probability.
+    :param width: Number of blocks of each batch.
+    :param processes: Number of processes used to simulate the batches in parallel.
+    :param seed: Seed of the random generators, to get reproducible results.
+    :param confidence: Confidence level of the intervals of the results.
+    :param complete: If True, the blocks are decoded with the complete syndrome table.
+    :return: A SimulationResult for each probability.
+
+    >>> from LinearCode import HammingCode
+    >>> ham = HammingCode(t=3)
+    >>> clean, noisy = simulate(ham, [0.0, 0.01], blocks=20000, seed=1)
+    >>> clean.ber, clean.bler
+    (0.0, 0.0)
+    >>> noisy.blocks, noisy.bits, 0.001 < noisy.bler < 0.003
+    (20000, 80000, True)
+    >>> simulate(ham, [0.01], blocks=20000, width=1000, seed=1, processes=2) == \\
+    ...     simulate(ham, [0.01], blocks=20000, width=1000, seed=1)
+    True
+    """
+    columns = code.G.pack_columns()
+    tasks = [(index, p, batch, min(width, blocks - start))
+             for index, p in enumerate(probabilities)
+             for batch, start in enumerate(range(0, blocks, width))]
+
+    state = (code, columns, seed, complete)
+    if processes > 1 and len(tasks) > 1:
+        with Pool(processes, initializer=_simulation_init, initargs=(state,)) as pool:
+            counts = pool.map(_simulation_worker, tasks)
+    else:
+        _simulation_init(state)
+        counts = list(map(_simulation_worker, tasks))
+
+    bit_errors = [0] * len(probabilities)
+    block_errors = [0] * len(probabilities)
+    for index, bits, wrong in counts:
+        bit_errors[index] += bits
+        block_errors[index] += wrong
+
+    return [SimulationResult(p=p, blocks=blocks, bits=blocks * code.k, bit_errors=bit_errors[index],
+                             block_errors=block_errors[index], confidence=confidence)
+            for index, p in enumerate(probabilities)]
@@ -0,0 +1,212 @@
+from Row import Row
+from Matrix import Matrix
+
+class SparseMatrix:
+    """
+    Class to represent a sparse binary matrix (over the F2 field), such as the
+    parity-check matrix of an LDPC code, storing only the positions of its ones.
+
+    For each row it keeps the indices of the columns with a one, and for each
+    column the indices of the rows with a one, so the operations used by the
+    iterative decoders (and the syndromes) cost a time proportional to the number
+    of ones, instead of to the size of the matrix.
+    """
+    __slots__ = ("row_indices", "column_indices", "shape")
+
+    def __init__(self, row_indices: list[list[int]], columns: int):
+        """
+        Create an instance of a sparse binary matrix representation
+
+        :param row_indices: For each row, the (sorted) indices of the columns with a one.
+        :param columns: Number of columns.
+
+        >>> m = SparseMatrix([[0, 2], [1, 2]], 3)
+        >>> m.shape, m.column_indices
+        ((2, 3), [[0], [1], [0, 1]])
+        """
+        # Índexs de les columnes amb un 1 de cada fila
+        self.row_indices: list[list[int]] = [sorted(row) for row in row_indices]
+        # Índexs de les files amb un 1 de cada columna
+        self.column_indices: list[list[int]] = [[] for _ in range(columns)]
+        for r, row in enumerate(self.row_indices):
+            for c in row:
+                self.column_indices[c].append(r)
+        # Dimensions de la matriu, sent [0] nombre de files, i [1] nombre de columnes
+        self.shape: tuple[int, int] = (len(self.row_indices), columns)
+
+    @classmethod
+    def from_matrix(cls, matrix) -> 'SparseMatrix':
+        """
+        Builds the sparse representation of a binary `Matrix` (or `BitMatrix`).
+
+        >>> SparseMatrix.from_matrix(Matrix([[1, 0, 1], [0, 1, 1]])).row_indices
+        [[0, 2], [1, 2]]
+        """
+        if isinstance(matrix, SparseMatrix):
+            return matrix
+        columns = matrix.shape[1]
+        return cls([[c for c, bit in enumerate(format(row, f"0{columns}b")) if bit == "1"]
+                    for row in matrix.pack_rows()], columns)
+
+    def to_matrix(self) -> Matrix:
+        """
+        Converts the matrix into a dense `Matrix` instance.
+
+        >>> m = SparseMatrix([[0, 2], [1, 2]], 3).to_matrix()
+        >>> type(m).__name__, m
+        ('Matrix', [[1, 0, 1], [0, 1, 1]])
+        """
+        return Matrix(list(self))
+
+    def pack_rows(self) -> list[int]:
+        """
+        Returns the rows of the matrix packed as integers (the first column being the most significant bit).
+
+        >>> SparseMatrix([[0, 2], [1, 2]], 3).pack_rows()
+        [5, 3]
+        """
+        columns = self.shape[1]
+        return [sum(1 << (columns - 1 - c) for c in row) for row in self.row_indices]
+
+    def pack_columns(self) -> list[int]:
+        """
+        Returns the columns of the matrix packed as integers (the first row being the most significant bit).
+
+        >>> SparseMatrix([[0, 2], [1, 2]], 3).pack_columns()
+        [2, 1, 3]
+        """
+        rows = self.shape[0]
+        return [sum(1 << (rows - 1 - r) for r in column) for column in self.column_indices]
+
+    def weight(self) -> int:
+        """
+        Returns the number of ones of the matrix.
+
+        >>> SparseMatrix([[0, 2], [1, 2]], 3).weight()
+        4
+        """
+        return sum(map(len, self.row_indices))
+
+    def syndrome(self, word: int) -> int:
+        """
+        Computes the syndrome M·y^t of a packed block y, with a cost proportional to
+        the number of ones of the matrix (plus the length of the block).
+
+        :param word: Block packed as an integer (see `Row.pack()`).
+        :return: The syndrome packed as an integer, the first row being the most significant bit.
+
+        >>> bin(SparseMatrix([[0, 2], [1, 2]], 3).syndrome(0b110))
+        '0b11'
+        """
+        bits = format(word, f"0{self.shape[1]}b")
+        syndrome = 0
+        for row in self.row_indices:
+            parity = 0
+            for c in row:
+                parity ^= bits[c] == "1"
+            syndrome = (syndrome << 1) | parity
+        return syndrome
+
+    def __repr__(self):
+        """
+        Representation of a matrix in list form (same as `Matrix`)
+
+        >>> SparseMatrix([[0, 2], [1, 2]], 3)
+        [[1, 0, 1], [0, 1, 1]]
+        """
+        return str([row.elements for row in self])
+
+    def __str__(self):
+        """
+        Return a string representation of the matrix where each row is on a new line.
+
+        >>> print(SparseMatrix([[0, 2], [1, 2]], 3))
+        [1 0 1]
+        [0 1 1]
+        """
+        return "\n".join(str(row) for row in self)
+
+    def __len__(self):
+        """
+        Return the number of rows in the matrix
+
+        >>> len(SparseMatrix([[0, 2], [1, 2]], 3))
+        2
+        """
+        return self.shape[0]
+
+    def __iter__(self):
+        """
+        Iterate over the (dense) rows of the matrix.
+
+        >>> list(SparseMatrix([[0, 2], [1, 2]], 3))
+        [[1 0 1], [0 1 1]]
+        """
+        for r in range(self.shape[0]):
+            yield self[r]
+
+    def __getitem__(self, index: int) -> Row:
+        """
+        Access a row of the matrix by its index, as a dense `Row`.
+
+        >>> SparseMatrix([[0, 2], [1, 2]], 3)[1]
+        [0 1 1]
+        """
+        elements = [0] * self.shape[1]
+        for c in self.row_indices[index]:
+            elements[c] = 1
+        return Row(elements)
+
+    def __eq__(self, other) -> bool:
+        """
+        Defines the equality relation between two binary matrices (sparse or not)
+
+        >>> SparseMatrix([[0], [1]], 2) == Matrix.eye(2)
+        True
+        >>> SparseMatrix([[0], [1]], 2) == SparseMatrix([[0], [0, 1]], 2)
+        False
+        """
+        if isinstance(other, SparseMatrix):
+            return self.shape == other.shape and self.row_indices == other.row_indices
+        if not hasattr(other, "pack_rows"):
+            return NotImplemented
+        return self.shape == other.shape and self.pack_rows() == other.pack_rows()
+
+    def __bool__(self) -> bool:
+        """
+        Defines if the matrix is non-zero
+
+        >>> bool(SparseMatrix([[], []], 2))
+        False
+        """
+        return any(self.row_indices)
+
+    def transpose(self) -> 'SparseMatrix':
+        """
+        Returns the transposed matrix (the adjacencies of rows and columns are swapped).
+
+        >>> SparseMatrix([[0, 2], [1, 2]], 3).transpose()
+        [[1, 0], [0, 1], [1, 1]]
+        """
+        return SparseMatrix(self.column_indices, self.shape[0])
+
+    def get_row(self, row: int) -> Row:
+        """
+        Returns a row of the matrix by its index.
+
+        >>> SparseMatrix([[0, 2], [1, 2]], 3).get_row(0)
+        [1 0 1]
+        """
+        return self[row]
+
+    def get_column(self, column: int) -> Row:
+        """
+        Returns a column of the matrix by its index.
+
+        >>> SparseMatrix([[0, 2], [1, 2]], 3).get_column(2)
+        [1 1]
+        """
+        elements = [0] * self.shape[0]
+        for r in self.column_indices[column]:
+            elements[r] = 1
+        return Row(elements)
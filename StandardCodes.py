@@ -0,0 +1,183 @@
+from BitMatrix import BitMatrix
+from LinearCode import LinearCode, HammingCode, LC_Solver
+
+from array import array
+import os
+import sys
+
+# Les taules de síndromes només es desen si tenen com a molt 2^12 entrades
+MAX_TABLE_SYNDROME_BITS = 12
+# Fitxer amb les dades precalculades (vegeu `generate()`)
+DATA_MODULE = "StandardCodesData"
+# Tipus (d'`array`) de les entrades de les taules, segons el nombre de bits n
+_TYPECODES = ((8, "B"), (16, "H"), (32, "I"), (64, "Q"))
+
+# Dades ja llegides de cada codi: files de G i de H, i taula de síndromes
+_loaded = {}
+
+def _golay() -> LinearCode:
+    """
+    Builds the binary Golay code [23, 12, 7]: the cyclic code generated by
+    g(x) = x^11 + x^10 + x^6 + x^5 + x^4 + x^2 + 1 (G has the 12 shifts of g).
+    """
+    g = 0b110001110101
+    return _from_generators([g << (11 - i) for i in range(12)], 23)
+
+def _reed_muller(m: int) -> LinearCode:
+    """
+    Builds the first order Reed-Muller code RM(1, m) [2^m, m+1, 2^(m-1)]: the row of ones and,
+    for each bit of the position, the row with that bit of every position.
+    """
+    n = 2**m
+    rows = [(1 << n) - 1]
+    for i in range(m):
+        rows.append(int("".join(str((j >> (m - 1 - i)) & 1) for j in range(n)), 2))
+    return _from_generators(rows, n)
+
+def _from_generators(rows: list[int], n: int) -> LinearCode:
+    """
+    Builds a code from independent packed generator rows, with H from `LC_Solver.kernel()`.
+    """
+    G = BitMatrix(rows, n)
+    H, _ = LC_Solver.kernel(G)
+    k = len(rows)
+    return LinearCode(G=G, H=BitMatrix.from_matrix(H), n=n, k=k, M=2**k)
+
+# Codis estàndard: nom ("família_n_k") -> funció que el construeix (només per generar les dades)
+DEFINITIONS = {}
+for _t in range(3, 7):
+    DEFINITIONS[f"hamming_{2**_t - 1}_{2**_t - 1 - _t}"] = lambda t=_t: HammingCode(t=t)
+    DEFINITIONS[f"extended_hamming_{2**_t}_{2**_t - 1 - _t}"] = lambda t=_t: HammingCode(t=t, extended=True)
+    DEFINITIONS[f"simplex_{2**_t - 1}_{_t}"] = lambda t=_t: HammingCode(t=t).dual()
+for _m in range(3, 6):
+    DEFINITIONS[f"reed_muller_{2**_m}_{_m + 1}"] = lambda m=_m: _reed_muller(m)
+DEFINITIONS["golay_23_12"] = _golay
+DEFINITIONS["golay_24_12"] = lambda: _golay().extend()
+for _n in (3, 5, 7):
+    DEFINITIONS[f"repetition_{_n}_1"] = lambda n=_n: _from_generators([(1 << n) - 1], n)
+for _n in (4, 8, 16):
+    DEFINITIONS[f"parity_{_n}_{_n - 1}"] = lambda n=_n: _from_generators([(1 << (n - 1 - i)) | 1 for i in range(n - 1)], n)
+
+def names() -> list[str]:
+    """
+    Returns the names of the standard codes of the registry.
+
+    >>> names()[:3]
+    ['hamming_7_4', 'extended_hamming_8_4', 'simplex_7_3']
+    """
+    return list(DEFINITIONS)
+
+def build(name: str) -> LinearCode:
+    """
+    Builds a standard code with the linear algebra of the library (G, H, d and the syndrome
+    table if it has at most 2^`MAX_TABLE_SYNDROME_BITS` entries). It is used to generate the
+    registry; `get()` returns the same code from the precomputed data.
+
+    :param name: The name of the code (see `names()`).
+    :return: The code, with d and the syndrome table already computed.
+
+    >>> golay = build("golay_24_12")
+    >>> golay.n, golay.k, golay.d, len(golay.syndrome_table())
+    (24, 12, 8, 2324)
+    """
+    if name not in DEFINITIONS:
+        raise KeyError(f"Unknown standard code {name!r} (see StandardCodes.names())")
+    code = DEFINITIONS[name]()
+    # Amb k petita, d surt de la distribució de pesos (vegeu `LinearCode.code_parameters`)
+    code.d = code.code_parameters.d if code.k <= 16 else code.d
+    if code.n - code.k <= MAX_TABLE_SYNDROME_BITS:
+        code.syndrome_table()
+    return code
+
+def get(name: str) -> LinearCode:
+    """
+    Returns a standard code of the registry, built from the precomputed data (packed G and H,
+    d and the syndrome table) without any linear algebra. The data of each code is only
+    read the first time it is requested; every call returns a new `LinearCode`.
+
+    :param name: The name of the code (see `names()`), "family_n_k".
+    :return: The code.
+
+    >>> golay = get("golay_23_12")
+    >>> golay.n, golay.k, golay.d, golay._leaders is not None
+    (23, 12, 7, True)
+    >>> golay.decodify_correct(golay.codify("101100111000")[:-3] + "010")
+    '101100111000'
+    >>> get("reed_muller_32_6").d
+    16
+    """
+    if name not in _loaded:
+        # Importació aquí: les dades només es carreguen quan es demana el primer codi
+        import StandardCodesData
+        if name not in StandardCodesData.CODES:
+            raise KeyError(f"Unknown standard code {name!r} (see StandardCodes.names())")
+        n, k, d, g_rows, h_rows, table = StandardCodesData.CODES[name]
+        leaders = None
+        if table is not None:
+            # Taula densa: un líder per síndrome (little-endian), amb 0 si la síndrome no té líder
+            dense = array(_typecode(n))
+            dense.frombytes(bytes.fromhex(table))
+            if sys.byteorder == "big":
+                dense.byteswap()
+            leaders = {syndrome: leader for syndrome, leader in enumerate(dense) if leader}
+        _loaded[name] = (n, k, d, g_rows, h_rows, leaders)
+
+    n, k, d, g_rows, h_rows, leaders = _loaded[name]
+    code = LinearCode(G=BitMatrix(list(g_rows), n), H=BitMatrix(list(h_rows), n), n=n, k=k, M=2**k, d=d)
+    if leaders is not None:
+        code._leaders = {False: dict(leaders)}
+    return code
+
+def generate(path: str = None):
+    """
+    Builds every standard code (see `build()`) and writes their data in the registry module.
+
+    :param path: File of the module (by default, StandardCodesData.py next to this one).
+    """
+    path = path or os.path.join(os.path.dirname(os.path.abspath(__file__)), DATA_MODULE + ".py")
+    lines = ["# Generat amb `python StandardCodes.py` (vegeu `StandardCodes.generate()`): no s'ha d'editar.",
+             "",
+             "# Nom: (n, k, d, files de G, files de H, taula de síndromes en hexadecimal o None)",
+             "CODES = {"]
+    for name in names():
+        code = build(name)
+        n, k = code.n, code.k
+        table = None
+        if n - k <= MAX_TABLE_SYNDROME_BITS:
+            dense = array(_typecode(n), bytes(2**(n - k) * array(_typecode(n)).itemsize))
+            for syndrome, leader in code.syndrome_table().items():
+                dense[syndrome] = leader
+            if sys.byteorder == "big":
+                dense.byteswap()
+            table = dense.tobytes().hex()
+        lines.append(f"    {name!r}: ({n}, {k}, {code.d},")
+        lines.append(f"        {_literal(code.G.pack_rows())},")
+        lines.append(f"        {_literal(code.H.pack_rows())},")
+        if table is None:
+            lines.append("        None),")
+        else:
+            lines.append("        (" + "\n         ".join(repr(table[i:i + 96]) for i in range(0, len(table), 96)) + ")),")
+    lines.append("}")
+    with open(path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+def _typecode(n: int) -> str:
+    """
+    Returns the `array` type of the entries of a syndrome table of a code of length n.
+
+    >>> _typecode(7), _typecode(24), _typecode(64)
+    ('B', 'I', 'Q')
+    """
+    return next(code for bits, code in _TYPECODES if n <= bits)
+
+def _literal(rows: list[int]) -> str:
+    """
+    Returns the source of a tuple of packed rows, in hexadecimal.
+
+    >>> _literal([5, 3]), _literal([7])
+    ('(0x5, 0x3)', '(0x7,)')
+    """
+    return "(" + ", ".join(map(hex, rows)) + ("," if len(rows) == 1 else "") + ")"
+
+if __name__ == "__main__":
+    generate()
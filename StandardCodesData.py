@@ -0,0 +1,818 @@
+# Generat amb `python StandardCodes.py` (vegeu `StandardCodes.generate()`): no s'ha d'editar.
+
+# Nom: (n, k, d, files de G, files de H, taula de síndromes en hexadecimal o None)
+CODES = {
+    'hamming_7_4': (7, 4, 3,
+        (0x4b, 0x2a, 0x19, 0x7),
+        (0x78, 0x66, 0x55),
+        ('0001020408102040')),
+    'extended_hamming_8_4': (8, 4, 4,
+        (0x96, 0x55, 0x33, 0xf),
+        (0xf0, 0xcc, 0xaa, 0xff),
+        ('00010002000400080010002000400080')),
+    'simplex_7_3': (7, 3, 4,
+        (0x78, 0x66, 0x55),
+        (0x4b, 0x2a, 0x19, 0x7),
+        ('00041000200000004000000100020800')),
+    'hamming_15_11': (15, 11, 3,
+        (0x408b, 0x208a, 0x1089, 0x888, 0x483, 0x282, 0x181, 0x4b, 0x2a, 0x19, 0x7),
+        (0x7f80, 0x7878, 0x6666, 0x5555),
+        ('0000010002000400080010002000400080000001000200040008001000200040')),
+    'extended_hamming_16_11': (16, 11, 4,
+        (0x8117, 0x4114, 0x2112, 0x1111, 0x906, 0x505, 0x303, 0x96, 0x55, 0x33, 0xf),
+        (0xff00, 0xf0f0, 0xcccc, 0xaaaa, 0xffff),
+        ('000001000000020000000400000008000000100000002000000040000000800000000001000000020000000400000008'
+         '00000010000000200000004000000080')),
+    'simplex_15_4': (15, 4, 8,
+        (0x7f80, 0x7878, 0x6666, 0x5555),
+        (0x408b, 0x208a, 0x1089, 0x888, 0x483, 0x282, 0x181, 0x4b, 0x2a, 0x19, 0x7),
+        ('000004001000140020002400300034004000440050005400600064007000000000010401100114012001240130010000'
+         '400144015001000060010000000000000002040210021402200224023002000040024402500200006002000000000000'
+         '000304031003000020030000000000004003000000000000000000008804000000040404100414042004240430040000'
+         '400444045004000060040000000000000005040510050000200500000000000040050000000001500000000088020000'
+         '0006040610060000200600000000000040060000000000000000026088010000000700000000000000000000c8000000'
+         '00000000a80000009800000088008c000008040810081408200824083008000040084408500800006008000000000000'
+         '0009040910090000200900000000000040090000000000000000821000000000000a040a100a0000200a000000000000'
+         '400a0000000081200000000000000000000b000000000000000000000000000000000000000000000000000000000000'
+         '000c040c100c0000200c000000000000400c0000000000000000000000000000000d0000000000000000092000000000'
+         '00000000000000000000000000000000000e000000000a10000000000000000000000000000000000000000000000000'
+         '000000000000000000000000000000000000000000000000000000008808000000100410101014102010241030100000'
+         '401044105010000060100000000000000011041110110000201100000000000040110000000001440000820800000000'
+         '001204121012000020120000000000004012000000000000000000000000000000130000000000000000000003200000'
+         '000000000000000000000000000000000014041410140000201400000000000040140000000001410000000000000000'
+         '00150000000041400000000000000000000011400540014000000000000021400016000000000a080000000000000000'
+         '000000000000000000000000000000000000000000000000000000000000000000000000000001420000000088100000'
+         '001804181018000020180000000000004018000000000000000082010860000000190000000000000000c20000000000'
+         '0000a200000000008600820000009200001a000000000a04000000000000000000000000000000000000000000000000'
+         '0000000000000000000000000000000000000000000000000000820200000000001c000000000a020000000000000000'
+         '000000000000000000000000000000000000000000000000000000000000000000000000000001480000820400000000'
+         '00001a000e000a000000000000002a000000000000004a0000000000000000008060000000000a010000000000000000'
+         '000000000000000000000000000000000020042010201420202024203020000040204420502000006020000000000000'
+         '002104211021000020210000000000004021000000000000000000000000000000220422102200002022000000000000'
+         '402200000000810800000244000000000023000000000000000000000310000000000000000000000000000000000000'
+         '002404241024000020240000000000004024000000000000000002420000000000250000000000000000090800000000'
+         '000000000000000000000000000000000026000000000000000042400000000000002240000000000640024000001240'
+         '000000000000000000000000000000000000000000000000000002418820000000280428102800002028000000000000'
+         '402800000000810200000000085000000029000000000000000009040000000000000000000000000000000000000000'
+         '002a00000000c10000000000000000000000910085008100000000000000a10000000000000000000000000000000000'
+         '00000000000081010000000000000000002c000000000000000009010000000000000000000000000000000000000000'
+         '00002900000000000d000900000019000000000000000000000049000000000000000000000000000000000000000000'
+         '000000000000810400000248000000008050000000000000000009020000000000000000000000000000000000000000'
+         '003004301030000020300000000000004030000000000000000000000848000000310000000000000000000003020000'
+         '000000000000000000000000000000000032000000000000000000000301000000000000000000000000000000000000'
+         '000000002300000013000000030007000000000000000000000000004300000000340000000000000000000000000000'
+         '000000000000000000000000000000000000000000000000000000000000000000000000000001600000000000000000'
+         '000000000000000000000000000000000000000000000000000002500000000080480000000000000000000003040000'
+         '000000000000000000000000000000000038000000000000000000004840000000000000284000001840000008400c40'
+         '000000000000000000000000000000000000000000000000000082200841000000000000000000000000000000000000'
+         '000000000000811000000000084200008044000000000000000000000308000000000000000000000000000000000000'
+         '000000000000000000000000000000000000000000000000000000000844000080420000000000000000091000000000'
+         '000000000000000000000000000000008041000000000a20000000000000000000000000000000000000000000000000'
+         '8040844090400000a040000000000000c040000000000000000000000000000000400440104014402040244030400000'
+         '404044405040000060400000000000000041044110410000204100000000000040410000000001140000000000000000'
+         '004204421042000020420000000000004042000000000000000002240000000000430000000000000000000000000000'
+         '000000000000000000000000000000000044044410440000204400000000000040440000000001110000022200000000'
+         '004500000000411000000000000000000000111005100110000000000000211000460000000000000000422000000000'
+         '000022200000000006200220000012200000000000000000000000000000000000000000000001120000022188400000'
+         '004804481048000020480000000000004048000000000000000000000830000000490000000000000000000000000000'
+         '00000000000000000000000000000000004a000000000000000000000000000000000000000000000000000000000000'
+         '000000000000000000000000000000000b000000000000000000000000000000004c0000000000000000000083000000'
+         '000000000000000000000000000000000000000000000000000000000000000000000000000001180000000000000000'
+         '000000000000000000000000000000000000000000000000000002280000000080300000000000000000000000000000'
+         '000000000000000000000000000000000050045010500000205000000000000040500000000001050000000008280000'
+         '005100000000410400000000000000000000110405040104000000000000210400520000000000000000890000000000'
+         '000000000000000000000000000000000000000000000000000000000000000000000000000001060000000000000000'
+         '005400000000410100000000000000000000110105010101000000000000210100005100450041000000000000006100'
+         '150011000500010000003100250021000000000000000000000000000000000000000000000001030000023000000000'
+         '802800000000410200000000000000000000110205020102000000000000210200580000000000000000000048200000'
+         '00000000282000001820000008200c2000000000000000000000000000000000000000000000010c0000824008210000'
+         '000000000000000000000000000000000000000000000000000000000822000080240000000000000000000000000000'
+         '000000000000000000000000000000000000000000000000000000000000000000000000000001090000000008240000'
+         '80220000000041080000000000000000000011080508010800000000000021088021000000000a400000000000000000'
+         '000000000000000000000000000000008020842090200000a020000000000000c02000000000010a0000000000000000'
+         '00600460106000002060000000000000406000000000000000000206081800000061000000008a000000000000000000'
+         '000000000000000000000000000000000062000000000000000042040000000000002204000000000604020400001204'
+         '000000000000000000000000000000000000000000000000000002050000000000640000000000000000420200000000'
+         '000022020000000006020202000012020000000000000000000000000000000000000000000001300000020300000000'
+         '000062000000000046004200000052002600220000003200060002001600120080180000000000000000420100000000'
+         '000022010000000006010201000012010068000000000000000000004810000000000000281000001810000008100c10'
+         '000000000000000000000000000000000000000000000000000000000811000000000000000000000000000000000000'
+         '00000000000081400000020c081200008014000000000000000000000000000000000000000000000000000000000000'
+         '0000000000000000000000000000000000000000000000000000020a0814000080120000000000000000094000000000'
+         '000000000000000000000000000000008011000000000000000042080000000000002208000000000608020800001208'
+         '8010841090100000a010000000000000c010000000000000000002090000000000700000000000000000000048080000'
+         '00000000280800001808000008080c080000000000000000000000000000000000000000000001240000000008090000'
+         '00000000000000000000000000000000000000000000000000000214080a0000800c0000000000000000000003400000'
+         '0000000000000000000000000000000000000000000000000000000000000000000000000000012100000212080c0000'
+         '800a00000000412000000000000000000000112005200120000000000000212080090000000000000000421000000000'
+         '000022100000000006100210000012108008840890080000a008000000000000c0080000000001220000021100000000'
+         '00000000680000005800000048004c003800000028002c0018001c0008000c0080060000000000000000000048010000'
+         '00000000280100001801000008010c018005000000000000000000004802000000000000280200001802000008020c02'
+         '8004840490040000a004000000000000c004000000000000000000000803000080030000000000000000000048040000'
+         '00000000280400001804000008040c048002840290020000a002000000000000c0020000000001280000000008050000'
+         '8001840190010000a001000000000000c00100000000000000000218080600008000840090009400a000a400b0000000'
+         'c000c400d0000000e000000000000000')),
+    'hamming_31_26': (31, 26, 3,
+        (0x4000808b, 0x2000808a, 0x10008089, 0x8008088, 0x4008083, 0x2008082, 0x1008081, 0x808080, 0x40800b, 0x20800a, 0x108009, 0x88008, 0x48003, 0x28002, 0x18001, 0x408b, 0x208a, 0x1089, 0x888, 0x483, 0x282, 0x181, 0x4b, 0x2a, 0x19, 0x7),
+        (0x7fff8000, 0x7f807f80, 0x78787878, 0x66666666, 0x55555555),
+        ('000000000100000002000000040000000800000010000000200000004000000080000000000100000002000000040000'
+         '000800000010000000200000004000000080000000000100000002000000040000000800000010000000200000004000'
+         '0000800000000001000000020000000400000008000000100000002000000040')),
+    'extended_hamming_32_26': (32, 26, 4,
+        (0x80010116, 0x40010115, 0x20010113, 0x10010110, 0x8010107, 0x4010104, 0x2010102, 0x1010101, 0x810017, 0x410014, 0x210012, 0x110011, 0x90006, 0x50005, 0x30003, 0x8117, 0x4114, 0x2112, 0x1111, 0x906, 0x505, 0x303, 0x96, 0x55, 0x33, 0xf),
+        (0xffff0000, 0xff00ff00, 0xf0f0f0f0, 0xcccccccc, 0xaaaaaaaa, 0xffffffff),
+        ('000000000100000000000000020000000000000004000000000000000800000000000000100000000000000020000000'
+         '000000004000000000000000800000000000000000010000000000000002000000000000000400000000000000080000'
+         '000000000010000000000000002000000000000000400000000000000080000000000000000001000000000000000200'
+         '000000000000040000000000000008000000000000001000000000000000200000000000000040000000000000008000'
+         '000000000000000100000000000000020000000000000004000000000000000800000000000000100000000000000020'
+         '00000000000000400000000000000080')),
+    'simplex_31_5': (31, 5, 16,
+        (0x7fff8000, 0x7f807f80, 0x78787878, 0x66666666, 0x55555555),
+        (0x4000808b, 0x2000808a, 0x10008089, 0x8008088, 0x4008083, 0x2008082, 0x1008081, 0x808080, 0x40800b, 0x20800a, 0x108009, 0x88008, 0x48003, 0x28002, 0x18001, 0x408b, 0x208a, 0x1089, 0x888, 0x483, 0x282, 0x181, 0x4b, 0x2a, 0x19, 0x7),
+        None),
+    'hamming_63_57': (63, 57, 3,
+        (0x400000008000808b, 0x200000008000808a, 0x1000000080008089, 0x800000080008088, 0x400000080008083, 0x200000080008082, 0x100000080008081, 0x80000080008080, 0x4000008000800b, 0x2000008000800a, 0x10000080008009, 0x8000080008008, 0x4000080008003, 0x2000080008002, 0x1000080008001, 0x800080008000, 0x40008000008b, 0x20008000008a, 0x100080000089, 0x80080000088, 0x40080000083, 0x20080000082, 0x10080000081, 0x8080000080, 0x408000000b, 0x208000000a, 0x1080000009, 0x880000008, 0x480000003, 0x280000002, 0x180000001, 0x4000808b, 0x2000808a, 0x10008089, 0x8008088, 0x4008083, 0x2008082, 0x1008081, 0x808080, 0x40800b, 0x20800a, 0x108009, 0x88008, 0x48003, 0x28002, 0x18001, 0x408b, 0x208a, 0x1089, 0x888, 0x483, 0x282, 0x181, 0x4b, 0x2a, 0x19, 0x7),
+        (0x7fffffff80000000, 0x7fff80007fff8000, 0x7f807f807f807f80, 0x7878787878787878, 0x6666666666666666, 0x5555555555555555),
+        ('000000000000000001000000000000000200000000000000040000000000000008000000000000001000000000000000'
+         '200000000000000040000000000000008000000000000000000100000000000000020000000000000004000000000000'
+         '000800000000000000100000000000000020000000000000004000000000000000800000000000000000010000000000'
+         '000002000000000000000400000000000000080000000000000010000000000000002000000000000000400000000000'
+         '000080000000000000000001000000000000000200000000000000040000000000000008000000000000001000000000'
+         '000000200000000000000040000000000000008000000000000000000100000000000000020000000000000004000000'
+         '000000000800000000000000100000000000000020000000000000004000000000000000800000000000000000010000'
+         '000000000002000000000000000400000000000000080000000000000010000000000000002000000000000000400000'
+         '000000000080000000000000000001000000000000000200000000000000040000000000000008000000000000001000'
+         '000000000000200000000000000040000000000000008000000000000000000100000000000000020000000000000004'
+         '0000000000000008000000000000001000000000000000200000000000000040')),
+    'extended_hamming_64_57': (64, 57, 4,
+        (0x8000000100010117, 0x4000000100010114, 0x2000000100010112, 0x1000000100010111, 0x800000100010106, 0x400000100010105, 0x200000100010103, 0x100000100010100, 0x80000100010016, 0x40000100010015, 0x20000100010013, 0x10000100010010, 0x8000100010007, 0x4000100010004, 0x2000100010002, 0x1000100010001, 0x800100000116, 0x400100000115, 0x200100000113, 0x100100000110, 0x80100000107, 0x40100000104, 0x20100000102, 0x10100000101, 0x8100000017, 0x4100000014, 0x2100000012, 0x1100000011, 0x900000006, 0x500000005, 0x300000003, 0x80010116, 0x40010115, 0x20010113, 0x10010110, 0x8010107, 0x4010104, 0x2010102, 0x1010101, 0x810017, 0x410014, 0x210012, 0x110011, 0x90006, 0x50005, 0x30003, 0x8117, 0x4114, 0x2112, 0x1111, 0x906, 0x505, 0x303, 0x96, 0x55, 0x33, 0xf),
+        (0xffffffff00000000, 0xffff0000ffff0000, 0xff00ff00ff00ff00, 0xf0f0f0f0f0f0f0f0, 0xcccccccccccccccc, 0xaaaaaaaaaaaaaaaa, 0xffffffffffffffff),
+        ('000000000000000001000000000000000000000000000000020000000000000000000000000000000400000000000000'
+         '000000000000000008000000000000000000000000000000100000000000000000000000000000002000000000000000'
+         '000000000000000040000000000000000000000000000000800000000000000000000000000000000001000000000000'
+         '000000000000000000020000000000000000000000000000000400000000000000000000000000000008000000000000'
+         '000000000000000000100000000000000000000000000000002000000000000000000000000000000040000000000000'
+         '000000000000000000800000000000000000000000000000000001000000000000000000000000000000020000000000'
+         '000000000000000000000400000000000000000000000000000008000000000000000000000000000000100000000000'
+         '000000000000000000002000000000000000000000000000000040000000000000000000000000000000800000000000'
+         '000000000000000000000001000000000000000000000000000000020000000000000000000000000000000400000000'
+         '000000000000000000000008000000000000000000000000000000100000000000000000000000000000002000000000'
+         '000000000000000000000040000000000000000000000000000000800000000000000000000000000000000001000000'
+         '000000000000000000000000020000000000000000000000000000000400000000000000000000000000000008000000'
+         '000000000000000000000000100000000000000000000000000000002000000000000000000000000000000040000000'
+         '000000000000000000000000800000000000000000000000000000000001000000000000000000000000000000020000'
+         '000000000000000000000000000400000000000000000000000000000008000000000000000000000000000000100000'
+         '000000000000000000000000002000000000000000000000000000000040000000000000000000000000000000800000'
+         '000000000000000000000000000001000000000000000000000000000000020000000000000000000000000000000400'
+         '000000000000000000000000000008000000000000000000000000000000100000000000000000000000000000002000'
+         '000000000000000000000000000040000000000000000000000000000000800000000000000000000000000000000001'
+         '000000000000000000000000000000020000000000000000000000000000000400000000000000000000000000000008'
+         '000000000000000000000000000000100000000000000000000000000000002000000000000000000000000000000040'
+         '00000000000000000000000000000080')),
+    'simplex_63_6': (63, 6, 32,
+        (0x7fffffff80000000, 0x7fff80007fff8000, 0x7f807f807f807f80, 0x7878787878787878, 0x6666666666666666, 0x5555555555555555),
+        (0x400000008000808b, 0x200000008000808a, 0x1000000080008089, 0x800000080008088, 0x400000080008083, 0x200000080008082, 0x100000080008081, 0x80000080008080, 0x4000008000800b, 0x2000008000800a, 0x10000080008009, 0x8000080008008, 0x4000080008003, 0x2000080008002, 0x1000080008001, 0x800080008000, 0x40008000008b, 0x20008000008a, 0x100080000089, 0x80080000088, 0x40080000083, 0x20080000082, 0x10080000081, 0x8080000080, 0x408000000b, 0x208000000a, 0x1080000009, 0x880000008, 0x480000003, 0x280000002, 0x180000001, 0x4000808b, 0x2000808a, 0x10008089, 0x8008088, 0x4008083, 0x2008082, 0x1008081, 0x808080, 0x40800b, 0x20800a, 0x108009, 0x88008, 0x48003, 0x28002, 0x18001, 0x408b, 0x208a, 0x1089, 0x888, 0x483, 0x282, 0x181, 0x4b, 0x2a, 0x19, 0x7),
+        None),
+    'reed_muller_8_4': (8, 4, 4,
+        (0xff, 0xf, 0x33, 0x55),
+        (0xf0, 0xcc, 0xaa, 0x69),
+        ('00010200040000081000002000408000')),
+    'reed_muller_16_5': (16, 5, 8,
+        (0xffff, 0xff, 0xf0f, 0x3333, 0x5555),
+        (0xf000, 0xcc00, 0xaa00, 0x6900, 0xc0c0, 0xa0a0, 0x6090, 0x8888, 0x4884, 0x2882, 0xe881),
+        ('00000100020003000400050006000700080009000a000b000c000d000e00000010001100120013001400150016000000'
+         '180019001a0000001c0000000000e00020002100220023002400250026000000280029002a0000002c0000000000d000'
+         '3000310032000000340000000000c800380000000000c4000000c200c100c00040004100420043004400450046000000'
+         '480049004a0000004c0000000000b0005000510052000000540000000000a800580000000000a4000000a200a100a000'
+         '60006100620000006400000000009800680000000000940000009200910090007000000000008c0000008a0089008800'
+         '0000860085008400830082008100800000010101020103010401050106010000080109010a0100000c0100000000000e'
+         '100111011201000014010000000000001801000000000000000000000000000020012101220100002401000000000000'
+         '2801000000000000000000000000000030010000000000320000000000000000000000000000000000c200000000c001'
+         '400141014201000044010000000000004801000000000000000000000000000050010000000000000000005400000000'
+         '0000000000a40000000000000000a0016001000000000000000000000098000000000068000000000000000000009001'
+         '000000000000000000000000000088010000000000008401000082018101800100020102020203020402050206020000'
+         '080209020a0200000c0200000000000d1002110212020000140200000000000018020000000000000000000000000000'
+         '200221022202000024020000000000002802000000000000000000000000000030020000000000310000000000000000'
+         '000000000000000000c100000000c0024002410242020000440200000000000048020000000000000000000000000000'
+         '5002000000000000000000a8000000000000000000580000000000000000a00260020000000000000000000000640000'
+         '000000940000000000000000000090020000000000000000000000000000880200000000000084020000820281028002'
+         '0003010302030000040300000000080c080300000000040c0000020c010c000c10030000000020300000000000000000'
+         '000000000000000020c000000000100c20030000000010300000000000000000000000000000000010c000000000200c'
+         '000002300130003008c000000000043004c000000000083000c001c002c0000040030000000080c00000000000000000'
+         '0000000000000000803000000000400c0000000000000000000000000000000000000000000000000000000000000000'
+         '0000000000000000000000000000000000000000000000000000000000000000800c0000000040300000000000000000'
+         '000000000000000040c000000000800300040104020403040404050406040000080409040a0400000c0400000000000b'
+         '100411041204000014040000000000001804000000000000000000000000000020042104220400002404000000000000'
+         '2804000000000000000000000000000030040000000000c800000000000000000000000000000000003800000000c004'
+         '400441044204000044040000000000004804000000000000000000000000000050040000000000000000005100000000'
+         '0000000000a10000000000000000a0046004000000000000000000000062000000000092000000000000000000009004'
+         '00000000000000000000000000008804000000000000840400008204810480040005010502050000040500000000080a'
+         '080500000000040a0000020a010a000a100500000000000000004050000000000000000040a00000000000000000100a'
+         '2005000000000000000080a0000000000000000080500000000000000000200a00000000000000000000000000000000'
+         '00000000000000000000000000000000400500000000000000001050000000000000000010a00000000000000000400a'
+         '0000045008a00000015000500000025002a0000000a001a00000085004a0000000000000000000000000000000000000'
+         '00000000000000000000000000000000800a00000000000000002050000000000000000020a000000000000000008005'
+         '000601060206000004060000000008090806000000000409000002090109000910060000000000000000000080900000'
+         '000080600000000000000000000010092006000000000000000000004060000000004090000000000000000000002009'
+         '000000000000000000000000000000000000000000000000000000000000000040060000000000000000000020600000'
+         '000020900000000000000000000040090000000000000000000000000000000000000000000000000000000000000000'
+         '000008900460000002600000006001600190009000000290000004900860000080090000000000000000000010600000'
+         '000010900000000000000000000080060007000000000c0800000a080908080800000608050804080308020801080008'
+         '000000000000000000000000000018080000000000001408000012081108100800000000000000000000000000002808'
+         '00000000000024080000220821082008c0080000000000340000000000000000000000000000000000c4000000003008'
+         '0000000000000000000000000000480800000000000044080000420841084008a0080000000000000000005200000000'
+         '0000000000a2000000000000000050089008000000000000000000000061000000000091000000000000000000006008'
+         '800881088208000084080000000000008808000000000000000000000000000000100110021003100410051006100000'
+         '081009100a1000000c100000000000e01010111012100000141000000000000018100000000000000000000000000000'
+         '201021102210000024100000000000002810000000000000000000000000000030100000000000230000000000000000'
+         '0000000000000000002c00000000c0104010411042100000441000000000000048100000000000000000000000000000'
+         '5010000000000000000000450000000000000000004a0000000000000000a01060100000000000000000000000890000'
+         '000000860000000000000000000090100000000000000000000000000000881000000000000084100000821081108010'
+         '001101110211000004110000000000000811000000000000000000000000000010110000000020220000404400000000'
+         '000080880000000000000000000000002011000000001022000000004088000000000000804400000000000000000000'
+         '000002220122002200000000000004220000000000000822000000000000000040110000000000000000104420880000'
+         '000000000000000080220000000000000000044400000000014400440000024400000000000000000000084400000000'
+         '000000000488000002880000008801880000000000000000000000000888000000000000000040220000204410880000'
+         '000000000000000000000000000080110012011202120000041200000000000008120000000000000000000000000000'
+         '101200000000202100000000808400000000000040480000000000000000000020120000000010210000804800000000'
+         '000040840000000000000000000000000000022101210021000000000000042100000000000008210000000000000000'
+         '401200000000000000000000000000000000208410480000802100000000000000000000084800000000000000000000'
+         '024800000048014800000000044800000000088400000000000000000000000001840084000002840000048400000000'
+         '000000000000402100000000000000000000108420480000000000000000801200130000000030200000000000000000'
+         '0000000000000000c02000000000001c0000222021202020000000000000242000000000000028200000000000000000'
+         '000012201120102000000000000014200000000000001820000000000000000003200220012000200000062005200420'
+         '00000a200920082000d0000000000c200000000000000000882000000000000084200000000000008020812082200000'
+         '0000000000006020000000460000000000000000004900009020000000000000000000000000502000000000008a0000'
+         '0000008500000000a0200000000000000000422041204020000000000000442000000000000048200000000000000000'
+         '001401140214000004140000000000000814000000000000000000000000000010140000000000000000404180820000'
+         '000000000000000020280000000000002014000000000000000000000000000000004082804100001028000000000000'
+         '000000000000000008280000000000000428000000000000002801280228000040140000000080280000104100000000'
+         '000020820000000000000000000000000000044100000000014100410000024100000000000000000000084100000000'
+         '000008820000000000000000000000000182008200000282000004820000000000000000000000000000204100000000'
+         '000010820000000040280000000080140015000000000000000050400000000000000000a0400000000000000000001a'
+         '000044400000000041404040000042400000000000000000000048400000000000000000884000000000000000000000'
+         '824000008040814000000000844000000000000000000026000060400000000000000000904000000029000000000000'
+         '000014400000000011401040000012400000000000000000000018400000000005400440000006400140004003400240'
+         '00000c4000b000000940084000000a40000000000000000000003040008c000000000083c04000000000000000000000'
+         '000024400000000021402040000022400000000000000000000028400000000000160000000000000000000090800000'
+         '000060800000000000000000000000190000000084800000828000008080818000000000000000000000000088800000'
+         '0000488000000000000000000000000041804080000042800000448000000000000000000000002500000000a0800000'
+         '0000508000000000002a0000000000000000288000000000000000000000000021802080000022800000248000000000'
+         '000000000000000000000043c080000000003080004c000000000000000000000980088000000a8000000c8000700000'
+         '018000800380028005800480000006800000188000000000000000000000000011801080000012800000148000000000'
+         '000000000000000000000000000008180000000000000418000002180118001800000000000020240000404280810000'
+         '000000000000000000000000000010180000000000001024000000000000000000004081804200000000000000002018'
+         '000002240124002400000000000004240000000000000824000000000000000000000000000000000000104200000000'
+         '000020810000000080240000000040180000044200000000014200420000024200000000000000000000084200000000'
+         '000008810000000000000000000000000181008100000281000004810000000080180000000040240000204200000000'
+         '00001081000000000000000000000000')),
+    'reed_muller_32_6': (32, 6, 16,
+        (0xffffffff, 0xffff, 0xff00ff, 0xf0f0f0f, 0x33333333, 0x55555555),
+        (0xf0000000, 0xcc000000, 0xaa000000, 0x69000000, 0xc0c00000, 0xa0a00000, 0x60900000, 0x88880000, 0x48840000, 0x28820000, 0xe8810000, 0xc000c000, 0xa000a000, 0x60009000, 0x88008800, 0x48008400, 0x28008200, 0xe8008100, 0x80808080, 0x40808040, 0x20808020, 0xe0808010, 0x8808008, 0xc8808004, 0xa8808002, 0x68808001),
+        None),
+    'golay_23_12': (23, 12, 7,
+        (0x63a800, 0x31d400, 0x18ea00, 0xc7500, 0x63a80, 0x31d40, 0x18ea0, 0xc750, 0x63a8, 0x31d4, 0x18ea, 0xc75),
+        (0x527c00, 0x7b4200, 0x3da100, 0x1ed080, 0xf6840, 0x55c820, 0x789810, 0x6e3008, 0x371804, 0x49f002, 0x24f801),
+        ('000000000100000002000000030000000400000005000000060000000700000008000000090000000a0000000b000000'
+         '0c0000000d0000000e000000204002001000000011000000120000001300000014000000150000001600000000204100'
+         '18000000190000001a000000000818001c00000000032000408004008014000020000000210000002200000023000000'
+         '2400000025000000260000000840020028000000290000002a000000044002002c000000024002000140020000400200'
+         '3000000031000000320000008081000034000000400c00000010300000020c0038000000003004000006400040002100'
+         '800009000080500000290000104002004000000041000000420000004300000044000000450000004600000080002800'
+         '48000000490000004a000000002500004c0000000010110010800400000a400050000000510000005200000000120200'
+         '54000000200c00000880040000411000580000008040400004800400200021000280040000200a000080040001800400'
+         '6000000061000000620000000000540064000000100c00000003010000b0000068000000008208008018000010002100'
+         '0020600080010400000418004040020070000000040c00000060080008002100010c0000000c000080004200020c0000'
+         '0001120002002100010021000000210000520000080c0000208004000400210080000000810000008200000083000000'
+         '8400000085000000860000004000280088000000890000008a000000000205008c00000000a800000001500010140000'
+         '900000009100000092000000208100009400000000001600004a00000814000098000000404040000020220004140000'
+         '20000900021400000114000000140000a0000000a1000000a200000010810000a4000000001240000024040000081100'
+         'a800000000043000401800000020480010000900400104000082200080400200b0000000028100000181000000810000'
+         '0800090000602000400042000481000004000900000a0200004014000881000000000900010009000200090020140000'
+         'c0000000c1000000c200000004002800c4000000020028000100280000002800c8000000104040002018000000801200'
+         '00060200200104000060010008002800d000000008404000000411000028040000310000008201002000420010002800'
+         '0140400000404000000308000240400000083000044040008080040040140000e0000000002003000818000000460000'
+         '00c010000801040010004200200028000218000004010400001800000118000001010400000104000418000002010400'
+         '0002240000101800040042004081000002004200800c0000000042000100420000a40000204040001018000080002100'
+         '400009001001040008004200002210000001000001010000020100000301000004010000050100000601000000180400'
+         '08010000090100000a010000402400000c010000100220008000500000800900100100001101000012010000a0800000'
+         '140100000802200000040a00404010001801000004022000005001000000460001022000000220002028000002022000'
+         '2001000021010000220100009080000024010000002018004002010000046000280100000008410000002c0000121000'
+         '00940000c000040010280000004102003001000082800000818000008080000000404400001003000828000084800000'
+         '400012000044080004280000888000000228000020022000002800000128000040010000410100004201000008240000'
+         '440100000080420020020100104010004801000002240000012400000024000000480800a00004000010220004240000'
+         '5001000000000d0000086000044010008030000002401000014010000040100020001200009800008002080010240000'
+         '0004410040022000008104000840100060010000005020000402010000080a0002020100880004000002010001020100'
+         '100012008400040000c040002024000081000400800004000802010082000400080012000022400000140400c0800000'
+         '00802800000d000010020100204010000000120001001200020012000001210004001200900004004028000000104800'
+         '80010000810100008201000030800000840100000044010008005000002202008801000000100a000400500000482000'
+         '020050006000040000005000010050009001000022800000218000002080000040300000000848000000250024800000'
+         '000c040000201100400208002880000000c00200800220001000500000150000a0010000128000001180000010800000'
+         '000822004800040000500800148000000062000044000400000403001880000041000400400004002000500042000400'
+         '0380000002800000018000000080000000061000068000000580000004800000001060000a8000000980000008800000'
+         '0001090050000400802800000c800000c0010000000a100000400600001041001030000028000400008c000000012800'
+         '008021002400040010020800802400002100040020000400400050002200040004300000000422000802080060800000'
+         '003000000130000002300000804010000202080000414000000208000102080008300000300004000402080000080300'
+         '000448000c00040000203000508000000900040008000400800201000a00040005000400040004000019000006000400'
+         '010004000000040003000400020004000048010042800000418000004080000020300000180004000001420044800000'
+         '800012001400040020020800488000001100040010000400004420001200040000020000010200000202000003020000'
+         '0402000005020000060200000084100008020000090200000a020000800005000c020000100120000030080040084000'
+         '1002000011020000120200004010020014020000080120008048000020000c0018020000040120002004400000e00000'
+         '010120000001200000001300020120002002000021020000220200000028200024020000801040004001010010000c00'
+         '280200004080080010044000001110000008140000240100808020000042020030020000004011000804400004000c00'
+         '00a0020002000c0001000c0000000c000204400080080200000440000104400040500000200120000404400008000c00'
+         '400200004102000042020000101002004402000000600400200101000808400048020000208008000040300004084000'
+         '800402000208400001084000000840005002000002100200011002000010020000005800808001000024200004100200'
+         '002801000004140080010800081002002050000040012000008204001008400060020000088008000401010080440000'
+         '020101000000320000010100010101000180080000800800002006000280080010500000048008000801010020084000'
+         '8000240000214000008810002010020008500000000e00001001010040000c0004500000108008004004400000022100'
+         '005000000150000002500000802010008002000081020000820200000800050084020000201040001048000000210200'
+         '880200000200050001000500000005004004020000401800208020000400050090020000002408000448000000007000'
+         '024800004080010000480000014800000090100020080200400108001000050000204400800120000848000000160000'
+         'a00200000410400000001a00404400000110400000104000088020000210400000610000100802000480200020000500'
+         '028020000810400000802000018020004000240008080200003001000083000000051000101040002048000080000c00'
+         '0108020000080200800440000208020000020900040802001080200040201000c00200000009100000a0400020440000'
+         '080402001080010000101400000228000404020000302000100108004000050000040200010402000204020080084000'
+         '200024000480010008010800801002000180010000800100404800000280010002010800004240000001080001010800'
+         '100402000880010004010800202010001000240002440000014400000044000000280800401040008001010004440000'
+         '0000510080800800001a0000084400002004020000030400408020001020100000002400010024000200240010440000'
+         '040024002080010000024200082010000800240040080200200108000420100080500000022010000120100000201000'
+         '000300000103000002030000004048000403000018002000600001008020020008030000140020000088020020101000'
+         '11002000100020000044040012002000100300000c00200000201400000c01000900200008002000009040000a002000'
+         '0500200004002000c0000800060020000100200000002000030020000200200020030000000406004400010008101000'
+         '4200010000c8000040000100410001008060000002101000011010000010100000004a00300020004800010004101000'
+         '0018080040204000004022008082000080041000280020005000010000010c0000800500240020000005400010101000'
+         '2100200020002000002a0000220020004003000080081000240001000080240022000100001408002000010021000100'
+         '0010440000400300900008000026000000a0100050002000280001000009400000c40000202040008800080000110200'
+         '000806004800200030000100004210008200080044002000800008008100080041002000400020008400080042002000'
+         '0600010010204000040001000500010002000100030001000000010001000100000c2000008108000c00010040101000'
+         '0a0001008002040008000100090001000120400000204000140001000220400012000100042040001000010011000100'
+         '0002120008204000a0000800004804000051000060002000180001000084020080030000400810000014200004200200'
+         '00800c000220020001200200002002002060000000844000500008000001050000180100900020000002500008200200'
+         '000043000050040048000800208200002004100088002000004900001020020042000800840020004000080041000800'
+         '81002000800020004400080082002000086000000000290000084400108200001004100000114000c000010020200200'
+         '00600000016000000260000080101000046000004002040000812000000c080004041000028200000182000000820000'
+         '000410000104100002041000048200001060000000090200600008000882000008041000a00020000010060000404100'
+         '010810000008100018000800020810000040600004081000a00001004020020012000800080810001000080011000800'
+         '00050200200204001400080000d000000a00080010081000080008000900080000320000008101000c00080000044400'
+         '0200080003000800000008000100080006000800c0002000040008000500080000900200200810008400010000450000'
+         '820001000802040080000100810001004060000004020400300008000000620001020400000204008800010002020400'
+         '000124008020400028000800408200004004100000400a00900001000018200022000800001401002000080021000800'
+         '008840001002040024000800002110000004000001040000020400000304000004040000050400000604000000821000'
+         '08040000090400000a040000402100000c04000000004c00000821009010000010040000110400001204000000402400'
+         '140400006008000000010a00881000001804000000800300200240008410000000601000821000008110000080100000'
+         '200400002104000022040000001009002404000050080000802004000001600028040000800030001002400000880400'
+         '0091000000220100400018000044020030040000440800000802400000201200410800004008000000c0010042080000'
+         '02024000004108000002400001024000000026004808000004024000a010000040040000410400004204000008210000'
+         '44040000300800000050400000000700480400000221000001210000002100008002020000c020002000180004210000'
+         '500400002408000080001100008048002108000020080000002220002208000000102800000214000048020010210000'
+         '000141002808000000840400c01000006004000014080000008022008042000011080000100800000800180012080000'
+         '004005000010420004001800202100000200180018080000000018000100180005080000040800000011040006080000'
+         '0108000000080000030800000208000080a000000c08000040024000000421000908000008080000100018000a080000'
+         '8004000081040000820400000008420084040000004101002020040018100000880400002000300000c0080014100000'
+         '400202001210000011100000101000009004000000220800400011000c100000008060000a1000000910000008100000'
+         '0009040006100000051000000410000003100000021000000110000000100000a0040000080030000420040040420000'
+         '0220040000800a0000200400012004000100300000003000000103000200300000484000040030000820040030100000'
+         '0050020000004500000828000085000000031000c0080000102004002810000040a00000100030008002400024100000'
+         '00040900221000002110000020100000c004000000900400100011002042000008020200002050000089000000042800'
+         '040202000008090000006400802100000002020001020200020202005010000002001100000122000000110001001100'
+         '00400c00a0080000040011004810000020a0000000444000080011004410000010020200421000004110000040100000'
+         '000148000242000001420000004200000010210090080000402004000442000010a0000040003000001c000008420000'
+         '2002020000050400800018000080410008a0000084080000200011001042000081080000800800000004420082080000'
+         '00a0000001a0000002a0000000000e0004a0000088080000004120006010000000050000010500000205000048200000'
+         '040500008040010010000a00200060000805000042200000412000004020000020900000000812000042040044200000'
+         '100500000010500004000a00000a010002000a0000a0040000000a0001000a0080080400204008000080300050200000'
+         '400041000006200008000a00801100002005000000020600004810000400600008900000020060000100600000006000'
+         '049000001040080080000300602000000090000001900000029000000800600000202100084008004010040080840000'
+         '800210004009000020000a0010006000014008000040080000034000024008001090000004400800002c000000001500'
+         '400500000a20000009200000082000000000340000120800808800000c20000003200000022000000120000000200000'
+         '1000410006200000052000000420000000c20000800022002010040018200000080041002009000040000a0000441000'
+         '040041001220000011200000102000000000410001004100020041001420000080004800008011001010040028200000'
+         '00600200100900000006010040006000000a200022200000212000002020000040900000800404000001180024200000'
+         '021004000409000000100400011004000109000000090000041004000209000000041200404008000810040030200000'
+         '2000410008090000804020000082020080050000044001000012200000001c0001400100004001004088000002400100'
+         '100804000082400020000300c02000000020280008400100000450001011000008080400400022000060400020840000'
+         '200210001040010080000a00081100000008040001080400020804000411000004080400021100000111000000110000'
+         '400048000038000008000300108400001002100020400100002104008000600002000300000130000000030001000300'
+         '809000004004040004000300000a08000402100002840000018400000084000000021000010210000202100004840000'
+         '200804008040080010000300088400000802100000204200404020002011000020004800100022000488000088200000'
+         '028800004040010000880000018800000050100082200000812000008020000000030200200404000888000084200000'
+         '010022000000220000011100020022000034000004002200108800000002440040080400080022000006080090200000'
+         '800041000080180020402000401100000000480001004800020048000043000004004800080404002088000000101200'
+         '080048000404040040000300a02000000104040000040400104020000204040010004800200022008010040040840000'
+         '4002100080090000084020000020090000a1000000120100044020000008500002402000100404000040200001402000'
+         '000600000106000002060000048010000406000002801000018010000080100008060000005800003000400000002a00'
+         'c00002002020010000410400088010001006000080200800280040000009010000100500004042004020200010801000'
+         '2200400040001400200040002100400000880800000520002400400080120000200600000001060018004000c0400000'
+         '004028000820010000180200208010001200400004200100100040001100400001200100002001001400400002200100'
+         '0a00400000902000080040000900400080011000400a00000c00400000040c0002004000030040000000400001004000'
+         '06004000102001000400400005004000400600000000610000080c00a040000088000200001108001020200040801000'
+         '84000200100014000090010000230000800002008100020082000200000c400000c10000080014000420200000140200'
+         '02202000200a000000202000012020000100140000001400600040000200140090000200040014000820200000400900'
+         '0030100082400000814000008040000000804400100a0000000501008440000000092000008408005000400088400000'
+         'a000020040200100000218000010240000000b00040a00004800400090400000010a0000000a000020202000020a0000'
+         '4200400020001400400040004100400000540000080a0000440040000081020080060000102008000011200060400000'
+         '480002000008240000004900808010004400020000814000002810000004050040000200410002004200020010120000'
+         '012008000020080000800600022008002001100004200800004c0000081200000040210008200800a000400004120000'
+         '500002000212000001120000001200000088010042400000414000004040000010011000001440000022040044400000'
+         '00100c000002300090004000484000006000020080200100008420000009080004011000202008008800400050400000'
+         '0001100001011000020110000000230082004000000c020080004000810040000801100000c004008400400020120000'
+         '0c00020022400000214000002040000008000200090002000a0002002440000004000200050002000600020028400000'
+         '000002000100020002000200030002000018400040200800000211003040000018000200008401008020200000014400'
+         '140002008000140000050800008820001000020011000200120002004012000003400000024000000140000000400000'
+         '28000200064000000540000004400000240002000a40000009400000084000002000020021000200220002000c400000'
+         '0004240012400000114000001040000040011000800a0000009008001440000000a2000000110100c000400018400000'
+         '300002000000680000080500002410000007000020000600801020001008010000284000401008000840040000811000'
+         '000019008080400004400400402200000240040010042000004004000140040040c00000020801000108010000080100'
+         'a00010000804200000020a00040801000030020004042000200140000808010001042000000420001040040002042000'
+         '010006000000060000a00800020006009000100004000600400401000002600040082000080006001001400000141000'
+         '009200000021010020400400800808008400100010000600080140002008010080001000810010008200100000700000'
+         '020140000042080000014000010140008800100020042000040140004080020010c00000041008000000520008220000'
+         '011008000010080020040100021008002008200002220000012200000022000080010200081008004040040004220000'
+         '00c0000001c0000002c000004008010004c0000010100800002120008000440008c00000000114008004080010220000'
+         '000241004004200000181000208002000808200040000600040401008041000002040100201008000004010001040100'
+         '000820000108200002082000202200000408200000405000080401001080020020c00000002440000012040000003800'
+         'c0001000000b000010040100088002001008200080100100400140000480020000200c00028002000180020000800200'
+         '021020000880400000102000011020003000100000420100041020000024020001804000008040000810200002804000'
+         '400102000480400080400400200808002400100000210800101020008008010020001000210010002200100040004400'
+         '000a0400108040004004080000401200280010008004200000a001000013000014001000800006002010200040410000'
+         '100010001100100012001000080808000064000020804000000203000408080018001000020808000108080000080800'
+         '04001000050010000600100000860000000010000100100002001000030010000c001000401001008001400000202400'
+         '08001000090010000a0010001008080000200500000c100040102000204100000801020080100800008a000010004400'
+         '040102004080400010040800802200000001020001010200020102000000310080c00000000222000804080004004400'
+         '600010000200440001004400000044000204080020100100000408000104080010010200006800000404080008004400'
+         '000248000241000001410000004100005000100000a02000800401000441000080082000101001000080140008410000'
+         '200102000006040000304000400808004400100008100100002802001041000040001000410010004200100020004400'
+         '0110010000100100200408000210010048001000041001000042200080800200')),
+    'golay_24_12': (24, 12, 8,
+        (0xc75001, 0x63a801, 0x31d401, 0x18ea01, 0xc7501, 0x63a81, 0x31d41, 0x18ea1, 0xc751, 0x63a9, 0x31d5, 0x18eb),
+        (0xa4f800, 0xf68400, 0x7b4200, 0x3da100, 0x1ed080, 0xab9040, 0xf13020, 0xdc6010, 0x6e3008, 0x93e004, 0x49f002, 0xffffff),
+        ('000000000100000003000000020000000500000004000000060000000700000009000000080000000a0000000b000000'
+         '0c0000000d000000000000000e0000001100000010000000120000001300000014000000150000000000000016000000'
+         '1800000019000000000000001a000000000000001c000000000000004080040021000000200000002200000023000000'
+         '240000002500000000000000260000002800000029000000000000002a000000000000002c0000000000000000408200'
+         '300000003100000000000000320000000000000034000000000000000010300000000000380000000000000000064000'
+         '000000008000090000000000002900004100000040000000420000004300000044000000450000000000000046000000'
+         '4800000049000000000000004a000000000000004c000000000000001080040050000000510000000000000052000000'
+         '000000005400000000000000088004000000000058000000000000000480040000000000028004000080040001800400'
+         '600000006100000000000000620000000000000064000000000000000003010000000000680000000000000080180000'
+         '000000000020600000000000000418000000000070000000000000000060080000000000000c80000000000080004200'
+         '0000000000011200000000000000a1000000000000520000000000002080040081000000800000008200000083000000'
+         '840000008500000000000000860000008800000089000000000000008a000000000000008c0000000000000000015000'
+         '90000000910000000000000092000000000000009400000000000000004a000000000000980000000000000000202200'
+         '00000000200009000000000000148000a0000000a100000000000000a200000000000000a40000000000000000240400'
+         '00000000a800000000000000401800000000000010000900000000000082200000000000b00000000000000000818000'
+         '000000000800090000000000400042000000000004000900000000000040140000000900010009000000000002000900'
+         'c0000000c100000000000000c200000000000000c4000000000000000000a80000000000c80000000000000020180000'
+         '0000000000060200000000000060010000000000d0000000000000000004110000000000003100000000000020004200'
+         '000000000040c00000000000000308000000000000083000000000008080040000000000e00000000000000008180000'
+         '0000000000c0100000000000100042000000000002180000001800000118000000000000000184000000000004180000'
+         '00000000000224000000000004004200000000000200420000004200010042000000000000a400000000000010180000'
+         '000000004000090000000000080042000101000000010000020100000301000004010000050100000000000006010000'
+         '0801000009010000000000000a010000000000000c010000000000008000500010010000110100000000000012010000'
+         '00000000140100000000000000040a0000000000180100000000000000500100000000000002a0000000000020280000'
+         '200100002101000000000000220100000000000024010000000000004002010000000000280100000000000000002c00'
+         '000000000094000000000000102800000000000030010000000000008080800000000000004044000000000008280000'
+         '000000004000120000000000042800000000000002280000002800000128000040010000410100000000000042010000'
+         '000000004401000000000000200201000000000048010000000000000024800000000000004808000000000000102200'
+         '000000005001000000000000000860000000000080300000000000000040900000000000200012000000000080020800'
+         '000000000004410000000000008104000000000060010000000000000402010000000000020201000002010001020100'
+         '00000000100012000000000000c040000000000080008400000000000802010000000000080012000000000000140400'
+         '000000000080280000000000100201000000120001001200000000000200120000000000040012000000000040280000'
+         '800100008101000000000000820100000000000084010000000000000800500000000000880100000000000004005000'
+         '000000000200500000005000010050000000000090010000000000002080800000000000403000000000000000002500'
+         '00000000000c040000000000400208000000000000c00200000000001000500000000000a00100000000000010808000'
+         '000000000008220000000000005008000000000000620000000000000004030000000000400084000000000020005000'
+         '000000000280800000808000018080000000000000061000000000000480800000000000001060000000000008808000'
+         '0000000000010900000000008028000000000000c00100000000000000400600000000001030000000000000008c0000'
+         '000000000080210000000000100208000000000020008400000000004000500000000000043000000000000008020800'
+         '003000000130000000000000023000000000000002020800000208000102080000000000083000000000000004020800'
+         '000000000004480000000000002030000000000008008400000000008002010000000000040084000000000000190000'
+         '000084000100840000000000020084000000000000480100000000004080800000000000203000000000000000014200'
+         '000000008000120000000000200208000000000010008400000000000044200001020000000200000202000003020000'
+         '040200000502000000000000060200000802000009020000000000000a020000000000000c0200000000000000300800'
+         '100200001102000000000000120200000000000014020000000000008048000000000000180200000000000020044000'
+         '000000000001a00000000000000013002002000021020000000000002202000000000000240200000000000040010100'
+         '000000002802000000000000100440000000000000081400000000008080200000000000300200000000000008044000'
+         '0000000000a002000000000000008c000000000002044000000440000104400000000000405000000000000004044000'
+         '400200004102000000000000420200000000000044020000000000002001010000000000480200000000000000403000'
+         '0000000080040200000000000008c0000000000050020000000000000010820000000000000058000000000000242000'
+         '000000000028010000000000800108000000000020500000000000000082040000000000600200000000000004010100'
+         '000000000201010000010100010101000000000000808800000000000020060000000000105000000000000008010100'
+         '000000008000240000000000008810000000000008500000000000001001010000000000045000000000000040044000'
+         '005000000150000000000000025000008002000081020000000000008202000000000000840200000000000010480000'
+         '000000008802000000000000000085000000000040040200000000002080200000000000900200000000000004480000'
+         '000000000248000000480000014800000000000000901000000000004001080000000000002044000000000008480000'
+         '00000000a00200000000000000001a00000000000010c000000000000880200000000000006100000000000004802000'
+         '000000000280200000802000018020000000000040002400000000000030010000000000000510000000000020480000'
+         '000000000008820000000000800440000000000000020900000000001080200000000000c00200000000000000a04000'
+         '000000000804020000000000001014000000000004040200000000001001080000040200010402000000000002040200'
+         '000000002000240000000000080108000000000000808100000000004048000000000000020108000001080001010800'
+         '000000001004020000000000040108000000000010002400000000000044800000000000002808000000000080010100'
+         '000000000000510000000000001a00000000000020040200000000004080200000002400010024000000000002002400'
+         '000000000400240000000000000242000000000008002400000000002001080000000000805000000000000000209000'
+         '000300000103000000000000020300000000000004030000000000006000010000000000080300000000000000880200'
+         '000000001000a000000000000044040000000000100300000000000000201400000000000800a0000000000000904000'
+         '000000000400a00000000000c00008000000a0000100a000000000000200a00000000000200300000000000044000100'
+         '00000000420001004000010041000100000000008060000000000000001090000000000000004a000000000048000100'
+         '000000000018080000000000004022000000000080041000000000005000010000000000008005000000000000054000'
+         '000000002000a00000000000002a00000000000040030000000000002400010000000000220001002000010021000100'
+         '000000000010440000000000900008000000000000a0100000000000280001000000000000c400000000000088000800'
+         '0000000000080600000000003000010000000000820008008000080081000800000000004000a0000000000084000800'
+         '000000000600010004000100050001000200010003000100010001000000010000000000000c2000000000000c000100'
+         '000000000a0001000800010009000100000000000020c000000000001400010000000000120001001000010011000100'
+         '000000000002120000000000a00008000000000000510000000000001800010000000000800300000000000000142000'
+         '0000000000800c0000000000002082000000000020600000000000005000080000000000001801000000000000025000'
+         '000000000000430000000000480008000000000020041000000000000049000000000000420008004000080041000800'
+         '000000008000a000000000004400080000000000086000000000000000084400000000001004100000000000c0000100'
+         '006000000160000000000000026000000000000004600000000000000081200000000000040410000000000000828000'
+         '000410000104100000000000020410000000000010600000000000006000080000000000080410000000000000100600'
+         '00000000000890000000000018000800000000000040600000000000a000010000000000120008001000080011000800'
+         '00000000000502000000000014000800000000000a00080008000800090008000000000000320000000000000c000800'
+         '020008000300080001000800000008000000000006000800040008000500080000000000009002000000000084000100'
+         '000000008200010080000100810001000000000040600000000000003000080000000000000284000000000088000100'
+         '000000000001240000000000280008000000000040041000000000009000010000000000220008002000080021000800'
+         '000000000088400000000000240008000104000000040000020400000304000004040000050400000000000006040000'
+         '0804000009040000000000000a040000000000000c040000000000000008210010040000110400000000000012040000'
+         '00000000140400000000000000010a000000000018040000000000002002400000000000006010000000000080108000'
+         '200400002104000000000000220400000000000024040000000000008020040000000000280400000000000010024000'
+         '000000000091000000000000400018000000000030040000000000000802400000000000400880000000000000c00100'
+         '000000000202400000024000010240000000000000002600000000000402400040040000410400000000000042040000'
+         '000000004404000000000000005040000000000048040000000000000021800000000000800202000000000020001800'
+         '000000005004000000000000800011000000000020088000000000000022200000000000001028000000000000480200'
+         '000000000001410000000000008404000000000060040000000000000080220000000000100880000000000008001800'
+         '000000000040050000000000040018000000000002001800000018000100180000000000040880000000000000110400'
+         '000880000108800000000000020880000000000080a00000000000004002400000000000080880000000000010001800'
+         '800400008104000000000000820400000000000084040000000000002020040000000000880400000000000000c00800'
+         '000000004002020000000000101080000000000090040000000000004000110000000000008060000000000008108000'
+         '000000000009040000000000041080000000000002108000001080000110800000000000a00400000000000004200400'
+         '00000000022004000020040001200400000000000000b000000000000001030000000000004840000000000008200400'
+         '00000000005002000000000000082800000000000003100000000000102004000000000040a000000000000080024000'
+         '0000000000040900000000002010800000000000c0040000000000001000110000000000080202000000000000890000'
+         '000000000402020000000000000064000002020001020200000000000202020000000000020011000000110001001100'
+         '0000000000400c0000000000040011000000000020a00000000000000800110000000000100202000000000040108000'
+         '00000000000148000000000000428000000000000010210000000000402004000000000010a0000000000000001c0000'
+         '000000002002020000000000800018000000000008a00000000000002000110000000000800880000000000000044200'
+         '00a0000001a000000000000002a000000000000004a00000000000000041200000050000010500000000000002050000'
+         '00000000040500000000000010000a000000000008050000000000004020800000000000209000000000000000420400'
+         '00000000100500000000000004000a000000000002000a0000000a0001000a0000000000800804000000000000803000'
+         '00000000400041000000000008000a00000000002005000000000000004810000000000008900000000000000000e000'
+         '000000000490000000000000800003000090000001900000000000000290000000000000002021000000000040100400'
+         '00000000800210000000000020000a0000000000004088000000000000034000000000001090000000000000002c0000'
+         '000000004005000000000000082080000000000000003400000000008088000000000000022080000020800001208000'
+         '000000001000410000000000042080000000000000c20000000000002010040000000000080041000000000040000a00'
+         '000000000400410000000000102080000000410001004100000000000200410000000000800048000000000010100400'
+         '0000000000600200000000000006010000000000000a2000000000002020800000000000409000000000000000011800'
+         '000000000210040000100400011004000000000000098000000000000410040000000000000412000000000008100400'
+         '000000002000410000000000804020000000000080050000000000000012200000000000004081000000000040880000'
+         '000000001008040000000000200003000000000000202800000000000004500000000000080804000000000000604000'
+         '00000000200210000000000080000a000008040001080400000000000208040000000000040804000000000000118000'
+         '000000004000480000000000080003000000000010021000000000000021040000000000020003000000030001000300'
+         '000000008090000000000000040003000000000004021000000000000084800000021000010210000000000002021000'
+         '000000002008040000000000100003000000000008021000000000004040200000000000200048000000000004880000'
+         '000000000288000000880000018800000000000000501000000000008020800000000000000302000000000008880000'
+         '000000000000a20000000000000111000000000000340000000000001088000000000000400804000000000000060800'
+         '000000008000410000000000204020000000480001004800000000000200480000000000040048000000000020880000'
+         '000000000800480000000000400003000000000000048400000000001040200000000000100048000000000080100400'
+         '000000004002100000000000084020000000000000a10000000000000440200000000000024020000040200001402000'
+         '000600000106000000000000020600000000000004060000000000000080900000000000080600000000000030004000'
+         '00000000c000020000000000004104000000000010060000000000002800400000000000001005000000000040202000'
+         '000000002200400020004000210040000000000000880800000000002400400000000000200600000000000018004000'
+         '000000000040280000000000001802000000000012004000100040001100400000000000002081000000000014004000'
+         '000000000a00400008004000090040000000000080011000000000000c00400002004000030040000100400000004000'
+         '0000000006004000040040000500400000000000400600000000000000080c0000000000880002000000000010202000'
+         '00000000840002000000000000900100800002008100020000000000820002000000000000c100000000000004202000'
+         '000000000220200000202000012020000000000000009400000000006000400000000000900002000000000008202000'
+         '000000000030100000000000804080000000000000804400000000000005010000000000000920000000000050004000'
+         '00000000a000020000000000000218000000000000000b00000000004800400000000000000a80000000000020202000'
+         '000000004200400040004000410040000000000000540000000000004400400000000000800600000000000000112000'
+         '000000004800020000000000000049000000000044000200000000000028100040000200410002000000000042000200'
+         '00000000002088000000000000800600000000002001100000000000004c0000000000000040210000000000a0004000'
+         '000000005000020000000000001280000000000000880100000000004040800000000000100110000000000000220400'
+         '0000000000100c0000000000900040000000000060000200000000000084200000000000040110000000000088004000'
+         '000110000101100000000000020110000000000082004000800040008100400000000000080110000000000084004000'
+         '000000000c00020000000000204080000800020009000200000000000a00020004000200050002000000000006000200'
+         '010002000000020002000200030002000000000000184000000000000002110000000000180002000000000080202000'
+         '000000001400020000000000000508001000020011000200000000001200020000000000024080000040800001408000'
+         '000000002800020000000000044080000000000024000200000000000840800020000200210002000000000022000200'
+         '00000000000424000000000010408000000000004001100000000000009008000000000000a2000000000000c0004000'
+         '000000003000020000000000000805000000000000070000000000008010200000000000002840000000000008400400'
+         '00000000000019000000000004400400000000000240040000400400014004000000000040c000000000000000088100'
+         '00000000a00010000000000000020a0000000000003002000000000020014000000000000004a0000000000010400400'
+         '00000000000086000000000000a008000000000090001000000000004004010000000000400820000000000010014000'
+         '000000000092000000000000204004000000000084001000000000000801400080001000810010000000000082001000'
+         '00000000020140000001400001014000000000008800100000000000040140000000000010c000000000000000005200'
+         '000000000010880000000000200401000000000020082000000000000022800000000000800102000000000040400400'
+         '00c0000001c000000000000002c000000000000004c0000000000000002120000000000008c000000000000080040800'
+         '000000000002410000000000001810000000000008082000000000000404010000000000020401000004010001040100'
+         '00082000010820000000000002082000000000000408200000000000080401000000000020c000000000000000120400'
+         '00000000c00010000000000010040100000000001008200000000000400140000000000000200c000000000000808200'
+         '0000000002102000001020000110200000000000300010000000000004102000000000000080c0000000000008102000'
+         '000000004001020000000000804004000000000024001000000000001010200020001000210010000000000022001000'
+         '00000000000a0400000000004004080000000000280010000000000000a0010000000000140010000000000020102000'
+         '100010001100100000000000120010000000000000640000000000000002030000000000180010000000000000088800'
+         '0400100005001000000000000600100001001000000010000200100003001000000000000c0010000000000080014000'
+         '0800100009001000000000000a00100000000000002005000000000040102000000000000801020000000000008a0000'
+         '00000000040102000000000010040800000102000101020000000000020102000000000080c000000000000008040800'
+         '0000000060001000000000000000c4000000000002040800000408000104080000000000100102000000000004040800'
+         '000000000002480000000000004180000000000050001000000000008004010000000000800820000000000000801400'
+         '000000002001020000000000003040000000000044001000000000000028020040001000410010000000000042001000'
+         '000000000010810000000000200408000000000048001000000000000042200001080000000800000208000003080000'
+         '040800000508000000000000060800000808000009080000000000000a080000000000000c0800000000000000042100'
+         '100800001108000000000000120800000000000014080000000000008042000000000000180800000000000000009800'
+         '000000000010420000000000202100002008000021080000000000002208000000000000240800000000000000804800'
+         '000000002808000000000000c01000000000000000021400000000001021000000000000300800000000000000000700'
+         '000000004004800000000000082100000000000000c02000000000000421000000000000022100000021000001210000'
+         '4008000041080000000000004208000000000000440800000000000000201200000000004808000000000000a0100000'
+         '0000000000410800000000000002c0000000000050080000000000000001600000000000200480000000000000100900'
+         '000000000022010000000000004402000000000080003000000000000088040000000000600800000000000088100000'
+         '000000001004800000000000004024000000000082100000801000008110000000000000008003000000000084100000'
+         '00000000040480000000000000821000000480000104800000000000020480000000000000004c000000000090100000'
+         '000000000804800000000000402100008008000081080000000000008208000000000000840800000000000010420000'
+         '000000008808000000000000601000000000000000a080000000000000000e0000000000900800000000000004420000'
+         '000000000242000000420000014200000000000000050400000000000080410000000000400030000000000008420000'
+         '00000000a008000000000000481000000000000000012200000000000000910000000000421000004010000041100000'
+         '000000000044400000000000441000000000000000205000000000000004280000000000009004000000000020420000'
+         '000000000002820000000000501000000000000000080900000000008021000000000000c00800000000000028100000'
+         '000000000000450000000000008500000000000022100000201000002110000000000000100030000000000024100000'
+         '0000000000800a0000000000002084000000000008003000000000004042000000000000040030000000000030100000'
+         '00003000010030000000000002003000000000000a10000008100000091000000000000000220800000000000c100000'
+         '021000000310000001100000001000000000000006100000041000000510000000000000004101000000000018100000'
+         '000000008004800000000000000842000000000012100000101000001110000000000000200030000000000014100000'
+         '000900000109000000000000020900000000000004090000000000000010840000000000080900000000000000820200'
+         '000000004040080000000000302000000000000010090000000000004000600000000000008011000000000028200000'
+         '000000008004040000000000242000000000000022200000202000002120000000000000200900000000000000441000'
+         '00000000800022000000000018200000000000000000c100000000001420000000000000122000001020000011200000'
+         '0000000000120800000000000c200000000000000a200000082000000920000000000000062000000420000005200000'
+         '022000000320000001200000002000000000000040090000000000001000600000000000084008000000000080840000'
+         '000000000440080000000000000015000040080001400800000000000240080000000000020060000000600001006000'
+         '000000000002060000000000040060000000000000908000000000000800600000000000104008000000000060200000'
+         '0000000000a004000000000000008a00000000000010500000000000000a010000000000000620000000000080110000'
+         '000000002040080000000000502000000000000080400100000000002000600000000000000580000000000048200000'
+         '000000000008120000000000442000000000000042200000402000004120000000000000800900000000000000200900'
+         '000000002000220000000000408400000000000010040400000000000040a00000000000001201000000000000085000'
+         '00000000080404000000000000101200000000000000c800000000000043000000040400010404000000000002040400'
+         '000000000404040000000000a02000000000000004002200000000000002440000002200010022000000000002002200'
+         '000000000080180000000000401100000000000008002200000000009020000000000000404001000000000000888000'
+         '000000001000220000000000882000000000000020040400000000008420000000000000822000008020000081200000'
+         '000000000002900000000000048400000000000002840000008400000184000000000000002042000000000020110000'
+         '000000008040080000000000088400000000000020400100000000008000600000000000003800000000000010840000'
+         '000000004004040000000000000a08000000000000013000000000000000830000000000104001000000000008110000'
+         '000000004000220000000000208400000000000002110000001100000111000000000000000884000000000004110000'
+         '0040010001400100000000000240010000000000044001000000000000001c0000000000084001000000000010110000'
+         '000000000082400000000000c0200000000a0000010a000000000000020a000000000000040a00000000000090400000'
+         '00000000080a000000000000008102000000000020001400000000004000c00000000000100a00000000000084400000'
+         '000000008240000080400000814000000000000040200100000000000010240000000000008408000000000088400000'
+         '00000000200a0000000000000020a0000000000008001400000000000014020000000000040014000000000000400900'
+         '0000140001001400000000000200140000000000001108000000000040801000000000000000610000000000a0400000'
+         '000000008000820000000000000c40000000000010001400000000000023000000000000400a00000000000000040c00'
+         '0000000000902000000000000800c0000000000010200100000000000400c000000000000200c0000000c0000100c000'
+         '00000000082001000000000020801000000000000001060000000000c040000000200100012001000000000002200100'
+         '0000000004200100000000001000c0000000000000404200000000001080100000000000802008000000000000090100'
+         '000000000005200000000000801200000000000040001400000000002000c00000000000028010000080100001801000'
+         '000000000006800000000000048010000000000020200100000000000880100000000000005800000000000000002a00'
+         '00000000800a000000000000144000000000000012400000104000001140000000000000000068000000000000241000'
+         '000000000011010000000000184000000000000006400000044000000540000002400000034000000140000000400000'
+         '0000000020008200000000000c400000000000000a400000084000000940000000000000008401000000000000014400'
+         '000000004020080000000000304000000000000010008200000000004012000000000000800014000000000000882000'
+         '000000000800820000000000244000000000000022400000204000002140000000008200010082000000000002008200'
+         '000000000400820000000000284000000000000000019000000000000000230000000000202008000000000050400000'
+         '0000000000c00400000000002012000000000000000c0200000000008000c00000000000001440000000000044400000'
+         '000000004240000040400000414000000000000080200100000000000009080000000000000230000000000048400000'
+         '000000000420080000000000081200000020080001200800000000000220080000000000021200000012000001120000'
+         '000000000820080000000000041200000000000000082400000000008080100000000000102008000000000060400000'
+         '000000004000820000000000101200000000000000814000000000000004050000000000000b00000000000008800200'
+         '000000000024400000000000000038000000000002800200008002000180020000000000801001000000000004800200'
+         '000000002010080000000000000481000000000040000600000000008041000000000000004050000000000010800200'
+         '000000000008a0000000000020220000000000001010080000000000800044000000000000c080000000000040080100'
+         '000000004004200000000000208002000000000000011400000000001022000000100800011008000000000002100800'
+         '000000000410080000000000082200000000000008100800000000000422000000000000022200000022000001220000'
+         '000000008000900000000000007000000000000010000600000000002008010000000000200420000000000040800200'
+         '0000000000420800000000000001c0000000000004000600000000000002600000000600010006000000000002000600'
+         '000000000021010000000000800808000000000008000600000000000014100000000000080420000000000004080100'
+         '000000000208010000080100010801000004200001042000000000000204200000000000040420000000000008080100'
+         '000000004010080000000000008110000000000020000600000000001008010000000000100420000000000000408400'
+         '000000008080400000000000402200000000000040009000000000002000440000000000081001000000000010410000'
+         '00000000041001000000000080800200001001000110010000000000021001000000000000a020000000000004410000'
+         '000000000241000000410000014100000000000000060400000000004008080000000000101001000000000008410000'
+         '000000000200440000004400010044000000000000022200000000000400440000000000006800000000000008004400'
+         '000000002010010000000000000488000000000080100800000000001000440000000000000c10000000000020410000'
+         '000000000001820000000000000031000000000040804000000000008022000000009000010090000000000002009000'
+         '000000000400900000000000008600000000000008009000000000001008080000000000401001000000000000202400'
+         '000000001000900000000000080808000000000080000600000000004041000000000000020808000008080001080800'
+         '000000002080400000000000040808000000000020009000000000004000440000000000002108000000000080080100'
+         '000000008004200000000000001300000000000010804000000000000040120000000000004201000000000000240200'
+         '0000000008804000000000000010a0000000000004804000000000002008080000804000018040000000000002804000'
+         '000c0000010c000000000000020c000000000000040c0000000000000800210000000000080c00000000000004002100'
+         '0000000002002100000021000100210000000000100c00000000000000b0000000000000600080000000000000005400'
+         '000000008001040000000000404002000000000000820800000000001000210000000000200c00000000000000411000'
+         '000000005000800000000000001202000000000000200a00000000000080840000000000804040000000000020002100'
+         '0000000044008000000000008000280040008000410080000000000042008000000000000010110000000000000a4000'
+         '0000000048008000000000000025000000000000400c00000000000000020c0000000000300080000000000080810000'
+         '000000000080500000000000104002000000000000300400000000004000210000000000240080000000000008400200'
+         '200080002100800000000000220080000000000002400200004002000140020000000000280080000000000004400200'
+         '000000001400800000000000002041001000800011008000000000001200800000000000000320000000000080140000'
+         '000000001800800000000000000818000400800005008000000000000600800001008000000080000200800003008000'
+         '000000000c00800000000000204002000800800009008000000000000a00800000000000800c0000000000000000c200'
+         '000000000010180000000000408100000000000010010400000000000022100000000000204040000000000080002100'
+         '000000000801040000000000200028000000000000200300000000000046000000010400010104000000000002010400'
+         '000000000401040000000000001880000000000000820100000000001000280000000000084040000000000000280400'
+         '000000000440400000000000401400000040400001404000000000000240400000000000020028000000280001002800'
+         '00000000c000800000000000040028000000000020010400000000000800280000000000104040000000000000801200'
+         '000000000060200000000000048100000000000002810000008100000181000000000000000089000000000020140000'
+         '00000000000a020000000000088100000000000000124000000000000008110000000000a00080000000000010810000'
+         '000000004001040000000000804002000000000000043000000000000020480000000000000016000000000008140000'
+         '000000009000800000000000208100000000000002140000001400000114000000000000404040000000000004140000'
+         '00000000840080000000000040002800800080008100800000000000820080000000000000a800000000000010140000'
+         '0000000088008000000000000002050000000000000d00000000000020401000000000000022400000000000c0800000'
+         '000000009000040000000000001048000000000000009200000000000001210000000000880004000000000000028100'
+         '00000000005020000000000000080a008000040081000400000000008200040000000000840004000000000020240000'
+         '000000000240100000401000014010000000000000000d00000000000440100000000000400220000000000008401000'
+         '000000000098000000000000102400000000000000804200000000001040100000000000400180000000000008240000'
+         '00000000a000040000000000042400000000000002240000002400000124000000000000001003000000000084800000'
+         '000000008280000080800000818000000000000020022000000000000028800000000000004408000000000088800000'
+         '000000000020180000000000000460000000000020018000000000009080000000000000c00004000000000000410200'
+         '0000000000084100000000000012100000000000080220000000000040401000000000001001800000000000a0800000'
+         '000220000102200000000000020220000000000004022000000000000000460000000000040180000000000000180400'
+         '000180000101800000000000020180000000000010022000000000000080090000000000080180000000000040240000'
+         '000000001800040000000000448000000000000042800000408000004180000010000400110004000000000012000400'
+         '000000001400040000000000488000000800040009000400000000000a000400000000000c0004000000000050800000'
+         '010004000000040002000400030004000400040005000400000000000600040000000000003080000000000080401000'
+         '000000000004220000000000608000000000000030000400000000000008030000000000004140000000000000028800'
+         '0000000028000400000000000001280000000000000a1000000000000010410020000400210004000000000022000400'
+         '000000002400040000000000802400000000000006800000048000000580000002800000038000000180000000800000'
+         '0000000050000400000000000c800000000000000a800000088000000980000000000000480004000000000014800000'
+         '000000001280000010800000118000004000040041000400000000004200040000000000440004000000000018800000'
+         '000000000008480000000000248000000000000022800000208000002180000000000000800220000000000000150000'
+         '000000000020110000000000288000000000000000440100000000000022020000000000800180000000000030800000'
+         '0000000060000400000000000000d0000000000000100a00000000000048200000000000000e00000000000040000c00'
+         '000000000021400000000000201002000000000000508000000000008020100000000000108008000000000000022100'
+         '000000000000320000000000000181000000000008800800000000008044000000000000048008000000000020084000'
+         '008008000180080000000000028008000000000080800100000000000410020000000000021002000010020001100200'
+         '000000004001200000000000100840000000000000041400000000000810020000000000006004000000000008084000'
+         '000000004002800000000000101002000000000002084000000840000108400000000000208008000000000004084000'
+         '0000000002000c0000000c0001000c0000000000004011000000000004000c0000000000200120000000000008000c00'
+         '0000000080080200000000000004c00000000000801040000000000010000c0000000000200280000000000000282000'
+         '000000000024010000000000004202000000000040800800000000000011100000000000080120000000000020000c00'
+         '000000001002800000000000401002000001200001012000000000000201200000000000040120000000000000e00000'
+         '000000000402800000000000008410000002800001028000000000000202800000000000100120000000000040084000'
+         '0000000008028000000000008000050000000000208001000000000008201000000000000000a4000000000010440000'
+         '000000000220100000201000012010000000000040080200000000000420100000000000401040000000000004440000'
+         '000000000244000000440000014400000000000000030400000000001020100000000000808008000000000008440000'
+         '008001000180010000000000028001000000000004800100000000008010020000000000088001000000000020201000'
+         '000000000042400000000000000188000000000010800100000000000002280000000000000910000000000020440000'
+         '000000000004820000000000800840000000000000302000000000004000050000000000101040000000000080000c00'
+         '000000000808020000000000008300000000000004080200000000004020100000080200010802000000000002080200'
+         '00104000011040000000000002104000000000000410400000000000404400000000000008104000000000000080a000'
+         '000000001008020000000000200005000000000040800100000000000048800000000000002408000000000000007000'
+         '000000008001200000000000001600000000000020080200000000001000050000000000201040000000000000210200'
+         '000000008002800000000000080005000000000000401800000000000400050000000000020005000000050001000500'
+         '000000000420400000000000100081000020400001204000000000000220400000000000600020000000000000840200'
+         '000000000820400000000000004804000000000002008100000081000100810000000000102040000000000004008100'
+         '000000008002040000000000080081000000000000810800000000004010100000000000480020000000000000421000'
+         '000000002020400000000000001102004000200041002000000000004200200000000000440020000000000080008800'
+         '000000000014080000000000200081000000000080081000000000000080240000000000500020000000000000094000'
+         '0000000000400300000000000026000000000000280020000000000000010c0000000000402040000000000080820000'
+         '20002000210020000000000022002000000000002400200000000000101010000000000000c800000000000040008100'
+         '000000000004060000000000081010000000000030002000000000000410100000000000021010000010100001101000'
+         '0800200009002000000000000a002000000000000c00200000000000000c010001002000000020000200200003002000'
+         '040020000500200000000000060020000000000018002000000000008020020000000000000380000000000000404800'
+         '10002000110020000000000012002000000000001400200000000000201010000000000000400a000000000000182000'
+         '000000008020400000000000408200000000000010020400000000000021100000000000001401000000000020008800'
+         '000000000802040000000000800081000000000020081000000000000045000000020400010204000000000002020400'
+         '000000000402040000000000000062000000000000810100000000000004440000000000100810000000000008008800'
+         '00000000c000200000000000040088000000000002008800000088000100880000000000040810000000000040200200'
+         '0008100001081000000000000208100000000000200204000000000000d0000000000000080810000000000010008800'
+         '000000000004900000000000048200000000000002820000008200000182000000000000a00020000000000000404100'
+         '000000000009020000000000088200000000000000114000000000002020020000000000000029000000000010820000'
+         '000000004002040000000000000c08000000000000608000000000008010100000000000880020000000000010200200'
+         '000000000050040000000000208200008000200081002000000000008200200000000000840020000000000040008800'
+         '000000000220020000200200012002000000000040081000000000000420020000000000900020000000000008200200'
+         '00000000008440000000000000010500')),
+    'repetition_3_1': (3, 1, 3,
+        (0x7,),
+        (0x6, 0x5),
+        ('00010204')),
+    'repetition_5_1': (5, 1, 5,
+        (0x1f,),
+        (0x18, 0x14, 0x12, 0x11),
+        ('000102030405061808090a140c121110')),
+    'repetition_7_1': (7, 1, 7,
+        (0x7f,),
+        (0x60, 0x50, 0x48, 0x44, 0x42, 0x41),
+        ('000102030405060708090a0b0c0d0e70101112131415166818191a641c626160202122232425265828292a542c525150'
+         '3031324c344a49483846454443424140')),
+    'parity_4_3': (4, 3, 2,
+        (0x9, 0x5, 0x3),
+        (0xf,),
+        ('0000')),
+    'parity_8_7': (8, 7, 2,
+        (0x81, 0x41, 0x21, 0x11, 0x9, 0x5, 0x3),
+        (0xff,),
+        ('0000')),
+    'parity_16_15': (16, 15, 2,
+        (0x8001, 0x4001, 0x2001, 0x1001, 0x801, 0x401, 0x201, 0x101, 0x81, 0x41, 0x21, 0x11, 0x9, 0x5, 0x3),
+        (0xffff,),
+        ('00000000')),
+}